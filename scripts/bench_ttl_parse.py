@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Benchmark TTL text parsing.
+
+Compares the bulk parser behind ``load_ttl_array`` with the original
+per-line ``float()`` loop, and the ``.npy`` sidecar cache hit, on a
+synthetic TTL log.
+
+Usage:
+    python scripts/bench_ttl_parse.py --pulses 3000000 --repeat 3
+"""
+
+import argparse
+from pathlib import Path
+import tempfile
+import time
+from typing import Callable, List
+
+import numpy as np
+
+from w2t_bkin.sync.ttl import _parse_ttl_lines, load_ttl_array
+
+
+def write_ttl_log(path: Path, n_pulses: int, seed: int = 0) -> None:
+    """Write a synthetic TTL log (~30 Hz with jitter), one timestamp per line."""
+    rng = np.random.default_rng(seed)
+    timestamps = np.cumsum(rng.normal(1 / 30, 1e-4, n_pulses))
+    np.savetxt(path, timestamps, fmt="%.6f")
+
+
+def best_of(func: Callable[[], np.ndarray], repeat: int) -> float:
+    """Return the fastest wall time of ``repeat`` calls in seconds."""
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pulses", type=int, default=3_000_000, help="Number of TTL pulses (default: 3,000,000, ~28 h at 30 Hz)")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions per method (best time reported)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ttl_path = Path(tmp) / "ttl.txt"
+        cache_dir = Path(tmp) / "ttl_cache"
+        write_ttl_log(ttl_path, args.pulses)
+
+        reference = _parse_ttl_lines(ttl_path)[0]
+        assert np.array_equal(load_ttl_array(ttl_path), reference)
+
+        # Prime the sidecar cache before timing hits
+        load_ttl_array(ttl_path, cache_dir=cache_dir)
+
+        results = {
+            "per-line loop": best_of(lambda: _parse_ttl_lines(ttl_path)[0], args.repeat),
+            "bulk parser": best_of(lambda: load_ttl_array(ttl_path), args.repeat),
+            "sidecar cache hit": best_of(lambda: np.asarray(load_ttl_array(ttl_path, cache_dir=cache_dir)).sum(), args.repeat),
+        }
+
+    baseline = results["per-line loop"]
+    print(f"TTL parse benchmark: {args.pulses:,} pulses, best of {args.repeat}")
+    for name, seconds in results.items():
+        print(f"  {name:<18} {seconds:8.3f} s  ({baseline / seconds:6.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
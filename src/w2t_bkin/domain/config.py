@@ -117,6 +117,7 @@ class VerificationConfig(BaseModel):
     Attributes:
         mismatch_tolerance_frames: Maximum acceptable frame/TTL count difference
         warn_on_mismatch: Emit warning when mismatch ≤ tolerance
+        frame_count_strategy: "header" | "packets" | "decode" | "auto"
 
     Requirements:
         - FR-2, FR-3: Frame/TTL verification
@@ -127,6 +128,9 @@ class VerificationConfig(BaseModel):
 
     mismatch_tolerance_frames: int = Field(..., description="Maximum acceptable frame/TTL mismatch", ge=0)
     warn_on_mismatch: bool = Field(..., description="Emit warning when mismatch is within tolerance")
+    frame_count_strategy: Literal["header", "packets", "decode", "auto"] = Field(
+        default="decode", description="Video frame counting: container header, packet count, full decode, or auto (packets, decoding when needed)"
+    )
 
 
 class BpodConfig(BaseModel):
@@ -71,6 +71,7 @@ class ManifestCamera(BaseModel):
         ttl_id: Referenced TTL channel for verification
         video_files: List of absolute paths to video files
         frame_count: Total frame count (None = not counted yet)
+        frame_count_strategies: How each video file was counted (None = not counted yet)
         ttl_pulse_count: Total TTL pulse count (None = not counted yet)
 
     Design Notes:
@@ -89,6 +90,9 @@ class ManifestCamera(BaseModel):
     ttl_id: str = Field(..., description="Referenced TTL channel ID for verification")
     video_files: List[str] = Field(..., description="List of absolute paths to discovered video files")
     frame_count: Optional[int] = Field(default=None, description="Total frame count across all videos (None = not counted yet)")
+    frame_count_strategies: Optional[List[str]] = Field(
+        default=None, description="Counting strategy per video file: 'header' | 'packets' | 'decode' | 'stub' | 'none' (None = not counted yet)"
+    )
     ttl_pulse_count: Optional[int] = Field(default=None, description="Total TTL pulse count (None = not counted yet)")
 
 
@@ -4,6 +4,7 @@ Provides low-level operations for:
 - Parsing and merging Bpod .mat files
 - Extracting trials with outcome inference
 - Extracting behavioral events
+- Looking up the trial containing event or frame timestamps
 - Creating QC summaries
 
 Example:
@@ -22,6 +23,9 @@ from .behavior import extract_behavioral_events
 # Bpod file operations
 from .bpod import index_bpod_data, merge_bpod_sessions, parse_bpod, parse_bpod_from_files, parse_bpod_mat, split_bpod_data, validate_bpod_structure, write_bpod_mat
 
+# Trial interval index
+from .intervals import TrialIntervalIndex
+
 # QC summary
 from .summary import create_event_summary, write_event_summary
 
@@ -46,6 +50,8 @@ __all__ = [
     "extract_trials",
     # Behavioral events
     "extract_behavioral_events",
+    # Trial intervals
+    "TrialIntervalIndex",
     # Summary
     "create_event_summary",
     "write_event_summary",
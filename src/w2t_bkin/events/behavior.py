@@ -5,7 +5,7 @@ and stimulus presentations.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import numpy as np
 
@@ -13,6 +13,9 @@ from ..utils import convert_matlab_struct, is_nan_or_none, sanitize_string, to_l
 from .bpod import validate_bpod_structure
 from .models import TrialEvent
 
+if TYPE_CHECKING:
+    from ..sync.drift import ClockDriftModel
+
 logger = logging.getLogger(__name__)
 
 
@@ -26,10 +29,12 @@ def extract_behavioral_events(
     trial_offsets: Optional[Dict[int, float]] = None,
     *,
     bpod_absolute: bool = True,
+    clock_model: Optional["ClockDriftModel"] = None,
 ) -> List[TrialEvent]:
     """Extract behavioral events from Bpod data.
 
     Returns events with timestamps computed as:
+    - With clock_model: clock_model.map(TrialStartTimestamp + event_rel)
     - With trial_offsets: offset + (TrialStartTimestamp + event_rel)
     - Without offsets, bpod_absolute=True: TrialStartTimestamp + event_rel
     - Without offsets, bpod_absolute=False: event_rel (trial-relative)
@@ -38,6 +43,8 @@ def extract_behavioral_events(
         bpod_data: Bpod data dictionary
         trial_offsets: Dict mapping trial_number → absolute time offset
         bpod_absolute: Use session-absolute timestamps when no offsets given
+        clock_model: Fitted Bpod → TTL clock model; maps every event in one
+                     vectorized call and takes precedence over trial_offsets
 
     Returns:
         List of TrialEvent objects
@@ -61,7 +68,10 @@ def extract_behavioral_events(
     start_timestamps = session_data["TrialStartTimestamp"]
     trial_data_list = raw_events["Trial"]
 
-    events = []
+    # (event_type, timestamp, trial_number) columns; TrialEvents are built once timestamps are final
+    event_types: List[str] = []
+    event_times: List[float] = []
+    event_trials: List[int] = []
 
     # bpod_absolute directly controls behavior when no offsets are provided
 
@@ -71,7 +81,7 @@ def extract_behavioral_events(
         # Per-trial base times
         trial_start_ts = float(to_scalar(start_timestamps, i))
         offset = None
-        if trial_offsets is not None:
+        if clock_model is None and trial_offsets is not None:
             offset = trial_offsets.get(trial_num)
             if offset is None and not bpod_absolute:
                 logger.warning(f"Trial {trial_num}: No alignment offset found; keeping trial-relative timestamps")
@@ -107,22 +117,31 @@ def extract_behavioral_events(
                     timestamp_rel = float(timestamp)
 
                     # Match extract_trials semantics:
+                    # - If clock model: Bpod session time, mapped below in one call
                     # - If offsets available: absolute TTL time = offset + (TrialStartTimestamp + event_rel)
                     # - Else: keep trial-relative time = event_rel
                     if offset is not None:
                         timestamp_abs = offset + (trial_start_ts + timestamp_rel)
-                    elif bpod_absolute:
+                    elif bpod_absolute or clock_model is not None:
                         timestamp_abs = trial_start_ts + timestamp_rel
                     else:
                         timestamp_abs = timestamp_rel
 
-                    events.append(
-                        TrialEvent(
-                            event_type=safe_event_type,
-                            timestamp=timestamp_abs,
-                            metadata={"trial_number": float(trial_num)},
-                        )
-                    )
+                    event_types.append(safe_event_type)
+                    event_times.append(timestamp_abs)
+                    event_trials.append(trial_num)
+
+    if clock_model is not None and event_times:
+        event_times = clock_model.map(event_times).tolist()
+
+    events = [
+        TrialEvent(
+            event_type=event_type,
+            timestamp=timestamp,
+            metadata={"trial_number": float(trial_num)},
+        )
+        for event_type, timestamp, trial_num in zip(event_types, event_times, event_trials)
+    ]
 
     # Ensure deterministic, monotonically increasing ordering
     events.sort(key=lambda e: e.timestamp)
@@ -0,0 +1,163 @@
+"""Sorted interval index over trial start/stop times.
+
+Answers "which trial does this timestamp fall in" for whole arrays of
+event, frame or sample timestamps with one ``np.searchsorted`` over the
+trial starts (O(log n) per timestamp instead of a scan over trials), and
+returns per-trial slice bounds into sorted signals such as pose or facemap
+traces.
+
+Trials are closed intervals ``[start_time, stop_time]``; a timestamp equal
+to one trial's stop and the next trial's start belongs to the later trial.
+
+Example:
+    >>> index = TrialIntervalIndex.from_trials(trials)
+    >>> index.trial_numbers(frame_times)  # -1 between trials
+    >>> lo, hi = index.slice_bounds(pose_times)
+    >>> pose_trial_3 = pose_values[lo[2] : hi[2]]
+"""
+
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ..exceptions import EventsError
+from .models import Trial
+
+__all__ = ["TrialIntervalIndex"]
+
+
+class TrialIntervalIndex:
+    """Non-overlapping trial intervals sorted by start time.
+
+    Example:
+        >>> index = TrialIntervalIndex([0.0, 10.0], [8.0, 18.0], trial_numbers=[1, 2])
+        >>> index.trial_numbers([1.0, 9.0, 12.0])
+        array([ 1, -1,  2])
+    """
+
+    __slots__ = ("_starts", "_stops", "_numbers")
+
+    def __init__(
+        self,
+        start_times: Union[Sequence[float], np.ndarray],
+        stop_times: Union[Sequence[float], np.ndarray],
+        trial_numbers: Optional[Union[Sequence[int], np.ndarray]] = None,
+    ):
+        """Build the index.
+
+        Args:
+            start_times: Trial start times in seconds (any order)
+            stop_times: Matching trial stop times in seconds
+            trial_numbers: Matching trial numbers (default: 1..n in the given order)
+
+        Raises:
+            EventsError: Mismatched lengths, stop before start, or overlapping trials
+        """
+        starts = np.asarray(start_times, dtype=np.float64).ravel()
+        stops = np.asarray(stop_times, dtype=np.float64).ravel()
+        numbers = np.arange(1, starts.size + 1) if trial_numbers is None else np.asarray(trial_numbers, dtype=np.int64).ravel()
+
+        if not starts.size == stops.size == numbers.size:
+            raise EventsError(f"Trial interval lengths differ: {starts.size} starts, {stops.size} stops, {numbers.size} trial numbers")
+
+        bad = np.flatnonzero(stops < starts)
+        if bad.size:
+            raise EventsError(f"Trial {numbers[bad[0]]} stops before it starts ({stops[bad[0]]} < {starts[bad[0]]})")
+
+        order = np.argsort(starts, kind="stable")
+        starts, stops, numbers = starts[order], stops[order], numbers[order]
+
+        overlap = np.flatnonzero(stops[:-1] > starts[1:])
+        if overlap.size:
+            i = overlap[0]
+            raise EventsError(f"Trials {numbers[i]} and {numbers[i + 1]} overlap ({stops[i]} > {starts[i + 1]})")
+
+        self._starts = starts
+        self._stops = stops
+        self._numbers = numbers
+
+    @classmethod
+    def from_trials(cls, trials: List[Trial]) -> "TrialIntervalIndex":
+        """Build the index from extracted Trial objects.
+
+        Args:
+            trials: Trials from extract_trials()
+
+        Returns:
+            TrialIntervalIndex keyed by Trial.trial_number
+        """
+        return cls(
+            [trial.start_time for trial in trials],
+            [trial.stop_time for trial in trials],
+            trial_numbers=[trial.trial_number for trial in trials],
+        )
+
+    @property
+    def start_times(self) -> np.ndarray:
+        """Sorted trial start times."""
+        return self._starts
+
+    @property
+    def stop_times(self) -> np.ndarray:
+        """Trial stop times in start order."""
+        return self._stops
+
+    @property
+    def numbers(self) -> np.ndarray:
+        """Trial numbers in start order."""
+        return self._numbers
+
+    def __len__(self) -> int:
+        return int(self._starts.size)
+
+    def positions(self, times: Union[float, Sequence[float], np.ndarray]) -> np.ndarray:
+        """Position (in start order) of the trial containing each timestamp.
+
+        Args:
+            times: Timestamps in seconds (any order)
+
+        Returns:
+            int64 array of positions, -1 where no trial contains the timestamp
+        """
+        t = np.atleast_1d(np.asarray(times, dtype=np.float64))
+        if len(self) == 0:
+            return np.full(t.shape, -1, dtype=np.int64)
+
+        candidate = np.searchsorted(self._starts, t, side="right") - 1
+        inside = (candidate >= 0) & (t <= self._stops[candidate.clip(0)])
+        return np.where(inside, candidate, -1)
+
+    def trial_numbers(self, times: Union[float, Sequence[float], np.ndarray]) -> np.ndarray:
+        """Trial number containing each timestamp.
+
+        Args:
+            times: Timestamps in seconds (any order)
+
+        Returns:
+            int64 array of trial numbers, -1 where no trial contains the timestamp
+        """
+        positions = self.positions(times)
+        if len(self) == 0:
+            return positions
+        return np.where(positions >= 0, self._numbers[positions.clip(0)], -1)
+
+    def slice_bounds(self, sorted_times: Union[Sequence[float], np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """Per-trial ``[lo, hi)`` index bounds into a sorted timestamp array.
+
+        Args:
+            sorted_times: Non-decreasing sample timestamps (e.g. pose frames)
+
+        Returns:
+            (lo, hi) int arrays in start order; samples of trial k are
+            ``sorted_times[lo[k]:hi[k]]``
+        """
+        t = np.asarray(sorted_times, dtype=np.float64).ravel()
+        lo = np.searchsorted(t, self._starts, side="left")
+        hi = np.searchsorted(t, self._stops, side="right")
+
+        # A sample on a shared boundary belongs to the later trial only
+        hi[:-1] = np.minimum(hi[:-1], lo[1:])
+        return lo, hi
+
+    def __repr__(self) -> str:
+        return f"TrialIntervalIndex(n_trials={len(self)})"
@@ -4,7 +4,7 @@ Provides trial extraction with outcome inference based on visited states.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import numpy as np
 
@@ -13,6 +13,9 @@ from ..utils import convert_matlab_struct, is_nan_or_none, to_scalar, validate_a
 from .bpod import validate_bpod_structure
 from .models import Trial, TrialOutcome
 
+if TYPE_CHECKING:
+    from ..sync.drift import ClockDriftModel
+
 logger = logging.getLogger(__name__)
 
 # Constants
@@ -24,15 +27,24 @@ VALID_OUTCOMES = frozenset(["hit", "miss", "correct_rejection", "false_alarm", "
 # =============================================================================
 
 
-def extract_trials(bpod_data: Dict[str, Any], trial_offsets: Optional[Dict[int, float]] = None) -> List[Trial]:
+def extract_trials(
+    bpod_data: Dict[str, Any],
+    trial_offsets: Optional[Dict[int, float]] = None,
+    *,
+    clock_model: Optional["ClockDriftModel"] = None,
+) -> List[Trial]:
     """Extract trials from Bpod data with outcome inference.
 
     Returns trials with relative timestamps by default. If trial_offsets are
-    provided, converts to absolute timestamps.
+    provided, converts to absolute timestamps. If clock_model is provided
+    (see sync.fit_bpod_clock_drift), all trial start/stop times are mapped in
+    one vectorized call, including trials without a sync event; it takes
+    precedence over trial_offsets.
 
     Args:
         bpod_data: Bpod data dictionary
         trial_offsets: Dict mapping trial_number → absolute time offset
+        clock_model: Fitted Bpod → TTL clock model (optional)
 
     Returns:
         List of Trial objects
@@ -65,6 +77,11 @@ def extract_trials(bpod_data: Dict[str, Any], trial_offsets: Optional[Dict[int,
     if trial_types_array is None:
         trial_types_array = [1] * n_trials  # Default to trial_type 1
 
+    # Map all trial bounds to the TTL timeline at once
+    if clock_model is not None:
+        mapped_starts = clock_model.map(np.asarray(start_timestamps, dtype=np.float64).ravel()[:n_trials])
+        mapped_stops = clock_model.map(np.asarray(end_timestamps, dtype=np.float64).ravel()[:n_trials])
+
     trials = []
 
     for i in range(n_trials):
@@ -74,8 +91,11 @@ def extract_trials(bpod_data: Dict[str, Any], trial_offsets: Optional[Dict[int,
             stop_time_rel = float(to_scalar(end_timestamps, i))
             trial_type = int(to_scalar(trial_types_array, i))
 
-            # Apply offset if provided (converts to absolute time)
-            if trial_offsets and trial_num in trial_offsets:
+            # Apply clock model or offset if provided (converts to absolute time)
+            if clock_model is not None:
+                start_time = float(mapped_starts[i])
+                stop_time = float(mapped_stops[i])
+            elif trial_offsets and trial_num in trial_offsets:
                 offset = trial_offsets[trial_num]
                 start_time = offset + start_time_rel
                 stop_time = offset + stop_time_rel
@@ -30,6 +30,9 @@ Main Functions:
 
 **Utilities:**
 - count_video_frames: Count frames using ffprobe
+- probe_video_frames: Count frames and record the counting strategy
+- FrameCountCache: Persistent frame counts keyed by file identity
+- SessionIndex: Persistent SQLite index of session files under raw_root
 - count_ttl_pulses: Count TTL pulses from log file
 - validate_ttl_references: Check camera TTL cross-references
 - create_verification_summary: Create JSON-serializable summary
@@ -80,17 +83,52 @@ Example:
 >>> ingest.write_verification_summary(summary, Path("verification.json"))
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing, contextmanager, nullcontext
 from datetime import datetime
+import fnmatch
+import hashlib
+import json
 import logging
+import os
 from pathlib import Path
-from typing import Dict, List, Set, Union
+import sqlite3
+import threading
+from typing import Dict, List, NamedTuple, Optional, Sequence, Set, Tuple, Union
 
 from .domain import CameraVerificationResult, Config, Manifest, ManifestCamera, ManifestTTL, Session, VerificationResult, VerificationSummary
+from .sync.ttl import count_ttl_lines
+from .utils import FRAME_COUNT_STRATEGIES, VideoAnalysisError
 from .utils import discover_files as find_files
 from .utils import run_ffprobe, write_json
 
 logger = logging.getLogger(__name__)
 
+# Frame-count cache file under paths.intermediate_root
+FRAME_COUNT_CACHE_FILENAME = "frame_counts.jsonl"
+
+# Session index database under paths.intermediate_root
+SESSION_INDEX_FILENAME = "session_index.sqlite"
+
+# Bump when the session index schema changes
+_SESSION_INDEX_VERSION = 1
+
+# Directory name prefix of session directories under paths.raw_root
+SESSION_DIR_PREFIX = "Session-"
+
+# Bytes hashed at each end of a video for the optional content check
+_CONTENT_HASH_BLOCK = 1 << 16
+
+# Frame counting modes: ffprobe strategies plus "auto" (packets, escalating to decode)
+FRAME_COUNT_MODES = (*FRAME_COUNT_STRATEGIES, "auto")
+
+# In auto mode, cameras whose mismatch is within this many frames of the
+# tolerance (or beyond it) are recounted with a full decode
+AUTO_DECODE_MARGIN_FRAMES = 2
+
+# Strategy precision order; a cached count satisfies requests up to its rank
+_STRATEGY_RANK = {strategy: rank for rank, strategy in enumerate(FRAME_COUNT_STRATEGIES)}
+
 
 class IngestError(Exception):
     """Error during ingestion."""
@@ -104,7 +142,377 @@ class VerificationError(Exception):
     pass
 
 
-def discover_files(config: Config, session: Session) -> Manifest:
+class FrameCount(NamedTuple):
+    """Frame count of one video file and how it was obtained.
+
+    Attributes:
+        frame_count: Number of frames
+        strategy: "header", "packets" or "decode" (ffprobe), "stub" (synthetic
+                  stub video) or "none" (missing or empty file)
+    """
+
+    frame_count: int
+    strategy: str
+
+
+def _head_tail_hash(path: Path, block_size: int = _CONTENT_HASH_BLOCK) -> str:
+    """SHA256 of the first and last block of a file (cheap partial-content check)."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        digest.update(f.read(block_size))
+        f.seek(max(path.stat().st_size - block_size, 0))
+        digest.update(f.read(block_size))
+    return digest.hexdigest()
+
+
+class FrameCountCache:
+    """Persistent video frame counts in a JSON-lines file.
+
+    Raw videos do not change after acquisition, so a frame count stays valid
+    while the file keeps its absolute path, size and mtime. Each count is
+    appended as one JSON line; on load the last line per path wins, and a
+    file holding superseded or unreadable (e.g. torn) lines is rewritten
+    with one line per path. Writes are thread-safe, so the cache can be
+    shared by concurrent counters; inside batch() they are buffered and
+    written with a single fsync when the batch ends.
+
+    Example:
+        >>> cache = FrameCountCache(Path(config.paths.intermediate_root) / FRAME_COUNT_CACHE_FILENAME)
+        >>> manifest = populate_manifest_counts(manifest, max_workers=8, frame_count_cache=cache)
+    """
+
+    def __init__(self, cache_path: Union[str, Path], verify_content: bool = False):
+        """Load cached counts, compacting the file if needed.
+
+        Args:
+            cache_path: JSON-lines cache file (created on first write)
+            verify_content: Also key entries by a hash of the first and last
+                            64 KiB of each video, to catch in-place edits
+                            that preserve size and mtime
+        """
+        self.cache_path = Path(cache_path)
+        self.verify_content = verify_content
+        self._entries: Dict[str, Dict] = {}
+        self._pending: List[Dict] = []
+        self._batch_depth = 0
+        self._lock = threading.Lock()
+
+        if self.cache_path.exists():
+            n_lines = 0
+            with open(self.cache_path, "r") as f:
+                for line in f:
+                    n_lines += 1
+                    try:
+                        entry = json.loads(line)
+                        self._entries[entry["path"]] = entry
+                    except (ValueError, KeyError, TypeError):
+                        continue
+
+            if n_lines > len(self._entries):
+                self._compact()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _compact(self) -> None:
+        """Rewrite the file with one line per path (atomic replace)."""
+        tmp_path = self.cache_path.with_name(f"{self.cache_path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, "w") as f:
+                f.writelines(json.dumps(entry) + "\n" for entry in self._entries.values())
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.cache_path)
+            logger.debug(f"Compacted frame-count cache {self.cache_path} to {len(self._entries)} entries")
+        except OSError as e:
+            tmp_path.unlink(missing_ok=True)
+            logger.warning(f"Failed to compact frame-count cache {self.cache_path}: {e}")
+
+    def _identity(self, video_path: Path) -> Dict:
+        stat = video_path.stat()
+        identity = {"path": str(video_path.resolve()), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        if self.verify_content:
+            identity["content_hash"] = _head_tail_hash(video_path)
+        return identity
+
+    def lookup(self, video_path: Path) -> Optional[FrameCount]:
+        """Cached frame count and its strategy, or None if missing or the file changed."""
+        identity = self._identity(video_path)
+        entry = self._entries.get(identity["path"])
+        if entry is None or any(entry.get(key) != value for key, value in identity.items()):
+            return None
+        return FrameCount(int(entry["frame_count"]), entry.get("strategy", "decode"))
+
+    def get(self, video_path: Path) -> Optional[int]:
+        """Cached frame count, or None if missing or the file changed."""
+        cached = self.lookup(video_path)
+        return cached.frame_count if cached is not None else None
+
+    def put(self, video_path: Path, frame_count: int, strategy: str = "decode") -> None:
+        """Record a frame count (appended now, or when the current batch ends)."""
+        entry = {**self._identity(video_path), "frame_count": int(frame_count), "strategy": strategy}
+        with self._lock:
+            self._entries[entry["path"]] = entry
+            self._pending.append(entry)
+            if not self._batch_depth:
+                self._flush_pending()
+
+    @contextmanager
+    def batch(self):
+        """Buffer puts and append them with one write and fsync on exit (also on errors).
+
+        Example:
+            >>> with cache.batch():
+            ...     counts = [count_video_frames(path, cache=cache) for path in segments]
+        """
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if not self._batch_depth:
+                    self._flush_pending()
+
+    def _flush_pending(self) -> None:
+        """Append buffered entries (caller holds the lock)."""
+        if not self._pending:
+            return
+
+        lines = "".join(json.dumps(entry) + "\n" for entry in self._pending)
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.cache_path, "a+b") as f:
+            # Start on a fresh line after a torn (unterminated) last line
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    lines = "\n" + lines
+            f.write(lines.encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+        self._pending.clear()
+
+
+_SESSION_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS dirs (path TEXT PRIMARY KEY, parent TEXT, mtime_ns INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    dir TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS dirs_parent ON dirs (parent);
+CREATE INDEX IF NOT EXISTS files_dir ON files (dir);
+CREATE INDEX IF NOT EXISTS files_session ON files (session_id, path);
+"""
+
+
+def _subtree_bounds(rel_path: str) -> Tuple[str, str]:
+    """Half-open key range of every path below rel_path ('/' + 1 == '0')."""
+    return f"{rel_path}/", f"{rel_path}0"
+
+
+def _match_segment(name: str, pattern: str) -> bool:
+    """Match one path segment like glob.glob (case-sensitive, no hidden-file wildcards)."""
+    if name.startswith(".") and not pattern.startswith("."):
+        return False
+    return fnmatch.fnmatchcase(name, pattern)
+
+
+class SessionIndex:
+    """Persistent index of session files under raw_root, in SQLite.
+
+    Every directory below raw_root is recorded with its mtime and every file
+    with its size and mtime; top-level directories are sessions. refresh()
+    walks the tree with ``os.scandir`` but only re-lists directories whose
+    mtime changed (files created, deleted or renamed), so refreshing an
+    unchanged tree costs one stat per directory. In-place edits do not
+    change the directory mtime; use ``refresh(full=True)`` to re-list
+    everything. Symlinked directories are followed like glob.glob does,
+    except links that lead back into one of their own ancestors.
+
+    glob() answers discover_files-style patterns (relative to the session
+    directory, ``*``/``?``/``[...]`` per segment) from the index.
+
+    Example:
+        >>> index = SessionIndex(Path(config.paths.intermediate_root) / SESSION_INDEX_FILENAME, config.paths.raw_root)
+        >>> index.refresh()
+        >>> sessions = discover_sessions(config.paths.raw_root, session_index=index)
+        >>> manifest = discover_files(config, session, session_index=index)
+    """
+
+    def __init__(self, index_path: Union[str, Path], raw_root: Union[str, Path]):
+        """Open (or create) the index.
+
+        An existing index built for another raw_root or schema version is
+        cleared.
+
+        Args:
+            index_path: SQLite database file (created if missing)
+            raw_root: Root directory containing session directories
+        """
+        self.index_path = Path(index_path)
+        self.raw_root = Path(raw_root).resolve()
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+
+        identity = {"version": str(_SESSION_INDEX_VERSION), "raw_root": str(self.raw_root)}
+        with closing(self._connect()) as conn, conn:
+            conn.executescript(_SESSION_INDEX_SCHEMA)
+            stored = dict(conn.execute("SELECT key, value FROM meta"))
+            if stored != identity:
+                conn.execute("DELETE FROM dirs")
+                conn.execute("DELETE FROM files")
+                conn.execute("DELETE FROM meta")
+                conn.executemany("INSERT INTO meta (key, value) VALUES (?, ?)", identity.items())
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(str(self.index_path), timeout=30)
+
+    def refresh(self, session_id: Optional[str] = None, full: bool = False) -> int:
+        """Bring the index up to date with the file system.
+
+        Args:
+            session_id: Only refresh this session's directory tree (default:
+                        all of raw_root, including added/removed sessions)
+            full: Re-list every directory, ignoring stored mtimes
+
+        Returns:
+            Number of directories that were re-listed
+        """
+        start = session_id if session_id is not None else ""
+        with closing(self._connect()) as conn, conn:
+            return self._walk(conn, start, full)
+
+    def _walk(self, conn: sqlite3.Connection, start: str, full: bool) -> int:
+        rescanned = 0
+        pending = [start]
+
+        while pending:
+            rel_dir = pending.pop()
+            try:
+                mtime_ns = os.stat(self.raw_root / rel_dir).st_mtime_ns
+            except OSError:
+                self._drop_tree(conn, rel_dir)
+                continue
+
+            known_children = [row[0] for row in conn.execute("SELECT path FROM dirs WHERE parent = ?", (rel_dir,))]
+            row = conn.execute("SELECT mtime_ns FROM dirs WHERE path = ?", (rel_dir,)).fetchone()
+            if not full and row is not None and row[0] == mtime_ns:
+                pending.extend(known_children)
+                continue
+
+            subdirs, files = self._scan(rel_dir)
+            rescanned += 1
+
+            for child in set(known_children) - set(subdirs):
+                self._drop_tree(conn, child)
+            conn.execute("DELETE FROM files WHERE dir = ?", (rel_dir,))
+            conn.executemany("INSERT OR REPLACE INTO files (path, dir, session_id, name, size, mtime_ns) VALUES (?, ?, ?, ?, ?, ?)", files)
+
+            parent = rel_dir.rpartition("/")[0] if rel_dir else None
+            conn.execute("INSERT OR REPLACE INTO dirs (path, parent, mtime_ns) VALUES (?, ?, ?)", (rel_dir, parent, mtime_ns))
+            pending.extend(subdirs)
+
+        return rescanned
+
+    def _scan(self, rel_dir: str) -> Tuple[List[str], List[Tuple]]:
+        """List one directory: (child directory paths, file rows)."""
+        subdirs, files = [], []
+
+        with os.scandir(self.raw_root / rel_dir) as entries:
+            for entry in entries:
+                rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                try:
+                    if entry.is_dir():
+                        if not entry.is_symlink() or not self._is_loop(rel_path):
+                            subdirs.append(rel_path)
+                    elif rel_dir and entry.is_file():
+                        stat = entry.stat()
+                        files.append((rel_path, rel_dir, rel_path.split("/", 1)[0], entry.name, stat.st_size, stat.st_mtime_ns))
+                except OSError:
+                    # Removed while scanning; the directory mtime changed, so the next refresh re-lists it
+                    continue
+
+        return subdirs, files
+
+    def _is_loop(self, rel_path: str) -> bool:
+        """Whether a symlinked directory resolves to (or above) raw_root or one of its logical ancestors."""
+        target = Path(os.path.realpath(self.raw_root / rel_path))
+        parts = rel_path.split("/")[:-1]
+        for depth in range(len(parts) + 1):
+            ancestor = Path(os.path.realpath(self.raw_root.joinpath(*parts[:depth])))
+            if target == ancestor or target in ancestor.parents:
+                return True
+        return False
+
+    def _drop_tree(self, conn: sqlite3.Connection, rel_dir: str) -> None:
+        """Forget a directory and everything below it."""
+        if not rel_dir:
+            conn.execute("DELETE FROM dirs")
+            conn.execute("DELETE FROM files")
+            return
+
+        low, high = _subtree_bounds(rel_dir)
+        conn.execute("DELETE FROM dirs WHERE path = ? OR (path >= ? AND path < ?)", (rel_dir, low, high))
+        conn.execute("DELETE FROM files WHERE dir = ? OR (dir >= ? AND dir < ?)", (rel_dir, low, high))
+
+    def sessions(self, prefix: str = SESSION_DIR_PREFIX) -> List[str]:
+        """Indexed session directory names starting with prefix, sorted."""
+        with closing(self._connect()) as conn:
+            rows = conn.execute("SELECT path FROM dirs WHERE parent = '' ORDER BY path").fetchall()
+        return [row[0] for row in rows if row[0].startswith(prefix)]
+
+    def files(self, session_id: str) -> List[Tuple[Path, int, int]]:
+        """All indexed files of a session as (absolute path, size, mtime_ns), sorted by path."""
+        low, high = _subtree_bounds(session_id)
+        with closing(self._connect()) as conn:
+            rows = conn.execute("SELECT path, size, mtime_ns FROM files WHERE path >= ? AND path < ? ORDER BY path", (low, high)).fetchall()
+        return [(self.raw_root / path, size, mtime_ns) for path, size, mtime_ns in rows]
+
+    def glob(self, session_id: str, pattern: str) -> List[Path]:
+        """Indexed files of a session matching a glob pattern.
+
+        Equivalent to ``utils.discover_files(raw_root / session_id, pattern)``
+        for relative file patterns, answered from the index (only files are
+        indexed, so directories never match). Like discover_files, paths are
+        resolved, so files under symlinked directories map to their targets.
+
+        Args:
+            session_id: Session directory name
+            pattern: Glob pattern relative to the session directory
+
+        Returns:
+            Resolved absolute paths sorted by file name
+        """
+        segments = [segment for segment in pattern.split("/") if segment not in ("", ".")]
+        if not segments:
+            return []
+
+        # Narrow the query to the literal directory prefix of the pattern
+        literal = [session_id]
+        for segment in segments[:-1]:
+            if any(char in segment for char in "*?["):
+                break
+            literal.append(segment)
+        low, high = _subtree_bounds("/".join(literal))
+
+        with closing(self._connect()) as conn:
+            rows = conn.execute("SELECT path FROM files WHERE path >= ? AND path < ? ORDER BY name, path", (low, high)).fetchall()
+
+        matches = []
+        for (path,) in rows:
+            parts = path.split("/")[1:]
+            if len(parts) == len(segments) and all(_match_segment(part, segment) for part, segment in zip(parts, segments)):
+                matches.append((self.raw_root / path).resolve())
+        matches.sort(key=lambda path: path.name)
+        return matches
+
+
+def discover_files(config: Config, session: Session, session_index: Optional[SessionIndex] = None) -> Manifest:
     """Discover files from session configuration without counting.
 
     This function performs ONLY file discovery, which is fast and always succeeds.
@@ -113,6 +521,8 @@ def discover_files(config: Config, session: Session) -> Manifest:
     Args:
         config: Pipeline configuration (used for paths)
         session: Session metadata with file patterns
+        session_index: Answer the patterns from this (refreshed) index
+                       instead of globbing the session directory (optional)
 
     Returns:
         Manifest with discovered files but counts set to None
@@ -132,11 +542,16 @@ def discover_files(config: Config, session: Session) -> Manifest:
     raw_root = Path(config.paths.raw_root)
     session_dir = raw_root / session.session.id
 
+    def find_session_files(pattern: str) -> List[Path]:
+        if session_index is None:
+            return find_files(session_dir, pattern, sort=True)
+        return session_index.glob(session.session.id, pattern)
+
     # Discover cameras and their video files
     cameras = []
     for camera_config in session.cameras:
         # Discover video files
-        video_files = find_files(session_dir, camera_config.paths, sort=True)
+        video_files = find_session_files(camera_config.paths)
 
         if not video_files:
             pattern = str(session_dir / camera_config.paths)
@@ -158,7 +573,7 @@ def discover_files(config: Config, session: Session) -> Manifest:
     # Discover TTLs (file paths only)
     ttls = []
     for ttl_config in session.TTLs:
-        ttl_files = find_files(session_dir, ttl_config.paths, sort=True)
+        ttl_files = find_session_files(ttl_config.paths)
 
         if not ttl_files:
             pattern = str(session_dir / ttl_config.paths)
@@ -172,7 +587,7 @@ def discover_files(config: Config, session: Session) -> Manifest:
     # Discover Bpod files
     bpod_files = None
     if session.bpod.path:
-        discovered = find_files(session_dir, session.bpod.path, sort=True)
+        discovered = find_session_files(session.bpod.path)
         if discovered:
             bpod_files = [str(f) for f in discovered]
 
@@ -184,29 +599,95 @@ def discover_files(config: Config, session: Session) -> Manifest:
     )
 
 
-def populate_manifest_counts(manifest: Manifest) -> Manifest:
+def _count_video_segments(
+    video_paths: Sequence[Path], max_workers: int = 1, frame_count_cache: Optional[FrameCountCache] = None, strategy: str = "decode"
+) -> Tuple[List[Optional[FrameCount]], List[Tuple[Path, Exception]]]:
+    """Count frames in every video segment, collecting failures instead of raising.
+
+    ffprobe runs in a subprocess, so a thread pool is enough to run several
+    decodes at once.
+
+    Returns:
+        (frame counts in input order with None for failures, [(path, error), ...])
+    """
+
+    def count(video_path: Path) -> Tuple[Optional[FrameCount], Optional[Exception]]:
+        try:
+            return probe_video_frames(video_path, strategy=strategy, cache=frame_count_cache), None
+        except Exception as e:
+            return None, e
+
+    if max_workers <= 1 or len(video_paths) <= 1:
+        results = [count(path) for path in video_paths]
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(video_paths)), thread_name_prefix="frame-counter") as executor:
+            results = list(executor.map(count, video_paths))
+
+    failures = [(path, error) for path, (_, error) in zip(video_paths, results) if error is not None]
+    return [frames for frames, _ in results], failures
+
+
+def _raise_count_failures(failures: List[Tuple[Path, Exception]], n_segments: int) -> None:
+    """Raise one IngestError listing every failed segment (no-op without failures)."""
+    if failures:
+        details = "\n".join(f"  {path}: {error}" for path, error in failures)
+        logger.error(f"Failed to count frames in {len(failures)} of {n_segments} video files")
+        raise IngestError(f"Could not count frames in {len(failures)} of {n_segments} video files:\n{details}")
+
+
+def _is_borderline(frame_count: int, ttl_pulse_count: int, tolerance: int) -> bool:
+    """Whether a mismatch is close enough to (or beyond) the tolerance to need exact counts."""
+    mismatch = compute_mismatch(frame_count, ttl_pulse_count)
+    return mismatch > max(tolerance - AUTO_DECODE_MARGIN_FRAMES, 0)
+
+
+def populate_manifest_counts(
+    manifest: Manifest,
+    max_workers: int = 1,
+    frame_count_cache: Optional[FrameCountCache] = None,
+    frame_count_strategy: str = "decode",
+    tolerance: Optional[int] = None,
+    ttl_cache_dir: Optional[Path] = None,
+) -> Manifest:
     """Populate frame and TTL pulse counts for a manifest.
 
     Takes a manifest (typically from discover_files) and counts frames/TTL pulses
     for all cameras. Returns a new Manifest with counts populated.
 
-    This is the SLOW operation - use only when verification is needed.
+    This is the SLOW operation - use only when verification is needed. With
+    ``max_workers > 1`` the segments of all cameras are counted concurrently;
+    per-camera totals are summed in segment order, so results do not depend
+    on completion order.
+
+    In "auto" mode segments are counted from packets (see probe_video_frames);
+    if a tolerance is given, cameras whose frame/TTL mismatch is borderline
+    (within AUTO_DECODE_MARGIN_FRAMES of the tolerance, or beyond it) are
+    recounted with a full decode before verification.
 
     Args:
         manifest: Manifest with discovered files (counts may be None)
+        max_workers: Number of concurrent ffprobe invocations (1 counts sequentially)
+        frame_count_cache: Persistent frame counts; only new or changed
+                           segments are probed (optional)
+        frame_count_strategy: "header", "packets", "decode" or "auto"
+        tolerance: Verification tolerance in frames (auto mode escalation)
+        ttl_cache_dir: TTL sidecar cache directory; pulses are counted from
+                       (and parsed into) the sidecars the sync phase loads
 
     Returns:
-        New Manifest with frame_count and ttl_pulse_count populated
+        New Manifest with frame_count, frame_count_strategies and
+        ttl_pulse_count populated
 
     Raises:
-        IngestError: If counting fails
+        IngestError: If counting fails for any video file (all failures are
+                     reported together, after every segment was attempted)
 
     Example:
         >>> # Fast discovery first
         >>> manifest = discover_files(config, session)
         >>>
         >>> # Later, count when needed
-        >>> manifest = populate_manifest_counts(manifest)
+        >>> manifest = populate_manifest_counts(manifest, max_workers=8, frame_count_strategy="auto", tolerance=10)
         >>> verify_manifest(manifest, tolerance=10)
     """
     # Build TTL pulse count map
@@ -216,21 +697,49 @@ def populate_manifest_counts(manifest: Manifest) -> Manifest:
     for ttl_id, ttl_files in ttl_files_by_id.items():
         total_pulses = 0
         for ttl_file in ttl_files:
-            total_pulses += count_ttl_pulses(Path(ttl_file))
+            total_pulses += count_ttl_pulses(Path(ttl_file), cache_dir=ttl_cache_dir)
         ttl_pulse_counts[ttl_id] = total_pulses
         logger.debug(f"Counted {total_pulses} TTL pulses for '{ttl_id}'")
 
+    # New counts are appended to the cache in one write and fsync
+    with frame_count_cache.batch() if frame_count_cache is not None else nullcontext():
+        # One job per segment across all cameras keeps every worker busy
+        segments = [(camera.camera_id, Path(video_file)) for camera in manifest.cameras for video_file in camera.video_files]
+        frame_counts, failures = _count_video_segments([path for _, path in segments], max_workers, frame_count_cache, frame_count_strategy)
+        _raise_count_failures(failures, len(segments))
+
+        def camera_totals() -> Dict[str, int]:
+            totals = {camera.camera_id: 0 for camera in manifest.cameras}
+            for (camera_id, _), counted in zip(segments, frame_counts):
+                totals[camera_id] += counted.frame_count
+            return totals
+
+        total_frames_by_camera = camera_totals()
+
+        if frame_count_strategy == "auto" and tolerance is not None:
+            borderline = {
+                camera.camera_id
+                for camera in manifest.cameras
+                if camera.ttl_id in ttl_pulse_counts and _is_borderline(total_frames_by_camera[camera.camera_id], ttl_pulse_counts[camera.ttl_id], tolerance)
+            }
+            recount = [i for i, (camera_id, _) in enumerate(segments) if camera_id in borderline and frame_counts[i].strategy == "packets"]
+
+            if recount:
+                logger.info(f"Borderline frame/TTL mismatch for cameras {sorted(borderline)}: decoding {len(recount)} segments")
+                decoded, failures = _count_video_segments([segments[i][1] for i in recount], max_workers, frame_count_cache, "decode")
+                _raise_count_failures(failures, len(recount))
+                for i, counted in zip(recount, decoded):
+                    frame_counts[i] = counted
+                total_frames_by_camera = camera_totals()
+
+    strategies_by_camera: Dict[str, List[str]] = {camera.camera_id: [] for camera in manifest.cameras}
+    for (camera_id, _), counted in zip(segments, frame_counts):
+        strategies_by_camera[camera_id].append(counted.strategy)
+
     # Count frames for each camera
     counted_cameras = []
     for camera in manifest.cameras:
-        total_frames = 0
-        for video_file in camera.video_files:
-            try:
-                frames = count_video_frames(Path(video_file))
-                total_frames += frames
-            except IngestError as e:
-                logger.error(f"Failed to count frames in {video_file}: {e}")
-                raise
+        total_frames = total_frames_by_camera[camera.camera_id]
 
         # Get TTL pulse count for this camera
         ttl_pulses = ttl_pulse_counts.get(camera.ttl_id, 0)
@@ -244,6 +753,7 @@ def populate_manifest_counts(manifest: Manifest) -> Manifest:
                 ttl_id=camera.ttl_id,
                 video_files=camera.video_files,
                 frame_count=total_frames,
+                frame_count_strategies=strategies_by_camera[camera.camera_id],
                 ttl_pulse_count=ttl_pulses,
             )
         )
@@ -257,7 +767,14 @@ def populate_manifest_counts(manifest: Manifest) -> Manifest:
     )
 
 
-def build_and_count_manifest(config: Config, session: Session) -> Manifest:
+def build_and_count_manifest(
+    config: Config,
+    session: Session,
+    max_workers: int = 1,
+    frame_count_cache: Optional[FrameCountCache] = None,
+    ttl_cache_dir: Optional[Path] = None,
+    session_index: Optional[SessionIndex] = None,
+) -> Manifest:
     """Discover files and count frames/TTL pulses in one call (convenience function).
 
     This is equivalent to:
@@ -266,10 +783,15 @@ def build_and_count_manifest(config: Config, session: Session) -> Manifest:
 
     Use this when you need a counted manifest and want a simple one-liner.
     For more control, use discover_files() and populate_manifest_counts() separately.
+    Frames are counted with config.verification.frame_count_strategy.
 
     Args:
         config: Pipeline configuration
         session: Session metadata
+        max_workers: Concurrent frame counts (see populate_manifest_counts)
+        frame_count_cache: Persistent frame counts (see populate_manifest_counts)
+        ttl_cache_dir: TTL sidecar cache directory (see populate_manifest_counts)
+        session_index: Session file index (see discover_files)
 
     Returns:
         Manifest with all files discovered and counts populated
@@ -282,31 +804,72 @@ def build_and_count_manifest(config: Config, session: Session) -> Manifest:
         >>> manifest = build_and_count_manifest(config, session)
         >>> verify_manifest(manifest, tolerance=10)
     """
-    manifest = discover_files(config, session)
-    return populate_manifest_counts(manifest)
+    manifest = discover_files(config, session, session_index=session_index)
+    return populate_manifest_counts(
+        manifest,
+        max_workers=max_workers,
+        frame_count_cache=frame_count_cache,
+        frame_count_strategy=config.verification.frame_count_strategy,
+        tolerance=config.verification.mismatch_tolerance_frames,
+        ttl_cache_dir=ttl_cache_dir,
+    )
 
 
-def count_video_frames(video_path: Path) -> int:
-    """Count frames in a video file using ffprobe or synthetic stub.
+def _probe_auto(video_path: Path) -> FrameCount:
+    """Count packets, decoding only if the container header disagrees."""
+    packets = run_ffprobe(video_path, strategy="packets")
+    try:
+        header = run_ffprobe(video_path, strategy="header")
+    except VideoAnalysisError:
+        # Containers without nb_frames (e.g. some AVI/MKV) cannot be cross-checked
+        header = None
+
+    if header is not None and header != packets:
+        logger.info(f"{video_path.name}: header reports {header} frames but {packets} packets, decoding")
+        return FrameCount(run_ffprobe(video_path, strategy="decode"), "decode")
+    return FrameCount(packets, "packets")
+
+
+def probe_video_frames(video_path: Path, strategy: str = "decode", cache: Optional[FrameCountCache] = None) -> FrameCount:
+    """Count frames in a video file and record how the count was obtained.
+
+    Strategies (see utils.run_ffprobe): "header" reads nb_frames from the
+    container (instant), "packets" demuxes without decoding, "decode" decodes
+    every frame. "auto" counts packets and escalates to a full decode when
+    the header count disagrees. Cached counts are reused if their strategy is
+    at least as precise as requested.
 
     Args:
         video_path: Path to video file
+        strategy: "header", "packets", "decode" or "auto"
+        cache: Persistent frame-count cache (optional)
 
     Returns:
-        Number of frames in video
+        FrameCount with the count and the strategy that produced it
 
     Raises:
         IngestError: If video file cannot be analyzed
+        ValueError: If strategy is unknown
     """
+    if strategy not in FRAME_COUNT_MODES:
+        raise ValueError(f"Unknown frame count strategy '{strategy}', expected one of {FRAME_COUNT_MODES}")
+
     # Validate input
     if not video_path.exists():
         logger.warning(f"Video file not found: {video_path}")
-        return 0
+        return FrameCount(0, "none")
 
     # Handle empty files
     if video_path.stat().st_size == 0:
         logger.warning(f"Video file is empty: {video_path}")
-        return 0
+        return FrameCount(0, "none")
+
+    if cache is not None:
+        cached = cache.lookup(video_path)
+        required = "packets" if strategy == "auto" else strategy
+        if cached is not None and _STRATEGY_RANK.get(cached.strategy, -1) >= _STRATEGY_RANK[required]:
+            logger.debug(f"Loaded frame count {cached.frame_count} ({cached.strategy}) for {video_path.name} from cache")
+            return cached
 
     # Check if this is a synthetic stub video
     try:
@@ -316,39 +879,68 @@ def count_video_frames(video_path: Path) -> int:
         if is_synthetic_stub(video_path):
             frame_count = count_stub_frames(video_path)
             logger.debug(f"Counted {frame_count} frames in synthetic stub {video_path.name}")
-            return frame_count
+            return FrameCount(frame_count, "stub")
     except ImportError:
         # Synthetic module not available - continue with normal ffprobe
         pass
 
     # Use ffprobe to count frames
     try:
-        frame_count = run_ffprobe(video_path)
-        logger.debug(f"Counted {frame_count} frames in {video_path.name}")
-        return frame_count
+        counted = _probe_auto(video_path) if strategy == "auto" else FrameCount(run_ffprobe(video_path, strategy=strategy), strategy)
+        logger.debug(f"Counted {counted.frame_count} frames in {video_path.name} ({counted.strategy})")
     except Exception as e:
         # Log error but don't crash - return 0 for unreadable videos
         logger.error(f"Failed to count frames in {video_path}: {e}")
         raise IngestError(f"Could not count frames in video {video_path}: {e}")
 
+    if cache is not None:
+        try:
+            cache.put(video_path, counted.frame_count, counted.strategy)
+        except OSError as e:
+            logger.warning(f"Failed to cache frame count for {video_path.name}: {e}")
+    return counted
+
+
+def count_video_frames(video_path: Path, cache: Optional[FrameCountCache] = None, strategy: str = "decode") -> int:
+    """Count frames in a video file using ffprobe or synthetic stub.
+
+    With a cache, unchanged videos are not decoded again; new ffprobe counts
+    are added to it.
+
+    Args:
+        video_path: Path to video file
+        cache: Persistent frame-count cache (optional)
+        strategy: Counting strategy (see probe_video_frames)
+
+    Returns:
+        Number of frames in video
+
+    Raises:
+        IngestError: If video file cannot be analyzed
+    """
+    return probe_video_frames(video_path, strategy=strategy, cache=cache).frame_count
+
 
-def count_ttl_pulses(ttl_path: Path) -> int:
+def count_ttl_pulses(ttl_path: Path, cache_dir: Optional[Path] = None) -> int:
     """Count TTL pulses from log file.
 
+    Each non-blank line is one pulse. The file is streamed in binary blocks
+    rather than read into memory; with ``cache_dir`` the count comes from
+    the TTL sidecar instead, which is written on first use so the sync
+    phase does not parse the file again.
+
     Args:
         ttl_path: Path to TTL log file
+        cache_dir: TTL sidecar cache directory (optional)
 
     Returns:
-        Number of pulses in file
+        Number of pulses in file (0 if missing or unreadable)
     """
     if not ttl_path.exists():
         return 0
 
-    # Count lines in TTL file (each line = one pulse)
     try:
-        with open(ttl_path, "r") as f:
-            lines = f.readlines()
-            return len([line for line in lines if line.strip()])
+        return count_ttl_lines(ttl_path, cache_dir=cache_dir)
     except Exception:
         return 0
 
@@ -531,15 +1123,20 @@ def load_manifest(manifest_path: Union[str, Path]) -> dict:
     return data
 
 
-def discover_sessions(raw_root) -> list:
+def discover_sessions(raw_root, session_index: Optional[SessionIndex] = None) -> list:
     """Discover session directories (Phase 1 stub).
 
     Args:
         raw_root: Root directory for raw data (str or Path or dict)
+        session_index: List sessions from this (refreshed) index instead of
+                       scanning raw_root (optional)
 
     Returns:
         List of session Path objects
     """
+    if session_index is not None:
+        return [session_index.raw_root / session_id for session_id in session_index.sessions()]
+
     # Handle various input formats
     # If it's a dict (from config["paths"]), extract raw_root key
     if isinstance(raw_root, dict):
@@ -550,10 +1147,11 @@ def discover_sessions(raw_root) -> list:
 
     sessions = []
     if raw_root.exists():
-        # Look for Session-* directories
-        for path in raw_root.iterdir():
-            if path.is_dir() and path.name.startswith("Session-"):
-                sessions.append(path)
+        # Look for Session-* directories (scandir entries know their type without a stat)
+        with os.scandir(raw_root) as entries:
+            for entry in entries:
+                if entry.name.startswith(SESSION_DIR_PREFIX) and entry.is_dir():
+                    sessions.append(raw_root / entry.name)
 
     return sorted(sessions)
 
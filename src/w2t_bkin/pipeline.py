@@ -67,8 +67,16 @@ from typing import Any, Dict, List, Optional, TypedDict, Union
 from w2t_bkin.config import load_config, load_session
 from w2t_bkin.domain import AlignmentStats, Config, FacemapBundle, Manifest, PoseBundle, Session, TranscodedVideo
 from w2t_bkin.events import extract_trials, parse_bpod
-from w2t_bkin.ingest import build_and_count_manifest, verify_manifest
-from w2t_bkin.sync import create_timebase_provider_from_config, get_ttl_pulses
+from w2t_bkin.ingest import FRAME_COUNT_CACHE_FILENAME, SESSION_INDEX_FILENAME, FrameCountCache, SessionIndex, build_and_count_manifest, verify_manifest
+from w2t_bkin.sync import (
+    ALIGNMENT_CACHE_DIRNAME,
+    ALIGNMENT_STATS_FILENAME,
+    TTL_CACHE_DIRNAME,
+    AlignmentCache,
+    compute_alignment,
+    summarize_alignment,
+    write_alignment_stats,
+)
 from w2t_bkin.utils import compute_hash, ensure_directory
 
 logger = logging.getLogger(__name__)
@@ -153,6 +161,7 @@ def run_session(
             - skip_nwb: Skip NWB assembly (default: False)
             - skip_validation: Skip verification stage (default: False)
             - transcode_videos: Enable video transcoding (default: False)
+            - max_workers: Concurrent video frame counts and TTL file loads (default: 1)
 
     Returns:
         RunResult with all pipeline outputs and provenance
@@ -178,6 +187,7 @@ def run_session(
     skip_nwb = options.get("skip_nwb", False)
     skip_validation = options.get("skip_validation", False)
     transcode_videos = options.get("transcode_videos", False)
+    max_workers = options.get("max_workers", 1)
 
     logger.info("=" * 70)
     logger.info("W2T-BKIN Pipeline - Session Processing")
@@ -208,7 +218,21 @@ def run_session(
     # Phase 1: Ingest and Verify
     # -------------------------------------------------------------------------
     logger.info("\n[Phase 1] Building manifest...")
-    manifest = build_and_count_manifest(config, session)
+    # Raw videos do not change after acquisition: frame counts are cached across runs
+    frame_count_cache = FrameCountCache(Path(config.paths.intermediate_root) / FRAME_COUNT_CACHE_FILENAME)
+    # Parsed TTL files are cached as .npy sidecars: counted here, reused by later phases and runs
+    ttl_cache_dir = Path(config.paths.intermediate_root) / TTL_CACHE_DIRNAME
+    # Discovery globs are answered from a persistent file index; only directories changed since the last run are re-listed
+    session_index = SessionIndex(Path(config.paths.intermediate_root) / SESSION_INDEX_FILENAME, config.paths.raw_root)
+    session_index.refresh(session_id)
+    manifest = build_and_count_manifest(
+        config,
+        session,
+        max_workers=max_workers,
+        frame_count_cache=frame_count_cache,
+        ttl_cache_dir=ttl_cache_dir,
+        session_index=session_index,
+    )
     logger.info(f"  ✓ Discovered {len(manifest.cameras)} cameras")
     logger.info(f"  ✓ Discovered {len(manifest.ttls)} TTL channels")
     logger.info(f"  ✓ Discovered {len(manifest.bpod_files or [])} Bpod files")
@@ -265,46 +289,22 @@ def run_session(
             events_summary = None
 
     # -------------------------------------------------------------------------
-    # Phase 3: Synchronization (Placeholder)
+    # Phase 3: Synchronization
     # -------------------------------------------------------------------------
     logger.info("\n[Phase 3] Creating timebase and alignment...")
 
-    # Create timebase provider
-    timebase_provider = create_timebase_provider_from_config(config, manifest)
-    logger.info(f"  ✓ Timebase provider created: {config.timebase.source}")
-
-    # Compute alignment stats (placeholder - would normally align all modalities)
-    alignment_stats: Optional[AlignmentStats] = None
-
-    # For now, create minimal alignment stats if TTL-based
-    if config.timebase.source == "ttl":
-        # Extract TTL pulses for alignment
-        ttl_patterns = {ttl.id: ttl.path for ttl in session.TTLs}
-        ttl_pulses = get_ttl_pulses(ttl_patterns, session_dir)
-
-        # Count total pulses
-        total_pulses = sum(len(pulses) for pulses in ttl_pulses.values())
-
-        alignment_stats = AlignmentStats(
-            timebase_source=config.timebase.source,
-            mapping=config.timebase.mapping,
-            offset_s=config.timebase.offset_s,
-            max_jitter_s=0.0,  # Placeholder
-            p95_jitter_s=0.0,  # Placeholder
-            aligned_samples=total_pulses,
-        )
-        logger.info(f"  ✓ Alignment stats created: {total_pulses} samples aligned")
-    else:
-        # Nominal rate - create minimal stats
-        alignment_stats = AlignmentStats(
-            timebase_source=config.timebase.source,
-            mapping=config.timebase.mapping,
-            offset_s=config.timebase.offset_s,
-            max_jitter_s=0.0,
-            p95_jitter_s=0.0,
-            aligned_samples=0,
-        )
-        logger.info("  ✓ Alignment stats created (nominal rate)")
+    # TTL/Neuropixels timebases and alignments are cached by input fingerprint, so reruns with unchanged sync inputs skip them
+    alignment_cache = AlignmentCache(Path(config.paths.intermediate_root) / ALIGNMENT_CACHE_DIRNAME)
+    session_interim_dir = Path(config.paths.intermediate_root) / session_id
+
+    # Align camera frames (drops/duplicates removed via camera TTLs) and persist timestamps + stats
+    alignment = compute_alignment(manifest, config, output_dir=session_interim_dir, ttl_cache_dir=ttl_cache_dir, cache=alignment_cache, max_workers=max_workers)
+    alignment_stats: Optional[AlignmentStats] = summarize_alignment(alignment, config)
+    ensure_directory(session_interim_dir)
+    write_alignment_stats(alignment_stats, session_interim_dir / ALIGNMENT_STATS_FILENAME)
+    logger.info(f"  ✓ Aligned {len(alignment)} cameras ({config.timebase.source}): {alignment_stats.aligned_samples} frames, max jitter {alignment_stats.max_jitter_s:.6f}s")
+    if alignment_stats.dropped_frames or alignment_stats.duplicate_frames:
+        logger.warning(f"  ⚠ {alignment_stats.dropped_frames or 0} dropped frames, {alignment_stats.duplicate_frames or 0} duplicate TTL pulses")
 
     # -------------------------------------------------------------------------
     # Phase 4: Optional Modalities (Pose, Facemap, Transcode)
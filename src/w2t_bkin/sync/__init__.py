@@ -13,28 +13,70 @@ Example:
 from ..exceptions import JitterBudgetExceeded, SyncError
 
 # Behavioral synchronization
-from .behavior import align_bpod_trials_to_ttl, get_sync_time_from_bpod_trial
+from .behavior import align_bpod_trials_to_ttl, fit_bpod_clock_drift, get_sync_time_from_bpod_trial
+
+# Alignment result cache
+from .cache import ALIGNMENT_CACHE_DIRNAME, AlignmentCache, fingerprint_inputs
+
+# Clock drift models
+from .drift import ClockDriftModel, fit_clock_drift
 
 # FaceMap synchronization
 from .facemap import sync_facemap_to_timebase
 
+# Frame drop/duplicate detection
+from .frames import FrameDropReport, detect_frame_drops
+
+# Jitter summaries
+from .jitter import StreamingJitterStats, summarize_jitter
+
 # Mapping strategies
-from .mapping import align_samples, compute_jitter_stats, enforce_jitter_budget, map_linear, map_nearest
+from .mapping import (
+    align_modalities,
+    align_samples,
+    align_samples_chunked,
+    compute_jitter_stats,
+    enforce_jitter_budget,
+    interpolate_linear,
+    iter_chunks,
+    map_linear,
+    map_linear_array,
+    map_nearest,
+    map_nearest_array,
+)
 
 # Module-local models
 from .models import AlignmentStats
 
+# Neuropixels sync channel
+from .neuropixels import detect_rising_edges, extract_sync_edges, read_spikeglx_meta
+
+# Pulse train pattern matching
+from .pattern import PulseTrainMatch, match_pulse_train
+
 # Pose synchronization
 from .pose import sync_pose_to_timebase
 
+# Reference timebase
+from .reference import ReferenceTimebase, UniformTimebase, as_reference_timebase
+
 # Alignment statistics
-from .stats import compute_alignment, create_alignment_stats, load_alignment_manifest, write_alignment_stats
+from .stats import (
+    ALIGNMENT_INDEX_FILENAME,
+    ALIGNMENT_STATS_FILENAME,
+    compute_alignment,
+    create_alignment_stats,
+    load_alignment_manifest,
+    summarize_alignment,
+    write_alignment_manifest,
+    write_alignment_stats,
+)
 
 # Timebase providers
 from .timebase import NeuropixelsProvider, NominalRateProvider, TimebaseProvider, TTLProvider, create_timebase_provider, create_timebase_provider_from_config
 
 # TTL utilities (generic)
-from .ttl import get_ttl_pulses, load_ttl_file
+from .ttl import TTL_CACHE_DIRNAME, count_ttl_lines, get_ttl_pulses, load_ttl_array, load_ttl_arrays, load_ttl_file, merge_ttl_arrays
 
 # Video synchronization
 from .video import sync_video_frames_to_timebase
@@ -52,27 +94,64 @@ __all__ = [
     "NeuropixelsProvider",
     "create_timebase_provider",
     "create_timebase_provider_from_config",
+    # Neuropixels
+    "read_spikeglx_meta",
+    "detect_rising_edges",
+    "extract_sync_edges",
+    # Reference
+    "ReferenceTimebase",
+    "UniformTimebase",
+    "as_reference_timebase",
     # Mapping
     "map_nearest",
+    "map_nearest_array",
     "map_linear",
+    "map_linear_array",
+    "interpolate_linear",
     "compute_jitter_stats",
     "enforce_jitter_budget",
     "align_samples",
+    # Frame drops
+    "FrameDropReport",
+    "detect_frame_drops",
+    # Jitter
+    "StreamingJitterStats",
+    "summarize_jitter",
     # TTL
+    "count_ttl_lines",
     "get_ttl_pulses",
+    "load_ttl_array",
+    "load_ttl_arrays",
     "load_ttl_file",
+    "merge_ttl_arrays",
+    "TTL_CACHE_DIRNAME",
     # Behavior
     "get_sync_time_from_bpod_trial",
     "align_bpod_trials_to_ttl",
+    "fit_bpod_clock_drift",
+    # Clock drift
+    "ClockDriftModel",
+    "fit_clock_drift",
+    # Pattern matching
+    "PulseTrainMatch",
+    "match_pulse_train",
     # Video
     "sync_video_frames_to_timebase",
     # FaceMap
     "sync_facemap_to_timebase",
     # Pose
     "sync_pose_to_timebase",
+    # Cache
+    "AlignmentCache",
+    "fingerprint_inputs",
+    "ALIGNMENT_CACHE_DIRNAME",
     # Stats
     "create_alignment_stats",
     "write_alignment_stats",
-    "load_alignment_manifest",
+    "summarize_alignment",
     "compute_alignment",
+    "write_alignment_manifest",
+    "load_alignment_manifest",
+    "ALIGNMENT_INDEX_FILENAME",
+    "ALIGNMENT_STATS_FILENAME",
 ]
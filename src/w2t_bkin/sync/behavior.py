@@ -7,23 +7,269 @@ Example:
     >>> from w2t_bkin.sync import align_bpod_trials_to_ttl
     >>> trial_configs = [{"trial_type": 1, "sync_signal": "W2L_Audio", "sync_ttl": "ttl_bpod"}]
     >>> trial_offsets, warnings = align_bpod_trials_to_ttl(trial_configs, bpod_data, ttl_pulses)
+    >>> clock_model, warnings = fit_bpod_clock_drift(trial_configs, bpod_data, ttl_pulses)
 """
 
 import logging
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
 import numpy as np
 
 from ..exceptions import SyncError
+from .drift import ClockDriftModel, fit_clock_drift
+from .pattern import match_pulse_train
 from .protocols import BpodTrialTypeProtocol
 
 __all__ = [
     "get_sync_time_from_bpod_trial",
     "align_bpod_trials_to_ttl",
+    "fit_bpod_clock_drift",
 ]
 
 logger = logging.getLogger(__name__)
 
+# Per-trial alignment status codes (columnar alignment)
+_ALIGNED = 0
+_UNKNOWN_TYPE = 1
+_NO_SYNC_SIGNAL = 2
+_NO_CHANNEL = 3
+_NO_PULSES = 4
+_DROPPED_PULSE = 5
+
+# Trial ↔ TTL pulse matching modes
+ALIGNMENT_MODES = ("sequential", "pattern")
+
+# Extra pulse indices listed per channel in pattern-mode warnings
+_MAX_LISTED_PULSES = 10
+
+
+# =============================================================================
+# Columnar Extraction Helpers
+# =============================================================================
+
+
+def _column(value: Any, n_trials: int, name: str) -> np.ndarray:
+    """Return a per-trial SessionData field as a 1-D array of length n_trials.
+
+    Scalars (including 0-d arrays) apply to every trial.
+
+    Raises:
+        SyncError: Field has fewer entries than trials
+    """
+    array = np.asarray(value)
+    if array.ndim == 0:
+        return np.full(n_trials, array.item())
+
+    array = array.ravel()
+    if array.size < n_trials:
+        raise SyncError(f"Invalid Bpod structure: {name} has {array.size} entries for {n_trials} trials")
+    return array[:n_trials]
+
+
+def _field(obj: Any, name: str) -> Any:
+    """Read a field from a dict or MATLAB struct without converting it."""
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+def _sync_state_starts(trial_data_list: Any, trial_indices: np.ndarray, sync_signal: str) -> np.ndarray:
+    """Sync state start times (relative to trial start) for selected trials.
+
+    Equivalent to get_sync_time_from_bpod_trial() for each trial, but reads
+    only the States field of each trial instead of converting whole trials.
+
+    Returns:
+        float64 array aligned with trial_indices; NaN where the state is
+        missing, not visited, or malformed
+    """
+    starts = np.full(trial_indices.size, np.nan)
+
+    for k, i in enumerate(trial_indices):
+        states = _field(trial_data_list[i], "States")
+        if states is None:
+            continue
+
+        sync_times = _field(states, sync_signal)
+        if not isinstance(sync_times, (list, tuple, np.ndarray)) or len(sync_times) < 2:
+            continue
+
+        start_time = sync_times[0]
+        if start_time is not None:
+            starts[k] = float(start_time)
+
+    return starts
+
+
+class _SyncMatch(NamedTuple):
+    """Matched Bpod sync events and TTL pulses (columnar, 0-based trial indices)."""
+
+    n_trials: int
+    trial_types: np.ndarray
+    trial_type_map: Dict[int, Dict[str, Any]]
+    aligned: np.ndarray
+    trial_starts: np.ndarray
+    sync_rel: np.ndarray
+    ttl_times: np.ndarray
+    warnings: List[str]
+
+    @property
+    def bpod_sync_times(self) -> np.ndarray:
+        """Sync event times of aligned trials on the Bpod session clock."""
+        return self.trial_starts[self.aligned] + self.sync_rel[self.aligned]
+
+
+def _match_sync_pulses(
+    trial_type_configs: List[BpodTrialTypeProtocol],
+    bpod_data: Dict,
+    ttl_pulses: Dict[str, List[float]],
+    mode: str = "sequential",
+    match_tolerance_s: Optional[float] = None,
+) -> Optional[_SyncMatch]:
+    """Match per-trial Bpod sync events to TTL pulses.
+
+    Shared by align_bpod_trials_to_ttl() and fit_bpod_clock_drift(); see
+    align_bpod_trials_to_ttl() for the matching modes.
+
+    Returns:
+        _SyncMatch, or None when the session has no trials
+
+    Raises:
+        SyncError: If trial_type config missing, mode unknown or data structure invalid
+    """
+    from ..utils import convert_matlab_struct
+
+    if mode not in ALIGNMENT_MODES:
+        raise SyncError(f"Unknown alignment mode '{mode}', expected one of {ALIGNMENT_MODES}")
+
+    # Validate Bpod structure
+    if "SessionData" not in bpod_data:
+        raise SyncError("Invalid Bpod structure: missing SessionData")
+
+    session_data = convert_matlab_struct(bpod_data["SessionData"])
+    n_trials = int(session_data["nTrials"])
+
+    if n_trials == 0:
+        return None
+
+    # Build trial_type → sync config mapping
+    trial_type_map = {}
+    for tt_config in trial_type_configs:
+        trial_type_map[tt_config.trial_type] = {
+            "sync_signal": tt_config.sync_signal,
+            "sync_ttl": tt_config.sync_ttl,
+            "description": tt_config.description,
+        }
+
+    if not trial_type_map:
+        raise SyncError("No trial_type sync configuration provided in trial_type_configs")
+
+    # Extract raw trial data
+    raw_events = convert_matlab_struct(session_data["RawEvents"])
+    trial_data_list = raw_events["Trial"]
+
+    # Extract TrialTypes if available
+    trial_types_array = session_data.get("TrialTypes")
+    if trial_types_array is None:
+        # Default to trial_type 1 for all trials if not specified
+        trial_types_array = [1] * n_trials
+        logger.warning("TrialTypes not found in Bpod data, defaulting all trials to type 1")
+
+    trial_types = _column(trial_types_array, n_trials, "TrialTypes").astype(np.int64)
+
+    # Sync state start (relative to trial start) per trial, one pass per trial type
+    sync_rel = np.full(n_trials, np.nan)
+    for trial_type, sync_config in trial_type_map.items():
+        type_indices = np.flatnonzero(trial_types == trial_type)
+        sync_rel[type_indices] = _sync_state_starts(trial_data_list, type_indices, sync_config["sync_signal"])
+
+    # Status per trial; each failure reproduces the per-trial warning of the original algorithm
+    status = np.full(n_trials, _ALIGNED, dtype=np.int8)
+    known_type = np.isin(trial_types, list(trial_type_map))
+    status[~known_type] = _UNKNOWN_TYPE
+    status[known_type & np.isnan(sync_rel)] = _NO_SYNC_SIGNAL
+
+    # Trial start timestamp from Bpod (may be non-zero after merge); pattern mode needs it to match
+    trial_starts = np.empty(0)
+    if mode == "pattern" and np.any(status == _ALIGNED):
+        trial_starts = _column(session_data["TrialStartTimestamp"], n_trials, "TrialStartTimestamp").astype(np.float64)
+
+    # Match eligible trials to TTL pulses:
+    # - sequential: the k-th trial on a channel takes pulse k
+    # - pattern: trials take the pulse matching their sync time pattern (robust to dropped/extra pulses)
+    ttl_times = np.full(n_trials, np.nan)
+    consumed = {ttl_id: 0 for ttl_id in ttl_pulses.keys()}
+    extra_pulses = {}
+    channel_by_type = {trial_type: config["sync_ttl"] for trial_type, config in trial_type_map.items()}
+
+    for sync_ttl_id in dict.fromkeys(channel_by_type.values()):
+        channel_types = [trial_type for trial_type, ttl_id in channel_by_type.items() if ttl_id == sync_ttl_id]
+        eligible = np.flatnonzero((status == _ALIGNED) & np.isin(trial_types, channel_types))
+
+        if sync_ttl_id not in ttl_pulses:
+            status[eligible] = _NO_CHANNEL
+            continue
+
+        ttl_channel = np.asarray(ttl_pulses[sync_ttl_id], dtype=np.float64)
+        if mode == "pattern":
+            pulse_match = match_pulse_train(trial_starts[eligible] + sync_rel[eligible], ttl_channel, match_tolerance_s)
+            matched = pulse_match.pulse_indices >= 0
+            ttl_times[eligible[matched]] = ttl_channel[pulse_match.pulse_indices[matched]]
+            status[eligible[~matched]] = _DROPPED_PULSE
+            consumed[sync_ttl_id] = int(matched.sum())
+            extra_pulses[sync_ttl_id] = pulse_match.extra_pulses
+            continue
+
+        n_matched = min(eligible.size, ttl_channel.size)
+        ttl_times[eligible[:n_matched]] = ttl_channel[:n_matched]
+        status[eligible[n_matched:]] = _NO_PULSES
+        consumed[sync_ttl_id] = n_matched
+
+    # Warnings in trial order
+    warnings_list = []
+    for i in np.flatnonzero(status != _ALIGNED):
+        trial_num = int(i) + 1
+        trial_type = int(trial_types[i])
+
+        if status[i] == _UNKNOWN_TYPE:
+            warnings_list.append(f"Trial {trial_num}: trial_type {trial_type} not in session config, skipping")
+            logger.warning(warnings_list[-1])
+        elif status[i] == _NO_SYNC_SIGNAL:
+            warnings_list.append(f"Trial {trial_num}: sync_signal '{trial_type_map[trial_type]['sync_signal']}' not found or not visited, skipping")
+            logger.warning(warnings_list[-1])
+        elif status[i] == _NO_CHANNEL:
+            warnings_list.append(f"Trial {trial_num}: TTL channel '{channel_by_type[trial_type]}' not found in ttl_pulses, skipping")
+            logger.error(warnings_list[-1])
+        elif status[i] == _NO_PULSES:
+            warnings_list.append(f"Trial {trial_num}: No more TTL pulses available for '{channel_by_type[trial_type]}', skipping")
+            logger.warning(warnings_list[-1])
+        else:
+            warnings_list.append(f"Trial {trial_num}: No TTL pulse on '{channel_by_type[trial_type]}' matches the sync time (dropped pulse), skipping")
+            logger.warning(warnings_list[-1])
+
+    aligned = np.flatnonzero(status == _ALIGNED)
+    if aligned.size and trial_starts.size == 0:
+        trial_starts = _column(session_data["TrialStartTimestamp"], n_trials, "TrialStartTimestamp").astype(np.float64)
+
+    # Warn about unused TTL pulses (pattern mode lists which pulses are extra)
+    for ttl_id, n_consumed in consumed.items():
+        unused = len(ttl_pulses[ttl_id]) - n_consumed
+        if unused > 0 and ttl_id in extra_pulses:
+            listed = ", ".join(str(i) for i in extra_pulses[ttl_id][:_MAX_LISTED_PULSES])
+            more = ", ..." if unused > _MAX_LISTED_PULSES else ""
+            warnings_list.append(f"TTL channel '{ttl_id}' has {unused} unused pulses (extra pulse indices: {listed}{more})")
+            logger.warning(warnings_list[-1])
+        elif unused > 0:
+            warnings_list.append(f"TTL channel '{ttl_id}' has {unused} unused pulses")
+            logger.warning(warnings_list[-1])
+
+    return _SyncMatch(n_trials, trial_types, trial_type_map, aligned, trial_starts, sync_rel, ttl_times, warnings_list)
+
+
+# =============================================================================
+# Public API
+# =============================================================================
+
 
 def get_sync_time_from_bpod_trial(trial_data: Dict, sync_signal: str) -> Optional[float]:
     """Extract sync signal start time from Bpod trial.
@@ -68,6 +314,9 @@ def align_bpod_trials_to_ttl(
     trial_type_configs: List[BpodTrialTypeProtocol],
     bpod_data: Dict,
     ttl_pulses: Dict[str, List[float]],
+    *,
+    mode: str = "sequential",
+    match_tolerance_s: Optional[float] = None,
 ) -> Tuple[Dict[int, float], List[str]]:
     """Align Bpod trials to absolute time using TTL sync signals (low-level, Session-free).
 
@@ -78,11 +327,16 @@ def align_bpod_trials_to_ttl(
 
     Algorithm:
     ----------
-    1. For each trial, determine trial_type from Bpod TrialTypes array
+    1. Read trial types for all trials from the Bpod TrialTypes array
     2. Lookup sync configuration from trial_type_configs list
-    3. Extract sync_signal start time (relative to trial start) from States
-    4. Match to next available TTL pulse from corresponding channel
-    5. Compute offset accounting for TrialStartTimestamp:
+    3. Extract sync_signal start times (relative to trial start) from States,
+       one pass per trial type
+    4. Match trials to TTL pulses per channel:
+       - mode="sequential": in trial order (the k-th alignable trial on a
+         channel takes the channel's k-th pulse)
+       - mode="pattern": by timing pattern (sync.match_pulse_train), so a
+         dropped or spurious pulse only affects its own trial
+    5. Compute all offsets at once accounting for TrialStartTimestamp:
        offset = ttl_pulse_time - (TrialStartTimestamp + sync_time_rel)
     6. Return offsets for use: t_abs = offset + TrialStartTimestamp
 
@@ -91,6 +345,8 @@ def align_bpod_trials_to_ttl(
     - Missing sync_signal: Skip trial, record warning
     - Extra TTL pulses: Ignore surplus, log warning
     - Fewer TTL pulses: Align what's possible, mark remaining as unaligned
+    - Dropped pulse (pattern mode): Skip that trial only, record warning
+    - Extra pulses (pattern mode): Ignore, warning lists their indices
     - Jitter: Allow small timing differences, log debug info
 
     Args:
@@ -99,6 +355,9 @@ def align_bpod_trials_to_ttl(
         bpod_data: Parsed Bpod data (SessionData structure from events.parse_bpod)
         ttl_pulses: Dict mapping TTL channel ID to sorted list of absolute timestamps
                     (typically from sync.get_ttl_pulses)
+        mode: Trial ↔ pulse matching, "sequential" (default) or "pattern"
+        match_tolerance_s: Pattern-mode match tolerance (default: a quarter
+                           of the channel's median inter-pulse interval)
 
     Returns:
         Tuple of:
@@ -106,7 +365,7 @@ def align_bpod_trials_to_ttl(
         - warnings: List of warning messages for trials that couldn't be aligned
 
     Raises:
-        SyncError: If trial_type config missing or data structure invalid
+        SyncError: If trial_type config missing, mode unknown or data structure invalid
 
     Example:
         >>> from w2t_bkin.sync import get_ttl_pulses, align_bpod_trials_to_ttl
@@ -134,112 +393,81 @@ def align_bpod_trials_to_ttl(
     Note:
         High-level wrapper available: align_bpod_trials_to_ttl_from_session(session, bpod_data, ttl_pulses)
     """
-    from ..utils import convert_matlab_struct
-
-    # Validate Bpod structure
-    if "SessionData" not in bpod_data:
-        raise SyncError("Invalid Bpod structure: missing SessionData")
-
-    session_data = convert_matlab_struct(bpod_data["SessionData"])
-    n_trials = int(session_data["nTrials"])
-
-    if n_trials == 0:
+    match = _match_sync_pulses(trial_type_configs, bpod_data, ttl_pulses, mode=mode, match_tolerance_s=match_tolerance_s)
+    if match is None:
         logger.info("No trials to align")
         return {}, []
 
-    # Build trial_type → sync config mapping
-    trial_type_map = {}
-    for tt_config in trial_type_configs:
-        trial_type_map[tt_config.trial_type] = {
-            "sync_signal": tt_config.sync_signal,
-            "sync_ttl": tt_config.sync_ttl,
-            "description": tt_config.description,
-        }
-
-    if not trial_type_map:
-        raise SyncError("No trial_type sync configuration provided in trial_type_configs")
-
-    # Prepare TTL pulse pointers (track consumption per channel)
-    ttl_pointers = {ttl_id: 0 for ttl_id in ttl_pulses.keys()}
-
-    # Extract raw trial data
-    raw_events = convert_matlab_struct(session_data["RawEvents"])
-    trial_data_list = raw_events["Trial"]
-
-    # Extract TrialTypes if available
-    from ..utils import to_scalar
-
-    trial_types_array = session_data.get("TrialTypes")
-    if trial_types_array is None:
-        # Default to trial_type 1 for all trials if not specified
-        trial_types_array = [1] * n_trials
-        logger.warning("TrialTypes not found in Bpod data, defaulting all trials to type 1")
-
+    # Compute offsets: absolute_time = offset + TrialStartTimestamp
+    # The sync signal occurs at: trial_start_timestamp + sync_time_rel (in Bpod timeline)
+    # And should align to: ttl_pulse_time (in absolute timeline)
+    # Therefore: offset + (trial_start_timestamp + sync_time_rel) = ttl_pulse_time
+    aligned = match.aligned
     trial_offsets = {}
-    warnings_list = []
+    if aligned.size:
+        offsets = match.ttl_times[aligned] - match.bpod_sync_times
+        trial_offsets = dict(zip((aligned + 1).tolist(), offsets.tolist()))
 
-    for i in range(n_trials):
-        trial_num = i + 1
-        trial_data = convert_matlab_struct(trial_data_list[i])
+        if logger.isEnabledFor(logging.DEBUG):
+            for i, offset_abs in zip(aligned, offsets):
+                logger.debug(
+                    f"Trial {i + 1}: type={match.trial_types[i]}, sync_signal={match.trial_type_map[int(match.trial_types[i])]['sync_signal']}, "
+                    f"trial_start={match.trial_starts[i]:.4f}s, sync_rel={match.sync_rel[i]:.4f}s, "
+                    f"ttl_abs={match.ttl_times[i]:.4f}s, offset={offset_abs:.4f}s"
+                )  # fmt: skip
 
-        # Get trial type (handle numpy arrays)
-        trial_type = int(to_scalar(trial_types_array, i))
+    logger.info(f"Computed offsets for {len(trial_offsets)} out of {match.n_trials} trials using TTL sync")
+    return trial_offsets, match.warnings
 
-        if trial_type not in trial_type_map:
-            warnings_list.append(f"Trial {trial_num}: trial_type {trial_type} not in session config, skipping")
-            logger.warning(warnings_list[-1])
-            continue
 
-        sync_config = trial_type_map[trial_type]
-        sync_signal = sync_config["sync_signal"]
-        sync_ttl_id = sync_config["sync_ttl"]
+def fit_bpod_clock_drift(
+    trial_type_configs: List[BpodTrialTypeProtocol],
+    bpod_data: Dict,
+    ttl_pulses: Dict[str, List[float]],
+    n_segments: int = 1,
+    robust: bool = True,
+    mode: str = "sequential",
+    match_tolerance_s: Optional[float] = None,
+) -> Tuple[ClockDriftModel, List[str]]:
+    """Fit a Bpod → TTL clock drift model from matched sync events.
+
+    Uses the same trial/pulse matching as align_bpod_trials_to_ttl(), then
+    fits one model over all matched pairs (Bpod session time of each sync
+    event vs its TTL pulse time) instead of one offset per trial. The model
+    maps any Bpod session timestamp, including those of trials without a
+    sync event, and its residuals quantify how well a single clock
+    relationship explains the session.
 
-        # Extract sync time from trial (relative to trial start)
-        sync_time_rel = get_sync_time_from_bpod_trial(trial_data, sync_signal)
-        if sync_time_rel is None:
-            warnings_list.append(f"Trial {trial_num}: sync_signal '{sync_signal}' not found or not visited, skipping")
-            logger.warning(warnings_list[-1])
-            continue
+    Args:
+        trial_type_configs: List of trial type sync configurations
+        bpod_data: Parsed Bpod data (SessionData structure from events.parse_bpod)
+        ttl_pulses: Dict mapping TTL channel ID to sorted list of absolute timestamps
+        n_segments: Number of linear segments (1 = single linear drift)
+        robust: Reject outlier pairs (e.g. mismatched pulses) and refit
+        mode: Trial ↔ pulse matching, "sequential" or "pattern"
+        match_tolerance_s: Pattern-mode match tolerance (optional)
 
-        # Get next TTL pulse
-        if sync_ttl_id not in ttl_pulses:
-            warnings_list.append(f"Trial {trial_num}: TTL channel '{sync_ttl_id}' not found in ttl_pulses, skipping")
-            logger.error(warnings_list[-1])
-            continue
+    Returns:
+        Tuple of:
+        - clock_model: ClockDriftModel mapping Bpod session time to TTL time
+        - warnings: Same warnings as align_bpod_trials_to_ttl()
 
-        ttl_channel = ttl_pulses[sync_ttl_id]
-        ttl_ptr = ttl_pointers[sync_ttl_id]
+    Raises:
+        SyncError: Invalid data, or too few matched trials for the fit
 
-        if ttl_ptr >= len(ttl_channel):
-            warnings_list.append(f"Trial {trial_num}: No more TTL pulses available for '{sync_ttl_id}', skipping")
-            logger.warning(warnings_list[-1])
-            continue
+    Example:
+        >>> clock_model, warnings = fit_bpod_clock_drift(trial_configs, bpod_data, ttl_pulses)
+        >>> trials = extract_trials(bpod_data, clock_model=clock_model)
+        >>> stats = create_alignment_stats(..., **clock_model.to_stats())
+    """
+    match = _match_sync_pulses(trial_type_configs, bpod_data, ttl_pulses, mode=mode, match_tolerance_s=match_tolerance_s)
+    if match is None:
+        raise SyncError("Cannot fit clock drift: no trials in Bpod data")
 
-        ttl_pulse_time = ttl_channel[ttl_ptr]
-        ttl_pointers[sync_ttl_id] += 1
-
-        # Get trial start timestamp from Bpod (may be non-zero after merge)
-        trial_start_timestamp = float(to_scalar(session_data["TrialStartTimestamp"], i))
-
-        # Compute offset: absolute_time = offset + TrialStartTimestamp
-        # The sync signal occurs at: trial_start_timestamp + sync_time_rel (in Bpod timeline)
-        # And should align to: ttl_pulse_time (in absolute timeline)
-        # Therefore: offset + (trial_start_timestamp + sync_time_rel) = ttl_pulse_time
-        offset_abs = ttl_pulse_time - (trial_start_timestamp + sync_time_rel)
-        trial_offsets[trial_num] = offset_abs
-
-        logger.debug(
-            f"Trial {trial_num}: type={trial_type}, sync_signal={sync_signal}, "
-            f"trial_start={trial_start_timestamp:.4f}s, sync_rel={sync_time_rel:.4f}s, "
-            f"ttl_abs={ttl_pulse_time:.4f}s, offset={offset_abs:.4f}s"
-        )  # fmt: skip
-
-    # Warn about unused TTL pulses
-    for ttl_id, ptr in ttl_pointers.items():
-        unused = len(ttl_pulses[ttl_id]) - ptr
-        if unused > 0:
-            warnings_list.append(f"TTL channel '{ttl_id}' has {unused} unused pulses")
-            logger.warning(warnings_list[-1])
+    clock_model = fit_clock_drift(match.bpod_sync_times, match.ttl_times[match.aligned], n_segments=n_segments, robust=robust)
 
-    logger.info(f"Computed offsets for {len(trial_offsets)} out of {n_trials} trials using TTL sync")
-    return trial_offsets, warnings_list
+    logger.info(
+        f"Fitted Bpod clock drift from {clock_model.n_points} trials: {clock_model.drift_ppm:.2f} ppm, "
+        f"residual rms={clock_model.residual_rms_s * 1e3:.3f} ms, {clock_model.n_outliers} outliers"
+    )  # fmt: skip
+    return clock_model, match.warnings
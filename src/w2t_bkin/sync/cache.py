@@ -0,0 +1,420 @@
+"""On-disk cache of reference timebases and alignment results.
+
+Reruns that only change NWB metadata repeat the same sync work. Results are
+stored under ``paths.intermediate_root`` keyed by a fingerprint of their
+sources (TTL/Neuropixels files, the files the samples came from and the
+timebase config), so unchanged inputs are loaded instead of recomputed.
+Keys never hash array contents: computing them costs a few file stats,
+not a pass over the samples or a memory-mapped reference.
+
+Each entry is a single ``.npz`` file: arrays are stored natively and the
+remaining (JSON-serializable) values as an embedded JSON document. Hits
+refresh the entry's mtime and the least recently used entries are evicted
+once the cache grows beyond its size limit.
+
+Source files are fingerprinted by resolved path, size and mtime (the same
+fast check as the TTL sidecar cache), so touching or replacing a file
+invalidates every entry derived from it.
+
+Example:
+    >>> cache = AlignmentCache(Path(config.paths.intermediate_root) / ALIGNMENT_CACHE_DIRNAME)
+    >>> reference = cache.get_timebase(config, manifest, n_samples=max_frames, ttl_cache_dir=ttl_cache_dir)
+    >>> reference_key = cache.timebase_key(config, manifest, n_samples=max_frames)
+    >>> sample_key = fingerprint_inputs("frames", camera_ttl_files, frame_count)
+    >>> result = cache.align_samples(frame_times, reference, config.timebase, sample_key=sample_key, reference_key=reference_key)
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import threading
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+from ..exceptions import SyncError
+from .mapping import ReferenceLike, align_modalities, align_samples, enforce_jitter_budget
+from .protocols import TimebaseConfigProtocol
+from .reference import ReferenceTimebase, UniformTimebase
+from .timebase import _find_neuropixels_bin, create_timebase_provider_from_config
+
+__all__ = ["ALIGNMENT_CACHE_DIRNAME", "DEFAULT_CACHE_MAX_BYTES", "AlignmentCache", "fingerprint_inputs"]
+
+logger = logging.getLogger(__name__)
+
+# Default cache subdirectory under paths.intermediate_root
+ALIGNMENT_CACHE_DIRNAME = "alignment_cache"
+
+# Cache size above which least recently used entries are evicted
+DEFAULT_CACHE_MAX_BYTES = 1 << 30
+
+# Bump when the entry layout or the cached computations change
+_CACHE_VERSION = 1
+
+# Config attributes that affect timebase and alignment results
+_CONFIG_FIELDS = ("source", "mapping", "jitter_budget_s", "offset_s", "ttl_id", "neuropixels_stream")
+
+# JSON marker for values stored as npz arrays
+_ARRAY_MARKER = "__array__"
+_META_KEY = "__meta__"
+
+
+# =============================================================================
+# Fingerprints
+# =============================================================================
+
+
+def _update_fingerprint(digest, value: Any) -> None:
+    """Feed one input into the digest, tagged by type so values cannot collide."""
+    if isinstance(value, UniformTimebase):
+        digest.update(f"uniform:{value.rate!r}:{len(value)}:{value.offset_s!r};".encode("utf-8"))
+    elif isinstance(value, (ReferenceTimebase, np.ndarray)):
+        array = np.ascontiguousarray(np.asarray(value))
+        digest.update(f"array:{array.dtype.str}:{array.shape};".encode("utf-8"))
+        digest.update(memoryview(array).cast("B"))
+    elif isinstance(value, Path):
+        stat = value.stat()
+        digest.update(f"file:{value.resolve()}:{stat.st_size}:{stat.st_mtime_ns};".encode("utf-8"))
+    elif isinstance(value, Mapping):
+        digest.update(f"dict:{len(value)};".encode("utf-8"))
+        for key in sorted(value):
+            _update_fingerprint(digest, str(key))
+            _update_fingerprint(digest, value[key])
+    elif isinstance(value, (list, tuple)):
+        digest.update(f"seq:{len(value)};".encode("utf-8"))
+        for item in value:
+            _update_fingerprint(digest, item)
+    else:
+        digest.update(f"{type(value).__name__}:{value!r};".encode("utf-8"))
+
+
+def fingerprint_inputs(*inputs: Any) -> str:
+    """Deterministic SHA256 fingerprint of alignment inputs.
+
+    Arrays are hashed by content (dtype, shape and bytes), UniformTimebase
+    by its parameters, Paths by resolved path, size and mtime, and mappings
+    and sequences recursively. Other values are hashed by their repr.
+
+    Args:
+        *inputs: Arrays, reference timebases, Paths, dicts, lists or scalars
+
+    Returns:
+        Hex digest
+
+    Raises:
+        SyncError: A Path input does not exist
+
+    Example:
+        >>> fingerprint_inputs(np.arange(3.0), {"mapping": "nearest"}) == fingerprint_inputs(np.arange(3.0), {"mapping": "nearest"})
+        True
+    """
+    digest = hashlib.sha256(f"w2t-alignment-cache:{_CACHE_VERSION};".encode("utf-8"))
+    try:
+        for value in inputs:
+            _update_fingerprint(digest, value)
+    except FileNotFoundError as e:
+        raise SyncError(f"Cannot fingerprint missing file: {e.filename}")
+    return digest.hexdigest()
+
+
+def _config_fingerprint(config: TimebaseConfigProtocol) -> Dict[str, Any]:
+    """Result-affecting timebase config attributes (missing ones as None)."""
+    return {field: getattr(config, field, None) for field in _CONFIG_FIELDS}
+
+
+# =============================================================================
+# Entry Serialization
+# =============================================================================
+
+
+def _split_arrays(value: Any, path: str, arrays: Dict[str, np.ndarray]) -> Any:
+    """Move arrays out of a nested result into ``arrays``, leaving JSON markers."""
+    if isinstance(value, (np.ndarray, ReferenceTimebase)):
+        arrays[path] = np.asarray(value)
+        return {_ARRAY_MARKER: path}
+    if isinstance(value, dict):
+        return {key: _split_arrays(item, f"{path}/{key}" if path else str(key), arrays) for key, item in value.items()}
+    return value
+
+
+def _join_arrays(value: Any, arrays: Mapping[str, np.ndarray]) -> Any:
+    """Inverse of _split_arrays()."""
+    if isinstance(value, dict):
+        if set(value) == {_ARRAY_MARKER}:
+            return arrays[value[_ARRAY_MARKER]]
+        return {key: _join_arrays(item, arrays) for key, item in value.items()}
+    return value
+
+
+# =============================================================================
+# Cache
+# =============================================================================
+
+
+class AlignmentCache:
+    """Size-bounded LRU cache of sync results in a directory.
+
+    Args:
+        cache_dir: Cache directory (created on first write)
+        max_bytes: Total entry size above which the least recently used
+                   entries are evicted
+
+    Example:
+        >>> cache = AlignmentCache(intermediate_root / ALIGNMENT_CACHE_DIRNAME, max_bytes=256 << 20)
+        >>> result = cache.align_samples(pose_times, reference, config.timebase, sample_key=pose_key, reference_key=reference_key)
+        >>> cache.size_bytes()
+    """
+
+    def __init__(self, cache_dir: Union[str, Path], max_bytes: int = DEFAULT_CACHE_MAX_BYTES):
+        if max_bytes <= 0:
+            raise SyncError(f"max_bytes must be positive, got {max_bytes}")
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = int(max_bytes)
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.npz"
+
+    def _entries(self) -> List[Path]:
+        return list(self.cache_dir.glob("*.npz")) if self.cache_dir.exists() else []
+
+    def size_bytes(self) -> int:
+        """Total size of cached entries in bytes."""
+        return sum(path.stat().st_size for path in self._entries())
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a cached result, or None on a miss.
+
+        Unreadable entries are logged, removed and treated as misses.
+        """
+        path = self._entry_path(key)
+        if not path.exists():
+            return None
+
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                arrays = {name: data[name] for name in data.files}
+            meta = json.loads(str(arrays.pop(_META_KEY)))
+        except Exception as e:
+            logger.warning(f"Discarding unreadable alignment cache entry {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+        # Mark as recently used for eviction
+        os.utime(path)
+        return _join_arrays(meta, arrays)
+
+    def store(self, key: str, result: Dict[str, Any]) -> None:
+        """Write a result (arrays plus JSON-serializable values), then evict.
+
+        Args:
+            key: Entry key (usually from fingerprint_inputs())
+            result: Nested dict of arrays and JSON-serializable values
+        """
+        arrays: Dict[str, np.ndarray] = {}
+        meta = _split_arrays(result, "", arrays)
+        if _META_KEY in arrays:
+            raise SyncError(f"Result key '{_META_KEY}' is reserved by the alignment cache")
+        arrays[_META_KEY] = np.array(json.dumps(meta))
+
+        path = self._entry_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+        with open(tmp_path, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, path)
+
+        self.evict(keep=path)
+
+    def evict(self, keep: Optional[Path] = None) -> int:
+        """Remove least recently used entries until the cache fits max_bytes.
+
+        Args:
+            keep: Entry never evicted (e.g. the one just written)
+
+        Returns:
+            Number of entries removed
+        """
+        entries = [(path.stat(), path) for path in self._entries()]
+        total = sum(stat.st_size for stat, _ in entries)
+
+        removed = 0
+        for stat, path in sorted(entries, key=lambda entry: entry[0].st_mtime_ns):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            path.unlink(missing_ok=True)
+            total -= stat.st_size
+            removed += 1
+
+        if removed:
+            logger.debug(f"Evicted {removed} alignment cache entries from {self.cache_dir}")
+        return removed
+
+    def get_or_compute(self, key: str, compute: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """Load the entry for ``key`` or compute and store it.
+
+        Cache write failures are logged; the computed result is still returned.
+        """
+        cached = self.load(key)
+        if cached is not None:
+            logger.debug(f"Loaded alignment result {key[:12]} from cache")
+            return cached
+
+        result = compute()
+        try:
+            self.store(key, result)
+        except Exception as e:
+            logger.warning(f"Failed to write alignment cache entry {key[:12]}: {e}")
+        return result
+
+    def _get_or_align(self, name: str, sample_key: Optional[str], reference_key: Optional[str], config: TimebaseConfigProtocol, compute: Callable[[], Dict]) -> Dict:
+        """Cached alignment keyed by sample and reference sources (computed directly without both keys)."""
+        if sample_key is None or reference_key is None:
+            return compute()
+        return self.get_or_compute(fingerprint_inputs(name, sample_key, reference_key, _config_fingerprint(config)), compute)
+
+    def align_samples(
+        self,
+        sample_times: Union[Sequence[float], np.ndarray],
+        reference_times: ReferenceLike,
+        config: TimebaseConfigProtocol,
+        enforce_budget: bool = False,
+        *,
+        sample_key: Optional[str] = None,
+        reference_key: Optional[str] = None,
+    ) -> Dict:
+        """Cached align_samples(); the budget is enforced on cached results too.
+
+        The entry is keyed by the caller's source fingerprints, never by the
+        array contents. Without both keys the alignment is not cached.
+
+        Args:
+            sample_times: Sample timestamps
+            reference_times: Reference timebase
+            config: Timebase configuration with mapping strategy and jitter budget
+            enforce_budget: Whether to enforce jitter budget (raises on exceed)
+            sample_key: Fingerprint of what the samples were derived from
+                        (e.g. fingerprint_inputs() of their source files)
+            reference_key: Fingerprint of the reference (see timebase_key)
+
+        Returns:
+            Same dictionary as align_samples()
+        """
+        result = self._get_or_align("align_samples", sample_key, reference_key, config, lambda: align_samples(sample_times, reference_times, config))
+
+        if enforce_budget:
+            enforce_jitter_budget(result["jitter_stats"]["max_jitter_s"], result["jitter_stats"]["p95_jitter_s"], config.jitter_budget_s)
+        return result
+
+    def align_modalities(
+        self,
+        modality_times: Mapping[str, Union[Sequence[float], np.ndarray]],
+        reference_times: ReferenceLike,
+        config: TimebaseConfigProtocol,
+        enforce_budget: bool = False,
+        max_workers: int = 1,
+        *,
+        sample_key: Optional[str] = None,
+        reference_key: Optional[str] = None,
+    ) -> Dict:
+        """Cached align_modalities(); the budget is enforced on cached results too.
+
+        Args:
+            modality_times: Dict modality name → sample times
+            reference_times: Shared reference timebase
+            config: Timebase configuration with mapping strategy and jitter budget
+            enforce_budget: Enforce the jitter budget per modality (raises on exceed)
+            max_workers: Threads aligning contiguous chunks on a miss
+            sample_key: Fingerprint of what all modalities were derived from
+            reference_key: Fingerprint of the reference (see timebase_key)
+
+        Returns:
+            Same dictionary as align_modalities()
+        """
+        result = self._get_or_align(
+            "align_modalities",
+            sample_key,
+            reference_key,
+            config,
+            lambda: align_modalities(modality_times, reference_times, config, max_workers=max_workers),
+        )
+
+        if enforce_budget:
+            for modality in result["modalities"].values():
+                enforce_jitter_budget(modality["jitter_stats"]["max_jitter_s"], modality["jitter_stats"]["p95_jitter_s"], config.jitter_budget_s)
+        return result
+
+    def timebase_key(self, config, manifest: Optional[Any] = None, n_samples: Optional[int] = None) -> Optional[str]:
+        """Fingerprint of the reference timebase's sources and config.
+
+        Costs one stat per source file. Used to key the timebase itself and,
+        as ``reference_key``, the alignments against it.
+
+        Args:
+            config: Pipeline configuration with timebase settings
+            manifest: Session manifest (see create_timebase_provider_from_config)
+            n_samples: Number of samples (passed to get_timebase())
+
+        Returns:
+            Hex key, or None if a TTL source has no files or a Neuropixels
+            source has no manifest (stub timestamps)
+        """
+        timebase_config = config.timebase
+        if timebase_config.source == "nominal_rate":
+            sources = ["nominal_rate"]
+        elif timebase_config.source == "ttl":
+            sources = [Path(f) for ttl in (manifest.ttls if manifest else []) if ttl.ttl_id == timebase_config.ttl_id for f in ttl.files]
+        else:
+            # Edges depend on the .meta too (sample rate, channel count)
+            bin_path = _find_neuropixels_bin(config, manifest, timebase_config.neuropixels_stream)
+            meta_path = bin_path.with_suffix(".meta") if bin_path else None
+            sources = [path for path in (bin_path, meta_path) if path is not None and path.exists()]
+
+        if not sources:
+            return None
+        return fingerprint_inputs("timebase", _config_fingerprint(timebase_config), sources, n_samples)
+
+    def get_timebase(
+        self,
+        config,
+        manifest: Optional[Any] = None,
+        n_samples: Optional[int] = None,
+        ttl_cache_dir: Optional[Path] = None,
+        ttl_max_workers: int = 1,
+    ) -> ReferenceTimebase:
+        """Cached reference timebase from Config and Manifest.
+
+        Nominal-rate timebases are closed-form and never cached. TTL and
+        Neuropixels timebases are keyed by their source files, so a changed
+        TTL, ``.bin`` or ``.meta`` file is reloaded.
+
+        Args:
+            config: Pipeline configuration with timebase settings
+            manifest: Session manifest (see create_timebase_provider_from_config)
+            n_samples: Number of samples (passed to get_timebase())
+            ttl_cache_dir: TTL sidecar cache directory (optional)
+            ttl_max_workers: Threads loading TTL files concurrently on a miss
+
+        Returns:
+            Verified ReferenceTimebase
+
+        Raises:
+            SyncError: If the timebase cannot be created
+        """
+
+        def compute() -> Dict[str, Any]:
+            provider = create_timebase_provider_from_config(config, manifest, ttl_cache_dir=ttl_cache_dir, ttl_max_workers=ttl_max_workers)
+            return {"timestamps": provider.get_timebase(n_samples).times}
+
+        if config.timebase.source == "nominal_rate":
+            return create_timebase_provider_from_config(config, manifest).get_timebase(n_samples)
+
+        key = self.timebase_key(config, manifest, n_samples)
+        if key is None:
+            # Nothing to key on; let the provider raise its usual error
+            return create_timebase_provider_from_config(config, manifest, ttl_cache_dir=ttl_cache_dir, ttl_max_workers=ttl_max_workers).get_timebase(n_samples)
+
+        return ReferenceTimebase(self.get_or_compute(key, compute)["timestamps"]).validate()
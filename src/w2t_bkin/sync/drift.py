@@ -0,0 +1,182 @@
+"""Clock drift models between two timelines (e.g. Bpod → TTL).
+
+Fits a continuous piecewise-linear map from a source clock to a reference
+clock with one least-squares solve over a hinge basis, optionally refitted
+after rejecting outliers (robust mode). The fitted model maps any source
+timestamp in O(1), including timestamps from trials that had no sync event.
+
+Example:
+    >>> model = fit_clock_drift(bpod_sync_times, ttl_times, n_segments=4)
+    >>> model.map(bpod_event_times)  # TTL timeline
+    >>> model.drift_ppm, model.residual_rms_s
+"""
+
+from typing import Dict, List, Sequence, Union
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from ..exceptions import SyncError
+
+__all__ = ["ClockDriftModel", "fit_clock_drift"]
+
+# Residuals beyond this many robust standard deviations are outliers
+DEFAULT_OUTLIER_THRESHOLD = 5.0
+
+# Residual tolerance below which points are never rejected (float noise)
+_RESIDUAL_FLOOR_S = 1e-9
+
+# Refit iterations in robust mode
+_MAX_ROBUST_ITERATIONS = 10
+
+# MAD → standard deviation for normally distributed residuals
+_MAD_TO_SIGMA = 1.4826
+
+
+class ClockDriftModel(BaseModel):
+    """Continuous piecewise-linear map from a source clock to a reference clock.
+
+    ``map(t) = intercept + slope * t + sum_j hinge_slopes[j] * max(0, t - knots_s[j])``
+
+    Attributes:
+        intercept_s: Reference time at source time 0
+        slope: Reference seconds per source second on the first segment
+        knots_s: Interior breakpoints in source time (empty for a single line)
+        hinge_slopes: Slope change at each knot
+        n_points: Matched points used for the final fit
+        n_outliers: Points rejected by the robust fit
+        residual_rms_s: RMS residual of inliers (seconds)
+        residual_max_s: Maximum absolute residual of inliers (seconds)
+
+    Example:
+        >>> model = ClockDriftModel(intercept_s=4.0, slope=1.00001, n_points=100, residual_rms_s=0.0, residual_max_s=0.0)
+        >>> model.map(10.0)
+        14.0001
+    """
+
+    model_config = {"frozen": True, "extra": "forbid"}
+
+    intercept_s: float = Field(..., description="Reference time at source time 0")
+    slope: float = Field(..., description="Reference seconds per source second (first segment)")
+    knots_s: List[float] = Field(default_factory=list, description="Interior breakpoints in source time")
+    hinge_slopes: List[float] = Field(default_factory=list, description="Slope change at each knot")
+    n_points: int = Field(..., description="Matched points used for the final fit", ge=0)
+    n_outliers: int = Field(default=0, description="Points rejected by the robust fit", ge=0)
+    residual_rms_s: float = Field(..., description="RMS residual of inliers in seconds", ge=0)
+    residual_max_s: float = Field(..., description="Maximum absolute residual of inliers in seconds", ge=0)
+
+    @property
+    def drift_ppm(self) -> float:
+        """Clock rate difference on the first segment in parts per million."""
+        return (self.slope - 1.0) * 1e6
+
+    def map(self, times: Union[float, Sequence[float], np.ndarray]) -> Union[float, np.ndarray]:
+        """Map source-clock times to the reference clock.
+
+        Args:
+            times: Source timestamp(s) in seconds
+
+        Returns:
+            Reference timestamp(s); a float for scalar input, else float64 array
+        """
+        t = np.asarray(times, dtype=np.float64)
+        mapped = self.intercept_s + self.slope * t
+        for knot, hinge_slope in zip(self.knots_s, self.hinge_slopes):
+            mapped = mapped + hinge_slope * np.maximum(t - knot, 0.0)
+
+        return float(mapped) if mapped.ndim == 0 else mapped
+
+    def to_stats(self) -> Dict[str, float]:
+        """Drift fields for create_alignment_stats().
+
+        Returns:
+            Dict with drift_ppm, drift_residual_rms_s and drift_residual_max_s
+        """
+        return {
+            "drift_ppm": self.drift_ppm,
+            "drift_residual_rms_s": self.residual_rms_s,
+            "drift_residual_max_s": self.residual_max_s,
+        }
+
+
+def _design_matrix(t: np.ndarray, t0: float, knots: np.ndarray) -> np.ndarray:
+    """Hinge basis [1, t - t0, max(0, t - k_j)...] (centred for conditioning)."""
+    columns = [np.ones_like(t), t - t0]
+    columns.extend(np.maximum(t - knot, 0.0) for knot in knots)
+    return np.column_stack(columns)
+
+
+def fit_clock_drift(
+    source_times: Union[Sequence[float], np.ndarray],
+    reference_times: Union[Sequence[float], np.ndarray],
+    n_segments: int = 1,
+    robust: bool = True,
+    outlier_threshold: float = DEFAULT_OUTLIER_THRESHOLD,
+) -> ClockDriftModel:
+    """Fit a clock drift model from matched source/reference timestamps.
+
+    All segments are solved together in one ``np.linalg.lstsq`` call; knots
+    sit at quantiles of the source times, so segments hold similar numbers of
+    points. In robust mode, points whose residual exceeds
+    ``outlier_threshold`` robust standard deviations (from the MAD) are
+    dropped and the model is refitted until the inlier set is stable.
+
+    Args:
+        source_times: Event times on the source clock (e.g. Bpod sync states)
+        reference_times: Matched times on the reference clock (e.g. TTL pulses)
+        n_segments: Number of linear segments (1 = single linear drift)
+        robust: Reject outliers and refit
+        outlier_threshold: Outlier cutoff in robust standard deviations
+
+    Returns:
+        Fitted ClockDriftModel
+
+    Raises:
+        SyncError: Mismatched lengths or too few points for the segment count
+
+    Example:
+        >>> model = fit_clock_drift([0.0, 10.0, 20.0], [4.0, 14.0001, 24.0002])
+        >>> round(model.drift_ppm)
+        10
+    """
+    source = np.asarray(source_times, dtype=np.float64).ravel()
+    reference = np.asarray(reference_times, dtype=np.float64).ravel()
+
+    if source.size != reference.size:
+        raise SyncError(f"Cannot fit clock drift: {source.size} source times vs {reference.size} reference times")
+    if n_segments < 1:
+        raise SyncError(f"n_segments must be >= 1, got {n_segments}")
+    if source.size < n_segments + 1:
+        raise SyncError(f"Cannot fit clock drift with {n_segments} segment(s) from {source.size} matched point(s)")
+
+    knots = np.unique(np.quantile(source, np.arange(1, n_segments) / n_segments)) if n_segments > 1 else np.empty(0)
+    t0 = float(np.median(source))
+    design = _design_matrix(source, t0, knots)
+
+    inliers = np.ones(source.size, dtype=bool)
+    for _ in range(_MAX_ROBUST_ITERATIONS if robust else 1):
+        coefficients, *_ = np.linalg.lstsq(design[inliers], reference[inliers], rcond=None)
+        residuals = reference - design @ coefficients
+
+        if not robust:
+            break
+
+        sigma = _MAD_TO_SIGMA * np.median(np.abs(residuals[inliers] - np.median(residuals[inliers])))
+        updated = np.abs(residuals) <= max(outlier_threshold * sigma, _RESIDUAL_FLOOR_S)
+        if updated.sum() < design.shape[1] or np.array_equal(updated, inliers):
+            break
+        inliers = updated
+
+    inlier_residuals = residuals[inliers]
+    intercept, slope = coefficients[0] - coefficients[1] * t0, coefficients[1]
+
+    return ClockDriftModel(
+        intercept_s=float(intercept),
+        slope=float(slope),
+        knots_s=knots.tolist(),
+        hinge_slopes=coefficients[2:].tolist(),
+        n_points=int(inliers.sum()),
+        n_outliers=int(source.size - inliers.sum()),
+        residual_rms_s=float(np.sqrt(np.mean(inlier_residuals**2))),
+        residual_max_s=float(np.max(np.abs(inlier_residuals))),
+    )
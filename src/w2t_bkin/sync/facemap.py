@@ -32,6 +32,7 @@ def sync_facemap_to_timebase(
 
     Returns:
         Dict with indices, facemap_times_aligned, jitter_stats, and mapping
+        (ndarrays as returned by align_samples)
 
     Raises:
         JitterBudgetExceeded: Jitter exceeds budget
@@ -47,25 +48,10 @@ def sync_facemap_to_timebase(
     # Perform alignment using generic strategy
     result = align_samples(facemap_times, reference_times, config, enforce_budget)
 
-    indices = result["indices"]
-
-    # Extract aligned timestamps from reference
-    if config.mapping == "nearest":
-        # Simple indexing for nearest neighbor
-        facemap_times_aligned = [reference_times[idx] for idx in indices]
-    elif config.mapping == "linear":
-        # Weighted average for linear interpolation
-        facemap_times_aligned = []
-        weights = result.get("weights", [])
-        for (idx0, idx1), (w0, w1) in zip(indices, weights):
-            t_aligned = w0 * reference_times[idx0] + w1 * reference_times[idx1]
-            facemap_times_aligned.append(t_aligned)
-    else:
-        # Fallback: use nearest
-        facemap_times_aligned = [reference_times[indices[0]] for _ in facemap_times]
+    facemap_times_aligned = result["aligned_times"]
 
     return {
-        "indices": indices,
+        "indices": result["indices"],
         "facemap_times_aligned": facemap_times_aligned,
         "jitter_stats": result["jitter_stats"],
         "mapping": result["mapping"],
@@ -0,0 +1,179 @@
+"""Detect dropped and duplicated frames from camera TTL pulse trains.
+
+Each camera exposure emits one TTL pulse, so inter-pulse intervals should
+be one nominal frame period. In one vectorized pass over ``np.diff``:
+
+- an interval of ~k periods (k >= 2) means k - 1 frames were dropped;
+- an interval of at most half a period means one of its two pulses is
+  spurious: the one whose removal leaves the surrounding intervals closest
+  to whole periods is the duplicate (the later one on a tie);
+- an interval far from any whole number of periods is irregular (QC only).
+
+The report maps every genuine frame to its pulse and to its nominal frame
+slot, so dropped slots can be filled and duplicates skipped.
+
+Example:
+    >>> report = detect_frame_drops(camera_pulses, nominal_period_s=1 / 30)
+    >>> report.n_dropped, report.n_duplicates
+    (3, 1)
+    >>> frame_times = camera_pulses[report.frame_to_pulse]
+"""
+
+from typing import NamedTuple, Optional, Sequence, Union
+
+import numpy as np
+
+from ..exceptions import SyncError
+
+__all__ = ["FrameDropReport", "detect_frame_drops"]
+
+# Maximum |interval / period - k| for an interval to count as k whole periods
+DEFAULT_PERIOD_TOLERANCE = 0.25
+
+
+class FrameDropReport(NamedTuple):
+    """Result of detect_frame_drops().
+
+    Attributes:
+        period_s: Frame period used (nominal or median interval)
+        gap_after: Pulse indices followed by dropped frames
+        gap_sizes: Number of dropped frames after each gap_after pulse
+        duplicates: Indices of duplicate pulses (excluded from frames)
+        irregular: Indices of intervals that are not a whole number of periods
+        frame_to_pulse: Pulse index of each genuine frame
+        frame_slots: Nominal frame slot of each genuine frame (gaps skipped)
+    """
+
+    period_s: float
+    gap_after: np.ndarray
+    gap_sizes: np.ndarray
+    duplicates: np.ndarray
+    irregular: np.ndarray
+    frame_to_pulse: np.ndarray
+    frame_slots: np.ndarray
+
+    @property
+    def n_dropped(self) -> int:
+        """Total number of dropped frames."""
+        return int(self.gap_sizes.sum())
+
+    @property
+    def n_duplicates(self) -> int:
+        """Total number of duplicate pulses."""
+        return int(self.duplicates.size)
+
+    @property
+    def n_slots(self) -> int:
+        """Number of nominal frame slots (genuine plus dropped frames)."""
+        return int(self.frame_slots[-1]) + 1 if self.frame_slots.size else 0
+
+    def slot_times(self, pulse_times: Union[Sequence[float], np.ndarray]) -> np.ndarray:
+        """Timestamp per nominal frame slot, interpolating dropped slots.
+
+        Args:
+            pulse_times: The pulse times this report was computed from
+
+        Returns:
+            float64 array of length n_slots
+        """
+        frame_times = np.asarray(pulse_times, dtype=np.float64)[self.frame_to_pulse]
+        return np.interp(np.arange(self.n_slots), self.frame_slots, frame_times)
+
+
+def detect_frame_drops(
+    pulse_times: Union[Sequence[float], np.ndarray],
+    nominal_period_s: Optional[float] = None,
+    tolerance: float = DEFAULT_PERIOD_TOLERANCE,
+) -> FrameDropReport:
+    """Locate dropped and duplicated frames in a camera TTL pulse train.
+
+    Args:
+        pulse_times: Sorted camera TTL pulse times in seconds
+        nominal_period_s: Frame period (default: median inter-pulse interval)
+        tolerance: Maximum deviation from a whole number of periods, as a
+                   fraction of the period, for an interval to be regular
+
+    Returns:
+        FrameDropReport with gap/duplicate locations and the frame map
+
+    Raises:
+        SyncError: Non-positive period or tolerance outside (0, 0.5)
+
+    Example:
+        >>> report = detect_frame_drops([0.0, 1.0, 3.0, 3.01, 4.0], nominal_period_s=1.0)
+        >>> report.gap_after, report.gap_sizes, report.duplicates
+        (array([1]), array([1]), array([3]))
+        >>> report.frame_slots
+        array([0, 1, 3, 4])
+    """
+    pulses = np.asarray(pulse_times, dtype=np.float64).ravel()
+    if not 0 < tolerance < 0.5:
+        raise SyncError(f"tolerance must be in (0, 0.5), got {tolerance}")
+
+    intervals = np.diff(pulses)
+    if nominal_period_s is None:
+        nominal_period_s = float(np.median(intervals)) if intervals.size else 0.0
+    if intervals.size and nominal_period_s <= 0:
+        raise SyncError(f"Frame period must be positive, got {nominal_period_s}")
+
+    periods = intervals / nominal_period_s if intervals.size else intervals
+    is_duplicate = _find_duplicates(pulses, nominal_period_s) if intervals.size else np.zeros(pulses.size, dtype=bool)
+
+    # Genuine frames are more than half a period apart, so every step is >= 1
+    frame_to_pulse = np.flatnonzero(~is_duplicate)
+    steps = np.rint(np.diff(pulses[frame_to_pulse]) / nominal_period_s).astype(np.int64) if frame_to_pulse.size > 1 else np.empty(0, dtype=np.int64)
+    gaps = np.flatnonzero(steps >= 2)
+    frame_slots = np.concatenate([[0], np.cumsum(steps)]) if pulses.size else np.empty(0, dtype=np.int64)
+
+    return FrameDropReport(
+        period_s=float(nominal_period_s),
+        gap_after=frame_to_pulse[gaps],
+        gap_sizes=steps[gaps] - 1,
+        duplicates=np.flatnonzero(is_duplicate),
+        irregular=np.flatnonzero(np.abs(periods - np.rint(periods)) > tolerance),
+        frame_to_pulse=frame_to_pulse,
+        frame_slots=frame_slots,
+    )
+
+
+def _interval_cost(interval: float, period: float) -> float:
+    """Distance of an interval from the nearest whole number (>= 1) of periods."""
+    periods = interval / period
+    return abs(periods - max(round(periods), 1))
+
+
+def _find_duplicates(pulses: np.ndarray, period: float) -> np.ndarray:
+    """Mark one pulse of every interval of at most half a period as duplicate.
+
+    Only these short intervals are visited. For each, the pulse kept is the
+    one that leaves the intervals to its kept neighbours closest to whole
+    periods, so a spurious pulse half a period after a frame does not
+    displace the next genuine frame pulse. Passes repeat until no short
+    interval remains between kept pulses (bursts of several pulses).
+    """
+    keep = np.ones(pulses.size, dtype=bool)
+
+    while True:
+        kept = np.flatnonzero(keep)
+        short = np.flatnonzero(np.diff(pulses[kept]) <= 0.5 * period)
+        if not short.size:
+            return ~keep
+
+        for j in short:
+            before = kept[j - 1] if j > 0 else None
+            first, second = kept[j], kept[j + 1]
+            after = kept[j + 2] if j + 2 < kept.size else None
+
+            # Neighbours already resolved in this pass are revisited in the next one
+            if not (keep[first] and keep[second]) or (before is not None and not keep[before]):
+                continue
+
+            cost_keep_first = cost_keep_second = 0.0
+            if before is not None:
+                cost_keep_first += _interval_cost(pulses[first] - pulses[before], period)
+                cost_keep_second += _interval_cost(pulses[second] - pulses[before], period)
+            if after is not None:
+                cost_keep_first += _interval_cost(pulses[after] - pulses[first], period)
+                cost_keep_second += _interval_cost(pulses[after] - pulses[second], period)
+
+            keep[first if cost_keep_second < cost_keep_first else second] = False
@@ -0,0 +1,191 @@
+"""Jitter summaries: exact (in-memory) and streaming (chunked).
+
+Exact summaries are computed with a single ``np.percentile`` call over the
+jitter array. The streaming estimator keeps a fixed log-spaced histogram
+(100 bins per decade between 1 ns and 1000 s), so p95/p99/median can be
+reported with ~1% relative error for sessions that never fit in memory,
+while max and counts stay exact.
+
+Example:
+    >>> stats = StreamingJitterStats()
+    >>> for samples, indices in chunks:
+    ...     stats.update(samples, reference, indices)
+    >>> summary = stats.summary()
+    >>> summary["p95_jitter_s"]
+"""
+
+from typing import Dict, Sequence, Union
+
+import numpy as np
+
+__all__ = ["JITTER_HISTOGRAM_EDGES_S", "StreamingJitterStats", "summarize_jitter"]
+
+# Reported histogram edges in seconds (decades); values beyond the last edge
+# are counted in the last bin
+JITTER_HISTOGRAM_EDGES_S = (0.0, 1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0, 1000.0)
+
+# Streaming sketch resolution: log-spaced bins between these bounds
+_SKETCH_MIN_S = 1e-9
+_SKETCH_MAX_S = 1e3
+_SKETCH_BINS_PER_DECADE = 100
+
+
+def _empty_summary() -> Dict:
+    """Summary for an empty jitter set."""
+    return {
+        "max_jitter_s": 0.0,
+        "p95_jitter_s": 0.0,
+        "median_jitter_s": 0.0,
+        "p99_jitter_s": 0.0,
+        "jitter_histogram_edges_s": list(JITTER_HISTOGRAM_EDGES_S),
+        "jitter_histogram_counts": [0] * (len(JITTER_HISTOGRAM_EDGES_S) - 1),
+    }
+
+
+def summarize_jitter(jitter: Union[Sequence[float], np.ndarray]) -> Dict:
+    """Summarize absolute jitter values exactly.
+
+    Args:
+        jitter: Absolute jitter values in seconds
+
+    Returns:
+        Dict with max_jitter_s, p95_jitter_s, median_jitter_s, p99_jitter_s,
+        jitter_histogram_edges_s and jitter_histogram_counts
+
+    Example:
+        >>> summarize_jitter(np.abs(samples - reference[indices]))["p95_jitter_s"]
+    """
+    jitter = np.asarray(jitter, dtype=np.float64).ravel()
+    if jitter.size == 0:
+        return _empty_summary()
+
+    # One partition pass for all order statistics (100th percentile == max)
+    median, p95, p99, maximum = np.percentile(jitter, [50, 95, 99, 100])
+    edges = np.asarray(JITTER_HISTOGRAM_EDGES_S)
+    counts, _ = np.histogram(np.clip(jitter, edges[0], edges[-1]), bins=edges)
+
+    return {
+        "max_jitter_s": float(maximum),
+        "p95_jitter_s": float(p95),
+        "median_jitter_s": float(median),
+        "p99_jitter_s": float(p99),
+        "jitter_histogram_edges_s": edges.tolist(),
+        "jitter_histogram_counts": counts.tolist(),
+    }
+
+
+class StreamingJitterStats:
+    """Bounded-memory jitter statistics over chunked alignment results.
+
+    Keeps an exact count and maximum plus a log-spaced histogram sketch, from
+    which quantiles are interpolated. Memory use is constant (~1200 bins)
+    regardless of how many samples are consumed.
+
+    Example:
+        >>> stats = StreamingJitterStats()
+        >>> stats.update_jitter(np.array([0.001, 0.002]))
+        >>> stats.summary()["max_jitter_s"]
+        0.002
+    """
+
+    def __init__(self):
+        """Initialize an empty estimator."""
+        n_decades = int(round(np.log10(_SKETCH_MAX_S / _SKETCH_MIN_S)))
+        exponents = np.arange(n_decades * _SKETCH_BINS_PER_DECADE + 1) / _SKETCH_BINS_PER_DECADE
+        # Bin 0 holds [0, 1 ns); the last bin also absorbs values >= 1000 s
+        self._edges = np.concatenate([[0.0], _SKETCH_MIN_S * 10.0**exponents])
+        self._counts = np.zeros(self._edges.size - 1, dtype=np.int64)
+        self.count = 0
+        self.max_jitter_s = 0.0
+
+    def update(self, sample_times: Union[Sequence[float], np.ndarray], reference_times: Union[Sequence[float], np.ndarray], indices: Union[Sequence[int], np.ndarray]) -> None:
+        """Consume one chunk of alignment results.
+
+        Args:
+            sample_times: Sample times of the chunk
+            reference_times: Reference timebase (full, or the chunk's window)
+            indices: Nearest reference index per sample (into reference_times)
+        """
+        sample_array = np.asarray(sample_times, dtype=np.float64).ravel()
+        if sample_array.size == 0:
+            return
+        ref_array = np.asarray(reference_times, dtype=np.float64)
+        self.update_jitter(np.abs(sample_array - ref_array[np.asarray(indices, dtype=np.intp)]))
+
+    def update_jitter(self, jitter: Union[Sequence[float], np.ndarray]) -> None:
+        """Consume a chunk of absolute jitter values.
+
+        Args:
+            jitter: Absolute jitter values in seconds
+        """
+        jitter = np.asarray(jitter, dtype=np.float64).ravel()
+        if jitter.size == 0:
+            return
+
+        bins = np.searchsorted(self._edges, jitter, side="right") - 1
+        np.clip(bins, 0, self._counts.size - 1, out=bins)
+        self._counts += np.bincount(bins, minlength=self._counts.size)
+        self.count += jitter.size
+        self.max_jitter_s = max(self.max_jitter_s, float(jitter.max()))
+
+    def merge(self, other: "StreamingJitterStats") -> "StreamingJitterStats":
+        """Fold another estimator into this one (e.g. from a worker thread).
+
+        Args:
+            other: Estimator to merge
+
+        Returns:
+            self (for chaining)
+        """
+        self._counts += other._counts
+        self.count += other.count
+        self.max_jitter_s = max(self.max_jitter_s, other.max_jitter_s)
+        return self
+
+    def quantile(self, q: float) -> float:
+        """Estimate a jitter quantile.
+
+        Args:
+            q: Quantile in [0, 1]
+
+        Returns:
+            Estimated jitter in seconds (0.0 when empty)
+        """
+        if self.count == 0:
+            return 0.0
+
+        rank = q * (self.count - 1)
+        cumulative = np.cumsum(self._counts)
+        b = int(np.searchsorted(cumulative, rank, side="right"))
+        b = min(b, self._counts.size - 1)
+
+        # Position of the rank inside its bin, interpolated geometrically
+        below = cumulative[b - 1] if b > 0 else 0
+        fraction = (rank - below + 0.5) / self._counts[b] if self._counts[b] else 0.0
+        lo, hi = self._edges[b], self._edges[b + 1]
+        value = lo + (hi - lo) * fraction if lo == 0.0 else lo * (hi / lo) ** fraction
+
+        return float(min(value, self.max_jitter_s))
+
+    def summary(self) -> Dict:
+        """Summarize the consumed jitter.
+
+        Returns:
+            Dict with the same keys as summarize_jitter()
+        """
+        if self.count == 0:
+            return _empty_summary()
+
+        report_edges = np.asarray(JITTER_HISTOGRAM_EDGES_S)
+        # Sketch bin i is assigned to the reported bin containing its lower edge
+        groups = np.clip(np.searchsorted(report_edges, self._edges[:-1] * (1 + 1e-9), side="right") - 1, 0, report_edges.size - 2)
+        counts = np.bincount(groups, weights=self._counts, minlength=report_edges.size - 1).astype(np.int64)
+
+        return {
+            "max_jitter_s": self.max_jitter_s,
+            "p95_jitter_s": self.quantile(0.95),
+            "median_jitter_s": self.quantile(0.50),
+            "p99_jitter_s": self.quantile(0.99),
+            "jitter_histogram_edges_s": report_edges.tolist(),
+            "jitter_histogram_counts": counts.tolist(),
+        }
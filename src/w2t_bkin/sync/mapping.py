@@ -5,33 +5,137 @@ statistics and budget enforcement.
 
 Example:
     >>> result = align_samples(sample_times, reference_times, config)
+    >>> batch = align_modalities({"video": frame_times, "pose": pose_times}, reference_times, config)
+    >>> for chunk in align_samples_chunked(iter_chunks(memmapped_times), reference_times, config):
+    ...     writer.write(chunk["aligned_times"])
 """
 
-from typing import Dict, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
 import warnings
 
 import numpy as np
 
 from ..exceptions import JitterBudgetExceeded, SyncError
+from .jitter import StreamingJitterStats, summarize_jitter
 from .protocols import TimebaseConfigProtocol
+from .reference import ReferenceTimebase, UniformTimebase, as_reference_timebase
 
 __all__ = [
     "map_nearest",
+    "map_nearest_array",
     "map_linear",
+    "map_linear_array",
+    "interpolate_linear",
     "compute_jitter_stats",
     "enforce_jitter_budget",
     "align_samples",
+    "align_modalities",
+    "iter_chunks",
+    "align_samples_chunked",
 ]
 
 
+# Reference timebase inputs accepted by the mapping functions
+ReferenceLike = Union[Sequence[float], np.ndarray, ReferenceTimebase]
+
+# Samples further than this from any reference point trigger a warning
+LARGE_GAP_S = 1.0
+
+# Number of worst offenders listed in the large-gap summary warning
+_MAX_REPORTED_GAPS = 5
+
+# Samples per chunk for streaming alignment (~8 MB of float64)
+DEFAULT_CHUNK_SAMPLES = 1 << 20
+
+
+# =============================================================================
+# Validation Helpers
+# =============================================================================
+
+
+def _warn_large_gaps(sample_array: np.ndarray, gaps: np.ndarray, max_gap_s: float) -> None:
+    """Emit a single summary warning for samples far from the reference.
+
+    Args:
+        sample_array: Sample times
+        gaps: Absolute distance of each sample to its mapped reference point
+        max_gap_s: Gap threshold in seconds
+    """
+    large = np.flatnonzero(gaps > max_gap_s)
+    if large.size == 0:
+        return
+
+    worst = large[np.argsort(gaps[large])[::-1][:_MAX_REPORTED_GAPS]]
+    offenders = ", ".join(f"t={sample_array[i]:.3f}s (gap {gaps[i]:.3f}s)" for i in worst)
+    warnings.warn(
+        f"{large.size} of {sample_array.size} sample(s) have a large gap (> {max_gap_s:.3f}s) from the nearest reference; worst: {offenders}",
+        UserWarning,
+    )
+
+
 # =============================================================================
 # Mapping Strategies
 # =============================================================================
 
 
+def map_nearest_array(sample_times: Union[Sequence[float], np.ndarray], reference_times: ReferenceLike, max_gap_s: float = LARGE_GAP_S) -> np.ndarray:
+    """Map samples to nearest reference timestamps (vectorized).
+
+    Locates every sample in the reference with a single ``np.searchsorted``
+    call and picks the closer of the two bracketing reference points, which
+    is O(N log M) instead of a full scan of the reference per sample. Ties
+    resolve to the earlier reference index, matching ``np.argmin``.
+
+    Samples further than ``max_gap_s`` from their nearest reference point are
+    reported in one summary warning (count and worst offenders).
+
+    Args:
+        sample_times: Times to align
+        reference_times: Reference timebase (sorted)
+        max_gap_s: Gap above which a sample is reported as poorly covered
+
+    Returns:
+        int64 array of indices into reference_times
+
+    Raises:
+        SyncError: Empty or non-monotonic reference
+
+    Example:
+        >>> indices = map_nearest_array(np.array([0.3, 1.7]), np.array([0.0, 1.0, 2.0]))
+    """
+    reference = as_reference_timebase(reference_times)
+    sample_array = np.asarray(sample_times, dtype=np.float64).ravel()
+
+    if sample_array.size == 0:
+        return np.empty(0, dtype=np.int64)
+
+    if isinstance(reference, UniformTimebase):
+        # Closed form: round the fractional position, ties to the earlier index
+        indices = np.clip(np.ceil(reference.positions(sample_array) - 0.5), 0, len(reference) - 1).astype(np.int64)
+    elif len(reference) == 1:
+        indices = np.zeros(sample_array.size, dtype=np.int64)
+    else:
+        ref_array = reference.times
+        # First reference index >= sample, clipped so both neighbours exist
+        right = np.clip(np.searchsorted(ref_array, sample_array, side="left"), 1, ref_array.size - 1)
+        left = right - 1
+        take_left = (sample_array - ref_array[left]) <= (ref_array[right] - sample_array)
+        indices = np.where(take_left, left, right).astype(np.int64)
+
+        # Duplicate reference values: argmin semantics pick the first occurrence
+        indices = np.searchsorted(ref_array, ref_array[indices], side="left").astype(np.int64)
+
+    _warn_large_gaps(sample_array, np.abs(reference.take(indices) - sample_array), max_gap_s)
+
+    return indices
+
+
 def map_nearest(sample_times: List[float], reference_times: List[float]) -> List[int]:
     """Map samples to nearest reference timestamps.
 
+    Thin list wrapper around map_nearest_array().
+
     Args:
         sample_times: Times to align
         reference_times: Reference timebase (sorted)
@@ -45,36 +149,69 @@ def map_nearest(sample_times: List[float], reference_times: List[float]) -> List
     Example:
         >>> indices = map_nearest([0.3, 1.7], [0.0, 1.0, 2.0])
     """
-    if not reference_times:
-        raise SyncError("Cannot map to empty reference timebase")
+    return map_nearest_array(sample_times, reference_times).tolist()
 
-    # Check monotonicity
-    if reference_times != sorted(reference_times):
-        raise SyncError("Reference timestamps must be monotonic")
 
-    if not sample_times:
-        return []
+def map_linear_array(sample_times: Union[Sequence[float], np.ndarray], reference_times: ReferenceLike) -> Tuple[np.ndarray, np.ndarray]:
+    """Map samples using linear interpolation (vectorized).
 
-    # Check for large gaps and warn
-    ref_array = np.array(reference_times)
-    indices = []
+    Computes bracketing indices and interpolation weights for all samples in
+    one pass. Samples at or before the first reference point clamp to index 0,
+    samples after the last clamp to the last index (weights (1, 0) in both
+    cases). Zero-length reference intervals get equal weights.
 
-    for sample_time in sample_times:
-        # Find nearest index
-        idx = np.argmin(np.abs(ref_array - sample_time))
-        indices.append(int(idx))
+    Args:
+        sample_times: Times to align
+        reference_times: Reference timebase (sorted)
 
-        # Check for large gaps
-        gap = abs(ref_array[idx] - sample_time)
-        if gap > 1.0:  # > 1 second gap
-            warnings.warn(f"Sample time {sample_time} has large gap ({gap:.3f}s) from nearest reference", UserWarning)
+    Returns:
+        (indices, weights) as two (N, 2) arrays: int64 (idx0, idx1) pairs and
+        float64 (w0, w1) weights
 
-    return indices
+    Raises:
+        SyncError: Empty or non-monotonic reference
+
+    Example:
+        >>> indices, weights = map_linear_array(np.array([0.5]), np.array([0.0, 1.0]))
+    """
+    reference = as_reference_timebase(reference_times)
+    sample_array = np.asarray(sample_times, dtype=np.float64).ravel()
+
+    n_ref = len(reference)
+    if isinstance(reference, UniformTimebase):
+        # Closed form equivalent of searchsorted(side="left") on offset + i / rate
+        idx_after = np.clip(np.ceil(reference.positions(sample_array)), 0, n_ref).astype(np.int64)
+    else:
+        idx_after = np.searchsorted(reference.times, sample_array, side="left")
+
+    before = idx_after == 0
+    after = idx_after >= n_ref
+
+    idx1 = np.minimum(idx_after, n_ref - 1)
+    idx0 = np.maximum(idx_after - 1, 0)
+    # Clamped samples map to a single reference point
+    idx0 = np.where(after, n_ref - 1, idx0)
+    idx1 = np.where(before, 0, idx1)
+
+    t0 = reference.take(idx0)
+    t1 = reference.take(idx1)
+    interval = t1 - t0
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        w1 = np.where(interval > 0, (sample_array - t0) / interval, 0.5)
+    w1 = np.where(before | after, 0.0, w1)
+
+    indices = np.stack([idx0, idx1], axis=1).astype(np.int64)
+    weights = np.stack([1.0 - w1, w1], axis=1)
+
+    return indices, weights
 
 
 def map_linear(sample_times: List[float], reference_times: List[float]) -> Tuple[List[Tuple[int, int]], List[Tuple[float, float]]]:
     """Map samples using linear interpolation.
 
+    List wrapper around map_linear_array().
+
     Args:
         sample_times: Times to align
         reference_times: Reference timebase (sorted)
@@ -89,52 +226,37 @@ def map_linear(sample_times: List[float], reference_times: List[float]) -> Tuple
     Example:
         >>> indices, weights = map_linear([0.5], [0.0, 1.0])
     """
-    if not reference_times:
-        raise SyncError("Cannot map to empty reference timebase")
+    indices, weights = map_linear_array(sample_times, reference_times)
+    return [tuple(pair) for pair in indices.tolist()], [tuple(pair) for pair in weights.tolist()]
 
-    if reference_times != sorted(reference_times):
-        raise SyncError("Reference timestamps must be monotonic")
-
-    if not sample_times:
-        return [], []
-
-    ref_array = np.array(reference_times)
-    indices = []
-    weights = []
-
-    for sample_time in sample_times:
-        # Find bracketing indices
-        idx_after = np.searchsorted(ref_array, sample_time)
-
-        if idx_after == 0:
-            # Before first reference point - clamp to first
-            indices.append((0, 0))
-            weights.append((1.0, 0.0))
-        elif idx_after >= len(ref_array):
-            # After last reference point - clamp to last
-            idx = len(ref_array) - 1
-            indices.append((idx, idx))
-            weights.append((1.0, 0.0))
-        else:
-            # Interpolate between idx_after-1 and idx_after
-            idx0 = idx_after - 1
-            idx1 = idx_after
 
-            t0 = ref_array[idx0]
-            t1 = ref_array[idx1]
+def interpolate_linear(sample_times: Union[Sequence[float], np.ndarray], reference_times: ReferenceLike) -> np.ndarray:
+    """Compute linearly interpolated reference timestamps for samples.
+
+    Equivalent to applying the weights from map_linear_array() to the
+    reference, without materializing per-sample pairs in Python.
+
+    Args:
+        sample_times: Times to align
+        reference_times: Reference timebase (sorted)
+
+    Returns:
+        float64 array of aligned timestamps
 
-            # Linear interpolation weight
-            if t1 - t0 > 0:
-                w1 = (sample_time - t0) / (t1 - t0)
-                w0 = 1.0 - w1
-            else:
-                # Zero interval - equal weights
-                w0, w1 = 0.5, 0.5
+    Raises:
+        SyncError: Empty or non-monotonic reference
 
-            indices.append((idx0, idx1))
-            weights.append((w0, w1))
+    Example:
+        >>> aligned = interpolate_linear([0.25, 0.5], [0.0, 1.0])
+    """
+    reference = as_reference_timebase(reference_times)
+    indices, weights = map_linear_array(sample_times, reference)
+    return _apply_linear_weights(reference, indices, weights)
 
-    return indices, weights
+
+def _apply_linear_weights(reference: ReferenceTimebase, indices: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Combine bracketing reference points with their interpolation weights."""
+    return weights[:, 0] * reference.take(indices[:, 0]) + weights[:, 1] * reference.take(indices[:, 1])
 
 
 # =============================================================================
@@ -142,35 +264,35 @@ def map_linear(sample_times: List[float], reference_times: List[float]) -> Tuple
 # =============================================================================
 
 
-def compute_jitter_stats(sample_times: List[float], reference_times: List[float], indices: List[int]) -> Dict[str, float]:
+def compute_jitter_stats(sample_times: List[float], reference_times: ReferenceLike, indices: List[int]) -> Dict:
     """Compute jitter statistics.
 
+    Jitter is computed as a single fancy-indexed NumPy expression and
+    summarized with one percentile pass (see sync.jitter.summarize_jitter).
+
     Args:
         sample_times: Original sample times
         reference_times: Reference timebase
         indices: Mapping indices
 
     Returns:
-        Dict with max_jitter_s and p95_jitter_s
+        Dict with max_jitter_s, p95_jitter_s, median_jitter_s, p99_jitter_s,
+        jitter_histogram_edges_s and jitter_histogram_counts
 
     Example:
         >>> stats = compute_jitter_stats(samples, reference, indices)
     """
-    if not sample_times or not indices:
-        return {"max_jitter_s": 0.0, "p95_jitter_s": 0.0}
-
-    ref_array = np.array(reference_times)
-    sample_array = np.array(sample_times)
+    if len(sample_times) == 0 or len(indices) == 0:
+        return summarize_jitter([])
 
-    # Compute jitter for each sample
-    jitters = []
-    for i, idx in enumerate(indices):
-        jitter = abs(sample_array[i] - ref_array[idx])
-        jitters.append(jitter)
-
-    jitter_array = np.array(jitters)
+    sample_array = np.asarray(sample_times, dtype=np.float64)
+    indices = np.asarray(indices, dtype=np.intp)
+    if isinstance(reference_times, ReferenceTimebase):
+        mapped = reference_times.take(indices)
+    else:
+        mapped = np.asarray(reference_times, dtype=np.float64)[indices]
 
-    return {"max_jitter_s": float(np.max(jitter_array)), "p95_jitter_s": float(np.percentile(jitter_array, 95))}
+    return summarize_jitter(np.abs(sample_array - mapped))
 
 
 # =============================================================================
@@ -213,7 +335,14 @@ def enforce_jitter_budget(max_jitter: float, p95_jitter: float, budget: float) -
 # =============================================================================
 
 
-def align_samples(sample_times: List[float], reference_times: List[float], config: TimebaseConfigProtocol, enforce_budget: bool = False) -> Dict:
+def align_samples(
+    sample_times: List[float],
+    reference_times: ReferenceLike,
+    config: TimebaseConfigProtocol,
+    enforce_budget: bool = False,
+    fail_fast: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SAMPLES,
+) -> Dict:
     """Align samples to reference timebase using configured strategy.
 
     High-level function that performs alignment according to config.mapping
@@ -221,18 +350,37 @@ def align_samples(sample_times: List[float], reference_times: List[float], confi
 
     Args:
         sample_times: Times to align
-        reference_times: Reference timebase
+        reference_times: Reference timebase; pass a verified ReferenceTimebase
+                         to skip re-validation when aligning several modalities
         config: Timebase configuration with mapping strategy and jitter budget
         enforce_budget: Whether to enforce jitter budget (raises on exceed)
+        fail_fast: Align in chunks of chunk_size samples and check the budget
+                   after each, aborting at the first chunk that exceeds it
+                   (implies enforce_budget)
+        chunk_size: Samples per chunk in fail-fast mode
 
     Returns:
         Dictionary with:
-        - indices: Alignment indices (list of int or list of tuple for linear)
-        - jitter_stats: Dict with max_jitter_s and p95_jitter_s
+        - indices: Alignment indices (int64 array, shape (N,) for nearest or
+          (N, 2) for linear)
+        - weights: Interpolation weights, shape (N, 2) (linear only)
+        - aligned_times: Sample times mapped onto the reference (float64 array)
+        - jitter_stats: Dict from compute_jitter_stats (max, p95, median,
+          p99 and histogram)
         - mapping: Strategy used ("nearest" or "linear")
 
+        aligned_times is computed here in one vectorized pass (reference
+        lookup for nearest, weighted interpolation for linear), so the
+        video, pose and facemap helpers pass it through unchanged.
+
+        indices, weights and aligned_times are NumPy arrays; earlier
+        versions returned lists. Compare them with ``np.array_equal`` (``==``
+        is element-wise) and call ``.tolist()`` before ``json.dump``.
+
     Raises:
-        JitterBudgetExceeded: If enforce_budget=True and budget exceeded
+        JitterBudgetExceeded: If enforce_budget=True and budget exceeded; in
+                              fail-fast mode the message names the offending
+                              sample range
         SyncError: If invalid mapping strategy
 
     Example:
@@ -253,18 +401,246 @@ def align_samples(sample_times: List[float], reference_times: List[float], confi
     """
     mapping = config.mapping
 
+    if mapping not in ("nearest", "linear"):
+        raise SyncError(f"Invalid mapping strategy: {mapping}")
+
+    # Validate once; the mapping helpers below see a verified reference
+    reference = as_reference_timebase(reference_times)
+    sample_array = np.asarray(sample_times, dtype=np.float64).ravel()
+
+    if fail_fast and sample_array.size > chunk_size:
+        results, jitters = [], []
+        for start in range(0, sample_array.size, chunk_size):
+            chunk = sample_array[start : start + chunk_size]
+            chunk_result, chunk_jitter = _align_verified(chunk, reference, mapping)
+            _check_chunk_budget(chunk, chunk_jitter, start, config.jitter_budget_s)
+            results.append(chunk_result)
+            jitters.append(chunk_jitter)
+
+        result = {key: np.concatenate([chunk_result[key] for chunk_result in results]) for key in results[0] if key != "mapping"}
+        result["mapping"] = mapping
+        jitter = np.concatenate(jitters)
+    else:
+        result, jitter = _align_verified(sample_array, reference, mapping)
+        if fail_fast:
+            _check_chunk_budget(sample_array, jitter, 0, config.jitter_budget_s)
+
+    result["jitter_stats"] = summarize_jitter(jitter)
+
+    if enforce_budget:
+        enforce_jitter_budget(result["jitter_stats"]["max_jitter_s"], result["jitter_stats"]["p95_jitter_s"], config.jitter_budget_s)
+
+    return result
+
+
+def _check_chunk_budget(chunk: np.ndarray, jitter: np.ndarray, start: int, budget: float) -> None:
+    """Raise JitterBudgetExceeded naming the sample range if a chunk exceeds the budget."""
+    over = np.flatnonzero(jitter > budget)
+    if over.size:
+        first, worst = over[0], over[np.argmax(jitter[over])]
+        raise JitterBudgetExceeded(
+            f"Jitter exceeds budget in samples {start}-{start + chunk.size - 1} ({over.size} over budget): "
+            f"first at sample {start + first} (t={chunk[first]:.6f}s, jitter={jitter[first]:.6f}s), "
+            f"max={jitter[worst]:.6f}s, budget={budget:.6f}s"
+        )
+
+
+def _align_verified(sample_array: np.ndarray, reference: ReferenceTimebase, mapping: str) -> Tuple[Dict, np.ndarray]:
+    """Align samples to a verified reference; return (result without jitter_stats, jitter)."""
+    result = {"mapping": mapping}
+
     if mapping == "nearest":
-        indices = map_nearest(sample_times, reference_times)
-        jitter_stats = compute_jitter_stats(sample_times, reference_times, indices)
-    elif mapping == "linear":
-        indices, weights = map_linear(sample_times, reference_times)
-        # For jitter computation with linear, use nearest for simplicity
-        nearest_indices = [idx[0] for idx in indices]
-        jitter_stats = compute_jitter_stats(sample_times, reference_times, nearest_indices)
+        indices = map_nearest_array(sample_array, reference)
+        result["aligned_times"] = reference.take(indices)
+        nearest = indices
     else:
+        indices, weights = map_linear_array(sample_array, reference)
+        result["weights"] = weights
+        result["aligned_times"] = _apply_linear_weights(reference, indices, weights)
+        # For jitter computation with linear, use nearest for simplicity
+        nearest = indices[:, 0]
+
+    result["indices"] = indices
+    jitter = np.abs(sample_array - reference.take(nearest)) if sample_array.size else np.empty(0)
+    return result, jitter
+
+
+def align_modalities(
+    modality_times: Mapping[str, Union[Sequence[float], np.ndarray]],
+    reference_times: ReferenceLike,
+    config: TimebaseConfigProtocol,
+    enforce_budget: bool = False,
+    max_workers: int = 1,
+) -> Dict:
+    """Align several modalities to one shared reference timebase.
+
+    The reference is validated once and all samples are aligned in one
+    vectorized sweep over their concatenation (split across ``max_workers``
+    threads if requested), then split back per modality. Per-modality
+    results match align_samples() exactly.
+
+    Args:
+        modality_times: Dict modality name → sample times (e.g. "video", "pose", "facemap")
+        reference_times: Shared reference timebase
+        config: Timebase configuration with mapping strategy and jitter budget
+        enforce_budget: Enforce the jitter budget per modality (raises on exceed)
+        max_workers: Threads aligning contiguous chunks of the samples
+
+    Returns:
+        Dictionary with:
+        - modalities: Dict modality name → align_samples()-style result
+        - jitter_stats: Jitter stats aggregated over all modalities
+        - mapping: Strategy used ("nearest" or "linear")
+
+    Raises:
+        JitterBudgetExceeded: If enforce_budget=True and a modality exceeds the budget
+        SyncError: If invalid mapping strategy or reference
+
+    Example:
+        >>> batch = align_modalities({"video": frame_times, "pose": pose_times}, reference, config)
+        >>> batch["modalities"]["pose"]["aligned_times"]
+        >>> create_alignment_stats(..., **batch["jitter_stats"])
+    """
+    mapping = config.mapping
+
+    if mapping not in ("nearest", "linear"):
         raise SyncError(f"Invalid mapping strategy: {mapping}")
 
+    reference = as_reference_timebase(reference_times)
+    names = list(modality_times)
+    arrays = [np.asarray(modality_times[name], dtype=np.float64).ravel() for name in names]
+    all_samples = np.concatenate(arrays) if arrays else np.empty(0)
+
+    if max_workers > 1 and all_samples.size >= max_workers:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            parts = list(executor.map(lambda chunk: _align_verified(chunk, reference, mapping), np.array_split(all_samples, max_workers)))
+        combined = {key: np.concatenate([part[0][key] for part in parts]) for key in parts[0][0] if key != "mapping"}
+        jitter = np.concatenate([part[1] for part in parts])
+    else:
+        combined, jitter = _align_verified(all_samples, reference, mapping)
+
+    modalities = {}
+    bounds = np.cumsum([0] + [array.size for array in arrays])
+    for name, start, stop in zip(names, bounds[:-1], bounds[1:]):
+        result = {key: value[start:stop] for key, value in combined.items() if key != "mapping"}
+        result["mapping"] = mapping
+        result["jitter_stats"] = summarize_jitter(jitter[start:stop])
+        modalities[name] = result
+
     if enforce_budget:
-        enforce_jitter_budget(jitter_stats["max_jitter_s"], jitter_stats["p95_jitter_s"], config.jitter_budget_s)
+        for result in modalities.values():
+            enforce_jitter_budget(result["jitter_stats"]["max_jitter_s"], result["jitter_stats"]["p95_jitter_s"], config.jitter_budget_s)
+
+    return {"modalities": modalities, "jitter_stats": summarize_jitter(jitter), "mapping": mapping}
+
+
+# =============================================================================
+# Streaming Alignment
+# =============================================================================
+
+
+def iter_chunks(sample_times: Union[Sequence[float], np.ndarray], chunk_size: int = DEFAULT_CHUNK_SAMPLES) -> Iterator[np.ndarray]:
+    """Yield consecutive slices of a (typically memory-mapped) sample array.
+
+    Args:
+        sample_times: Sample times, e.g. ``np.load(path, mmap_mode="r")``
+        chunk_size: Samples per chunk
+
+    Yields:
+        Slices of sample_times (views; only the touched pages are read)
+    """
+    for start in range(0, len(sample_times), chunk_size):
+        yield sample_times[start : start + chunk_size]
+
+
+def _reference_window(reference: ReferenceTimebase, chunk: np.ndarray, cursor: int) -> Tuple[ReferenceTimebase, int]:
+    """Reference slice bracketing a sorted chunk, searched from the cursor onward."""
+    times = reference.times
+    lo = cursor + int(np.searchsorted(times[cursor:], chunk[0], side="left")) - 1
+    hi = cursor + int(np.searchsorted(times[cursor:], chunk[-1], side="right")) + 1
+    lo, hi = max(lo, 0), min(hi, times.size)
+    return ReferenceTimebase(times[lo:hi], verified=reference.verified).validate(), lo
+
+
+def align_samples_chunked(
+    sample_chunks: Iterable[Union[Sequence[float], np.ndarray]],
+    reference_times: ReferenceLike,
+    config: TimebaseConfigProtocol,
+    jitter_stats: Optional[StreamingJitterStats] = None,
+    enforce_budget: bool = False,
+) -> Iterator[Dict]:
+    """Align monotonic sample chunks to a reference with bounded memory.
+
+    Samples must be non-decreasing across the whole stream. Each chunk is
+    mapped against only the slice of the reference that brackets it, found
+    by advancing a cursor through the reference, so neither the samples nor
+    a memory-mapped reference are ever loaded in full (UniformTimebase
+    references are mapped in closed form). An unverified reference is not
+    scanned up front; each window is checked for monotonicity as it is
+    used. Jitter is accumulated in a StreamingJitterStats sketch.
+
+    Args:
+        sample_chunks: Iterable of sample-time chunks (e.g. from iter_chunks)
+        reference_times: Reference timebase (array, memmap or ReferenceTimebase)
+        config: Timebase configuration with mapping strategy and jitter budget
+        jitter_stats: Running jitter estimator to update (created if omitted)
+        enforce_budget: Raise as soon as the running jitter exceeds the budget
+
+    Yields:
+        Dict per chunk with align_samples() keys (indices are global into the
+        reference) plus:
+        - start: Global index of the chunk's first sample
+        - jitter_stats: Running jitter summary over all chunks so far
+
+    Raises:
+        JitterBudgetExceeded: If enforce_budget=True and budget exceeded
+        SyncError: If invalid mapping strategy, reference, or unsorted samples
+
+    Example:
+        >>> samples = np.load("pose_times.npy", mmap_mode="r")
+        >>> stats = StreamingJitterStats()
+        >>> for chunk in align_samples_chunked(iter_chunks(samples), reference, config, jitter_stats=stats):
+        ...     out[chunk["start"] : chunk["start"] + chunk["indices"].shape[0]] = chunk["aligned_times"]
+        >>> stats.summary()["p95_jitter_s"]
+    """
+    mapping = config.mapping
+
+    if mapping not in ("nearest", "linear"):
+        raise SyncError(f"Invalid mapping strategy: {mapping}")
+
+    # Validated per window below, so a memmapped reference is only read where chunks land
+    reference = reference_times if isinstance(reference_times, ReferenceTimebase) else ReferenceTimebase(reference_times)
+    if len(reference) == 0:
+        raise SyncError("Cannot map to empty reference timebase")
+    if isinstance(reference, UniformTimebase):
+        reference.validate()
+    stats = jitter_stats if jitter_stats is not None else StreamingJitterStats()
+    cursor = 0
+    start = 0
+    previous_last = -np.inf
+
+    for chunk in sample_chunks:
+        chunk = np.asarray(chunk, dtype=np.float64).ravel()
+        if chunk.size == 0:
+            continue
+        if chunk[0] < previous_last or np.any(chunk[1:] < chunk[:-1]):
+            raise SyncError(f"Streaming alignment requires non-decreasing sample times (chunk starting at sample {start})")
+
+        if isinstance(reference, UniformTimebase):
+            result, jitter = _align_verified(chunk, reference, mapping)
+        else:
+            window, cursor = _reference_window(reference, chunk, cursor)
+            result, jitter = _align_verified(chunk, window, mapping)
+            result["indices"] = result["indices"] + cursor
+
+        # The running max is the max over chunks, so checking each chunk enforces the whole budget
+        if enforce_budget:
+            _check_chunk_budget(chunk, jitter, start, config.jitter_budget_s)
+
+        stats.update_jitter(jitter)
+        result["start"] = start
+        result["jitter_stats"] = stats.summary()
 
-    return {"indices": indices, "jitter_stats": jitter_stats, "mapping": mapping}
+        start += chunk.size
+        previous_last = chunk[-1]
+        yield result
@@ -3,7 +3,7 @@
 Defines AlignmentStats for representing alignment quality metrics.
 """
 
-from typing import Literal
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -20,6 +20,15 @@ class AlignmentStats(BaseModel):
         max_jitter_s: Maximum jitter in seconds
         p95_jitter_s: 95th percentile jitter in seconds
         aligned_samples: Number of aligned samples
+        median_jitter_s: Median jitter in seconds (optional)
+        p99_jitter_s: 99th percentile jitter in seconds (optional)
+        jitter_histogram_edges_s: Jitter histogram bin edges in seconds (optional)
+        jitter_histogram_counts: Sample counts per jitter histogram bin (optional)
+        drift_ppm: Fitted clock drift in parts per million (optional)
+        drift_residual_rms_s: RMS residual of the clock drift fit in seconds (optional)
+        drift_residual_max_s: Maximum residual of the clock drift fit in seconds (optional)
+        dropped_frames: Frames missing from the camera TTL pulse train (optional)
+        duplicate_frames: Duplicate pulses in the camera TTL pulse train (optional)
     """
 
     model_config = {"frozen": True, "extra": "forbid"}
@@ -30,3 +39,12 @@ class AlignmentStats(BaseModel):
     max_jitter_s: float = Field(..., description="Maximum jitter observed in seconds", ge=0)
     p95_jitter_s: float = Field(..., description="95th percentile jitter in seconds", ge=0)
     aligned_samples: int = Field(..., description="Number of samples successfully aligned", ge=0)
+    median_jitter_s: Optional[float] = Field(default=None, description="Median jitter in seconds", ge=0)
+    p99_jitter_s: Optional[float] = Field(default=None, description="99th percentile jitter in seconds", ge=0)
+    jitter_histogram_edges_s: Optional[List[float]] = Field(default=None, description="Jitter histogram bin edges in seconds (values beyond the last edge fall in the last bin)")
+    jitter_histogram_counts: Optional[List[int]] = Field(default=None, description="Number of samples per jitter histogram bin")
+    drift_ppm: Optional[float] = Field(default=None, description="Fitted clock drift in parts per million")
+    drift_residual_rms_s: Optional[float] = Field(default=None, description="RMS residual of the clock drift fit in seconds", ge=0)
+    drift_residual_max_s: Optional[float] = Field(default=None, description="Maximum absolute residual of the clock drift fit in seconds", ge=0)
+    dropped_frames: Optional[int] = Field(default=None, description="Frames missing from the camera TTL pulse train", ge=0)
+    duplicate_frames: Optional[int] = Field(default=None, description="Duplicate pulses in the camera TTL pulse train", ge=0)
@@ -0,0 +1,211 @@
+"""Read sync pulses from Neuropixels binary streams.
+
+Supports SpikeGLX ``.bin`` files (interleaved int16 samples, described by a
+sibling ``.meta`` file) and, with explicit channel count and sample rate,
+any interleaved int16 stream such as OpenEphys ``continuous.dat``.
+
+The file is memory-mapped and the sync channel is scanned in fixed-size
+chunks, so extracting edges from a several-hundred-GB ``.ap.bin`` never
+holds more than one chunk of the sync channel in memory.
+
+Example:
+    >>> edges = extract_sync_edges(Path("run_g0_t0.imec0.ap.bin"))
+    >>> edges[:3]  # rising-edge times in seconds
+    array([0.5, 1.5, 2.5])
+"""
+
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from ..exceptions import SyncError
+
+__all__ = ["DEFAULT_SYNC_BIT", "read_spikeglx_meta", "open_sync_stream", "detect_rising_edges", "extract_sync_edges"]
+
+# SpikeGLX imec probes record the sync input on bit 6 of the last (SY) channel
+DEFAULT_SYNC_BIT = 6
+
+# Samples scanned per chunk (~1M samples = 32 s at 30 kHz)
+DEFAULT_CHUNK_SAMPLES = 1 << 20
+
+# Bytes per interleaved sample value
+_SAMPLE_DTYPE = np.dtype("<i2")
+
+
+# =============================================================================
+# Metadata
+# =============================================================================
+
+
+def read_spikeglx_meta(meta_path: Path) -> Dict[str, str]:
+    """Parse a SpikeGLX ``.meta`` file.
+
+    Args:
+        meta_path: Path to the ``.meta`` file
+
+    Returns:
+        Dict of key -> raw string value (``~`` prefixes stripped from keys)
+
+    Raises:
+        SyncError: File not found
+    """
+    meta_path = Path(meta_path)
+    if not meta_path.exists():
+        raise SyncError(f"SpikeGLX meta file not found: {meta_path}")
+
+    meta = {}
+    for line in meta_path.read_text().splitlines():
+        key, sep, value = line.partition("=")
+        if sep:
+            meta[key.strip().lstrip("~")] = value.strip()
+    return meta
+
+
+def _stream_layout(meta: Dict[str, str]) -> Tuple[int, float]:
+    """Return (n_channels, sample_rate) from SpikeGLX metadata."""
+    try:
+        n_channels = int(meta["nSavedChans"])
+    except (KeyError, ValueError) as e:
+        raise SyncError(f"SpikeGLX meta missing nSavedChans: {e}")
+
+    for key in ("imSampRate", "niSampRate", "obSampRate"):
+        if key in meta:
+            return n_channels, float(meta[key])
+
+    raise SyncError("SpikeGLX meta missing sample rate (imSampRate/niSampRate)")
+
+
+# =============================================================================
+# Stream Access
+# =============================================================================
+
+
+def open_sync_stream(
+    bin_path: Path,
+    meta_path: Optional[Path] = None,
+    n_channels: Optional[int] = None,
+    sample_rate: Optional[float] = None,
+) -> Tuple[np.memmap, float]:
+    """Memory-map an interleaved int16 binary stream.
+
+    Channel count and sample rate are read from the SpikeGLX ``.meta`` file
+    (``meta_path`` or the ``.bin`` path with a ``.meta`` suffix) unless both
+    are given explicitly.
+
+    Args:
+        bin_path: Path to the binary stream
+        meta_path: Path to the SpikeGLX ``.meta`` file (optional)
+        n_channels: Number of interleaved channels (overrides meta)
+        sample_rate: Sample rate in Hz (overrides meta)
+
+    Returns:
+        (data, sample_rate) with data a read-only (n_samples, n_channels) memmap
+
+    Raises:
+        SyncError: Missing file, metadata, or inconsistent file size
+    """
+    bin_path = Path(bin_path)
+    if not bin_path.exists():
+        raise SyncError(f"Neuropixels binary file not found: {bin_path}")
+
+    if n_channels is None or sample_rate is None:
+        meta = read_spikeglx_meta(meta_path or bin_path.with_suffix(".meta"))
+        meta_channels, meta_rate = _stream_layout(meta)
+        n_channels = n_channels or meta_channels
+        sample_rate = sample_rate or meta_rate
+
+    frame_bytes = n_channels * _SAMPLE_DTYPE.itemsize
+    file_size = bin_path.stat().st_size
+    if file_size % frame_bytes:
+        raise SyncError(f"{bin_path.name} size ({file_size} bytes) is not a multiple of {n_channels} int16 channels")
+
+    n_samples = file_size // frame_bytes
+    if n_samples == 0:
+        return np.empty((0, n_channels), dtype=_SAMPLE_DTYPE), float(sample_rate)
+
+    data = np.memmap(bin_path, dtype=_SAMPLE_DTYPE, mode="r", shape=(n_samples, n_channels))
+    return data, float(sample_rate)
+
+
+# =============================================================================
+# Edge Detection
+# =============================================================================
+
+
+def detect_rising_edges(data: np.ndarray, channel: int = -1, bit: Optional[int] = DEFAULT_SYNC_BIT, chunk_samples: int = DEFAULT_CHUNK_SAMPLES) -> np.ndarray:
+    """Find rising edges of a digital sync line, chunk by chunk.
+
+    An edge is a sample where the line is high and the previous sample was
+    low. The state before the first sample is unknown, so a line that is
+    already high at sample 0 does not produce an edge there. The last state
+    of each chunk is carried into the next, so edges on chunk boundaries are
+    neither lost nor duplicated.
+
+    Args:
+        data: (n_samples, n_channels) integer array (typically a memmap)
+        channel: Sync channel index (default: last channel)
+        bit: Bit of the sync word carrying the line; None treats any
+             non-zero value as high (analog/NI digital channels)
+        chunk_samples: Samples read per chunk
+
+    Returns:
+        int64 array of sample indices of rising edges
+
+    Example:
+        >>> detect_rising_edges(np.array([[0], [64], [64], [0], [64]]))
+        array([1, 4])
+    """
+    n_samples = data.shape[0]
+    edges = []
+    previous = None
+
+    for start in range(0, n_samples, chunk_samples):
+        # Copy the strided column of this chunk only
+        column = np.asarray(data[start : start + chunk_samples, channel])
+        high = (column >> bit) & 1 if bit is not None else column != 0
+        high = high.astype(np.int8)
+
+        if previous is None:
+            previous = high[0]
+        transitions = np.diff(high, prepend=previous)
+        edges.append(np.flatnonzero(transitions > 0) + start)
+        previous = high[-1]
+
+    if not edges:
+        return np.empty(0, dtype=np.int64)
+    return np.concatenate(edges).astype(np.int64)
+
+
+def extract_sync_edges(
+    bin_path: Path,
+    meta_path: Optional[Path] = None,
+    channel: int = -1,
+    bit: Optional[int] = DEFAULT_SYNC_BIT,
+    n_channels: Optional[int] = None,
+    sample_rate: Optional[float] = None,
+    chunk_samples: int = DEFAULT_CHUNK_SAMPLES,
+) -> np.ndarray:
+    """Extract rising-edge times (seconds) from a binary stream's sync channel.
+
+    Args:
+        bin_path: Path to the binary stream (e.g. ``*.imec0.ap.bin``)
+        meta_path: Path to the SpikeGLX ``.meta`` file (optional)
+        channel: Sync channel index (default: last channel, SpikeGLX SY)
+        bit: Sync bit within the channel (None: any non-zero value)
+        n_channels: Number of interleaved channels (overrides meta)
+        sample_rate: Sample rate in Hz (overrides meta)
+        chunk_samples: Samples read per chunk
+
+    Returns:
+        float64 array of rising-edge times in seconds from the first sample
+
+    Raises:
+        SyncError: Missing file, metadata, or inconsistent file size
+
+    Example:
+        >>> edges = extract_sync_edges(Path("run_g0_t0.imec0.ap.bin"))
+    """
+    data, rate = open_sync_stream(bin_path, meta_path=meta_path, n_channels=n_channels, sample_rate=sample_rate)
+    edges = detect_rising_edges(data, channel=channel, bit=bit, chunk_samples=chunk_samples)
+    return edges / rate
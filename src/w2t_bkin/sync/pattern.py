@@ -0,0 +1,182 @@
+"""Match expected event times to a pulse train with dropped or extra pulses.
+
+Sequential matching (k-th event ↔ k-th pulse) shifts every later event after
+a single dropped or spurious pulse. Pattern matching instead aligns the
+*timing pattern* of the expected events to the pulse train:
+
+1. Offset voting: for each chunk of expected events, the clock offset is
+   the mode of the pairwise differences between the chunk and the pulses
+   around it (located from the previous chunk's offset), so the offsets
+   follow slow clock drift across long sessions.
+2. Nearest matching: each event, mapped with the interpolated chunk
+   offsets, takes the nearest pulse (via ``np.searchsorted``) if it lies
+   within the tolerance, one pulse per event.
+3. Drift refit: a robust linear clock model is fitted on the matched pairs,
+   and events are re-mapped and re-matched while this matches more events.
+
+Events without a pulse are dropped pulses; pulses without an event are extra.
+All steps are vectorized; a 50k-trial session matches in a fraction of a second.
+
+Example:
+    >>> match = match_pulse_train(bpod_sync_times, ttl_pulses)
+    >>> dropped = np.flatnonzero(match.pulse_indices < 0)
+    >>> match.extra_pulses  # indices of unmatched pulses
+"""
+
+from typing import NamedTuple, Optional, Sequence, Union
+
+import numpy as np
+
+from ..exceptions import SyncError
+from .drift import ClockDriftModel, fit_clock_drift
+
+__all__ = ["PulseTrainMatch", "match_pulse_train"]
+
+# Events per offset-voting chunk (pairwise differences grow quadratically)
+_VOTING_EVENTS = 128
+
+# Pulses searched around a chunk beyond its predicted span, in tolerances
+_VOTING_MARGIN = 8
+
+# Default tolerance as a fraction of the median inter-pulse interval
+_DEFAULT_TOLERANCE_FRACTION = 0.25
+
+# Match/refit iterations
+_MAX_REFIT_ITERATIONS = 10
+
+
+class PulseTrainMatch(NamedTuple):
+    """Result of match_pulse_train().
+
+    Attributes:
+        pulse_indices: Matched pulse index per expected event (-1 = dropped pulse)
+        extra_pulses: Indices of pulses not matched to any event
+        clock_model: Expected-time → pulse-time model fitted on the matches
+        tolerance_s: Matching tolerance used
+    """
+
+    pulse_indices: np.ndarray
+    extra_pulses: np.ndarray
+    clock_model: ClockDriftModel
+    tolerance_s: float
+
+
+def _vote_offset(expected: np.ndarray, pulses: np.ndarray, tolerance_s: float) -> float:
+    """Most frequent pulse - event difference between two sets of times."""
+    diffs = (pulses[:, None] - expected[None, :]).ravel()
+
+    bins = np.floor(diffs / tolerance_s).astype(np.int64)
+    values, counts = np.unique(bins, return_counts=True)
+
+    # Vote over pairs of adjacent bins so an offset on a bin edge is not split in two
+    previous = np.searchsorted(values, values - 1).clip(max=values.size - 1)
+    pair_counts = counts + np.where(values[previous] == values - 1, counts[previous], 0)
+    best = values[np.argmax(pair_counts)]
+
+    in_mode = diffs[(bins == best) | (bins == best - 1)]
+    return float(np.median(in_mode))
+
+
+def _chunk_offsets(expected: np.ndarray, pulses: np.ndarray, tolerance_s: float) -> np.ndarray:
+    """Pulse - event offset per expected event, voted chunk by chunk and interpolated."""
+    centers, offsets = [], []
+    offset = None
+    margin = _VOTING_MARGIN * tolerance_s
+
+    for start in range(0, expected.size, _VOTING_EVENTS):
+        chunk = expected[start : start + _VOTING_EVENTS]
+        if offset is None:
+            window = pulses[: 2 * _VOTING_EVENTS]
+        else:
+            lo, hi = np.searchsorted(pulses, [chunk[0] + offset - margin, chunk[-1] + offset + margin])
+            window = pulses[lo:hi]
+        if window.size == 0:
+            continue
+
+        offset = _vote_offset(chunk, window, tolerance_s)
+        centers.append(float(np.median(chunk)))
+        offsets.append(offset)
+
+    return np.interp(expected, centers, offsets)
+
+
+def _match_nearest(mapped: np.ndarray, pulses: np.ndarray, tolerance_s: float) -> np.ndarray:
+    """Nearest pulse within tolerance per mapped event, one event per pulse."""
+    after = np.searchsorted(pulses, mapped).clip(1, pulses.size - 1) if pulses.size > 1 else np.zeros(mapped.size, dtype=np.int64)
+    before = np.maximum(after - 1, 0)
+    nearest = np.where(np.abs(pulses[before] - mapped) <= np.abs(pulses[after] - mapped), before, after)
+    distance = np.abs(pulses[nearest] - mapped)
+
+    indices = np.where(distance <= tolerance_s, nearest, -1)
+
+    # Resolve pulses claimed by several events: the closest event keeps it
+    claimed = np.flatnonzero(indices >= 0)
+    order = claimed[np.argsort(distance[claimed], kind="stable")]
+    _, first = np.unique(indices[order], return_index=True)
+    keep = np.zeros(mapped.size, dtype=bool)
+    keep[order[first]] = True
+    indices[~keep] = -1
+    return indices
+
+
+def match_pulse_train(
+    expected_times: Union[Sequence[float], np.ndarray],
+    pulse_times: Union[Sequence[float], np.ndarray],
+    tolerance_s: Optional[float] = None,
+) -> PulseTrainMatch:
+    """Match expected event times (source clock) to a pulse train (reference clock).
+
+    Args:
+        expected_times: Sorted event times on the source clock (e.g. Bpod sync states)
+        pulse_times: Sorted pulse times on the reference clock (e.g. TTL)
+        tolerance_s: Maximum |mapped event - pulse| for a match; defaults to
+                     a quarter of the median inter-pulse interval (of the
+                     expected events if there is a single pulse)
+
+    Returns:
+        PulseTrainMatch with per-event pulse indices and extra pulse indices.
+        A single event against a single pulse has no timing pattern to
+        match, so without a tolerance it is reported as dropped.
+
+    Raises:
+        SyncError: Tolerance is not positive
+
+    Example:
+        >>> match = match_pulse_train([0.0, 1.0, 2.0, 3.0], [5.0, 6.0, 6.4, 8.0])
+        >>> match.pulse_indices, match.extra_pulses
+        (array([ 0,  1, -1,  3]), array([2]))
+    """
+    expected = np.asarray(expected_times, dtype=np.float64).ravel()
+    pulses = np.asarray(pulse_times, dtype=np.float64).ravel()
+
+    if tolerance_s is None:
+        # Both trains tick on the same schedule, so the events' spacing stands in for a lone pulse
+        intervals = np.diff(pulses) if pulses.size >= 2 else np.diff(expected)
+        if intervals.size:
+            tolerance_s = _DEFAULT_TOLERANCE_FRACTION * float(np.median(intervals))
+    if expected.size == 0 or pulses.size == 0 or tolerance_s is None:
+        identity = ClockDriftModel(intercept_s=0.0, slope=1.0, n_points=0, residual_rms_s=0.0, residual_max_s=0.0)
+        return PulseTrainMatch(np.full(expected.size, -1, dtype=np.int64), np.arange(pulses.size), identity, float(tolerance_s or 0.0))
+    if not tolerance_s > 0:
+        raise SyncError(
+            f"Cannot match pulse train: tolerance must be positive, got {tolerance_s} " f"({expected.size} events, {pulses.size} pulses; pass tolerance_s if pulse times repeat)"
+        )
+
+    offsets = _chunk_offsets(expected, pulses, tolerance_s)
+    indices = _match_nearest(expected + offsets, pulses, tolerance_s)
+    clock_model = ClockDriftModel(intercept_s=float(np.median(offsets)), slope=1.0, n_points=0, residual_rms_s=0.0, residual_max_s=0.0)
+
+    for _ in range(_MAX_REFIT_ITERATIONS):
+        matched = indices >= 0
+        if matched.sum() < 2:
+            break
+
+        clock_model = fit_clock_drift(expected[matched], pulses[indices[matched]])
+        updated = _match_nearest(clock_model.map(expected), pulses, tolerance_s)
+        if np.count_nonzero(updated >= 0) <= matched.sum():
+            break
+        indices = updated
+
+    unmatched = np.ones(pulses.size, dtype=bool)
+    unmatched[indices[indices >= 0]] = False
+    return PulseTrainMatch(indices, np.flatnonzero(unmatched), clock_model, float(tolerance_s))
@@ -0,0 +1,252 @@
+"""Validated reference timebase for repeated alignments.
+
+Wraps a float64 reference array and records whether its monotonicity has
+been verified, so aligning several modalities against the same reference
+validates it only once.
+
+Example:
+    >>> reference = ReferenceTimebase(ttl_times).validate()
+    >>> video = align_samples(frame_times, reference, config)
+    >>> pose = align_samples(pose_times, reference, config)  # no re-validation
+
+Nominal-rate sources can use UniformTimebase, which computes
+``offset_s + i / rate`` on demand instead of storing every timestamp:
+
+    >>> reference = UniformTimebase(rate=30.0, n_samples=108_000)
+    >>> reference.take(np.array([0, 30]))
+    array([0., 1.])
+"""
+
+from typing import Sequence, Union
+
+import numpy as np
+
+from ..exceptions import SyncError
+
+__all__ = ["ReferenceTimebase", "UniformTimebase", "as_reference_timebase"]
+
+# Elements compared per block when checking monotonicity (bounds temporaries)
+_VALIDATION_BLOCK = 1 << 20
+
+
+class ReferenceTimebase:
+    """Read-only float64 reference timebase with a "verified" flag.
+
+    The wrapped array is exposed as a read-only view. When wrapping an
+    existing float64 array no copy is made, so callers must not modify the
+    source array after wrapping it.
+
+    Example:
+        >>> reference = ReferenceTimebase([0.0, 1.0, 2.0]).validate()
+        >>> reference.verified
+        True
+    """
+
+    __slots__ = ("_times", "_verified")
+
+    def __init__(self, times: Union[Sequence[float], np.ndarray], verified: bool = False):
+        """Wrap reference timestamps.
+
+        Args:
+            times: Reference timestamps in seconds
+            verified: Mark as already validated (skip the monotonicity check)
+        """
+        array = np.asarray(times, dtype=np.float64).ravel()
+        view = array.view()
+        view.flags.writeable = False
+        self._times = view
+        self._verified = verified
+
+    @property
+    def times(self) -> np.ndarray:
+        """Read-only float64 array of reference timestamps."""
+        return self._times
+
+    @property
+    def verified(self) -> bool:
+        """Whether the reference has been checked for monotonicity."""
+        return self._verified
+
+    def validate(self) -> "ReferenceTimebase":
+        """Check the reference once and mark it as verified.
+
+        Runs in O(n) over fixed-size blocks, so validating a long reference
+        does not allocate a full-length temporary.
+
+        Returns:
+            self (for chaining)
+
+        Raises:
+            SyncError: Empty or non-monotonic reference
+        """
+        if self._verified:
+            return self
+
+        times = self._times
+        if times.size == 0:
+            raise SyncError("Cannot map to empty reference timebase")
+
+        for start in range(0, times.size - 1, _VALIDATION_BLOCK):
+            block = times[start : start + _VALIDATION_BLOCK + 1]
+            if np.any(block[1:] < block[:-1]):
+                raise SyncError("Reference timestamps must be monotonic")
+
+        self._verified = True
+        return self
+
+    def take(self, indices: np.ndarray) -> np.ndarray:
+        """Return reference timestamps at the given indices.
+
+        Args:
+            indices: Integer indices into the reference
+
+        Returns:
+            float64 array of timestamps
+        """
+        return self._times[indices]
+
+    def __len__(self) -> int:
+        return self._times.size
+
+    def __getitem__(self, item):
+        return self._times[item]
+
+    def __array__(self, dtype=None, copy=None):
+        if dtype is None or np.dtype(dtype) == self._times.dtype:
+            return self._times.copy() if copy else self._times
+        return self._times.astype(dtype)
+
+    def __repr__(self) -> str:
+        return f"ReferenceTimebase(n={self._times.size}, verified={self._verified})"
+
+
+class UniformTimebase(ReferenceTimebase):
+    """Virtual reference timebase ``offset_s + i / rate`` for i in [0, n_samples).
+
+    Timestamps are computed on demand; the full array is only materialized
+    (and cached) if ``times`` is accessed. Mapping functions recognise this
+    class and locate samples in closed form instead of searching an array.
+
+    Example:
+        >>> reference = UniformTimebase(rate=30.0, n_samples=100, offset_s=1.0)
+        >>> reference[30]
+        2.0
+    """
+
+    __slots__ = ("_rate", "_n_samples", "_offset_s")
+
+    def __init__(self, rate: float, n_samples: int, offset_s: float = 0.0):
+        """Define a uniform timebase.
+
+        Args:
+            rate: Sample rate in Hz
+            n_samples: Number of reference samples
+            offset_s: Timestamp of sample 0 in seconds
+
+        Raises:
+            SyncError: Non-positive rate or negative n_samples
+        """
+        if not rate > 0:
+            raise SyncError(f"Uniform timebase rate must be positive, got {rate}")
+        if n_samples < 0:
+            raise SyncError(f"Uniform timebase n_samples must be non-negative, got {n_samples}")
+        self._rate = float(rate)
+        self._n_samples = int(n_samples)
+        self._offset_s = float(offset_s)
+        self._times = None
+        self._verified = False
+
+    @property
+    def rate(self) -> float:
+        """Sample rate in Hz."""
+        return self._rate
+
+    @property
+    def offset_s(self) -> float:
+        """Timestamp of sample 0 in seconds."""
+        return self._offset_s
+
+    @property
+    def times(self) -> np.ndarray:
+        """Read-only float64 array of reference timestamps (materialized once)."""
+        if self._times is None:
+            times = self.take(np.arange(self._n_samples))
+            times.flags.writeable = False
+            self._times = times
+        return self._times
+
+    def validate(self) -> "UniformTimebase":
+        """Mark the timebase as verified (monotonic by construction).
+
+        Returns:
+            self (for chaining)
+
+        Raises:
+            SyncError: Empty timebase
+        """
+        if self._n_samples == 0:
+            raise SyncError("Cannot map to empty reference timebase")
+        self._verified = True
+        return self
+
+    def take(self, indices: np.ndarray) -> np.ndarray:
+        """Compute timestamps at the given indices without materializing the array.
+
+        Args:
+            indices: Integer indices into the reference
+
+        Returns:
+            float64 array of timestamps
+        """
+        return self._offset_s + np.asarray(indices, dtype=np.float64) / self._rate
+
+    def positions(self, sample_times: np.ndarray) -> np.ndarray:
+        """Fractional reference index of each sample time.
+
+        Args:
+            sample_times: Times to locate
+
+        Returns:
+            float64 array of (unclamped) fractional indices
+        """
+        return (np.asarray(sample_times, dtype=np.float64) - self._offset_s) * self._rate
+
+    def __len__(self) -> int:
+        return self._n_samples
+
+    def __getitem__(self, item):
+        if isinstance(item, (int, np.integer)):
+            if item < 0:
+                item += self._n_samples
+            if not 0 <= item < self._n_samples:
+                raise IndexError("UniformTimebase index out of range")
+            return float(self.take(item))
+        return self.times[item]
+
+    def __array__(self, dtype=None, copy=None):
+        times = self.times
+        if dtype is None or np.dtype(dtype) == times.dtype:
+            return times.copy() if copy else times
+        return times.astype(dtype)
+
+    def __repr__(self) -> str:
+        return f"UniformTimebase(rate={self._rate}, n={self._n_samples}, offset_s={self._offset_s})"
+
+
+def as_reference_timebase(reference_times: Union[Sequence[float], np.ndarray, ReferenceTimebase]) -> ReferenceTimebase:
+    """Return a verified ReferenceTimebase for any reference input.
+
+    Already-verified ReferenceTimebase instances are returned unchanged.
+
+    Args:
+        reference_times: Reference timestamps or ReferenceTimebase
+
+    Returns:
+        Verified ReferenceTimebase
+
+    Raises:
+        SyncError: Empty or non-monotonic reference
+    """
+    if isinstance(reference_times, ReferenceTimebase):
+        return reference_times.validate()
+    return ReferenceTimebase(reference_times).validate()
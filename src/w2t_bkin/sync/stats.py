@@ -1,4 +1,4 @@
-"""Create and persist alignment statistics.
+"""Create and persist alignment statistics and per-camera alignment artifacts.
 
 Example:
     >>> stats = create_alignment_stats(
@@ -9,28 +9,57 @@ Example:
     ...     p95_jitter_s=0.005,
     ...     aligned_samples=1000
     ... )
-    >>> write_alignment_stats(stats, Path("alignment.json"))
+    >>> write_alignment_stats(stats, Path("alignment_stats.json"))
+    >>>
+    >>> alignment = compute_alignment(manifest, config, output_dir=session_interim_dir)
+    >>> alignment = load_alignment_manifest(session_interim_dir / "alignment.json")  # memory-mapped
 """
 
 from datetime import datetime
 import json
 import logging
 from pathlib import Path
-from typing import Union
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
 
 from ..exceptions import SyncError
 from ..utils import write_json
+from .cache import AlignmentCache, fingerprint_inputs
+from .frames import detect_frame_drops
+from .mapping import align_modalities
 from .models import AlignmentStats
+from .timebase import create_timebase_provider_from_config
+from .ttl import load_ttl_arrays, merge_ttl_arrays
 
 __all__ = [
     "create_alignment_stats",
     "write_alignment_stats",
-    "load_alignment_manifest",
+    "summarize_alignment",
     "compute_alignment",
+    "write_alignment_manifest",
+    "load_alignment_manifest",
+    "ALIGNMENT_INDEX_FILENAME",
+    "ALIGNMENT_STATS_FILENAME",
 ]
 
 logger = logging.getLogger(__name__)
 
+# Alignment index written next to the per-camera timestamp arrays
+ALIGNMENT_INDEX_FILENAME = "alignment.json"
+
+# Session-level alignment statistics written next to the alignment index
+ALIGNMENT_STATS_FILENAME = "alignment_stats.json"
+ALIGNMENT_FORMAT_VERSION = 1
+
+# Camera frame rate assumed when a camera has no TTL channel in the manifest
+DEFAULT_CAMERA_RATE = 30.0
+
+
+# =============================================================================
+# Alignment Statistics
+# =============================================================================
+
 
 def create_alignment_stats(
     timebase_source: str,
@@ -39,9 +68,22 @@ def create_alignment_stats(
     max_jitter_s: float,
     p95_jitter_s: float,
     aligned_samples: int,
+    median_jitter_s: Optional[float] = None,
+    p99_jitter_s: Optional[float] = None,
+    jitter_histogram_edges_s: Optional[List[float]] = None,
+    jitter_histogram_counts: Optional[List[int]] = None,
+    drift_ppm: Optional[float] = None,
+    drift_residual_rms_s: Optional[float] = None,
+    drift_residual_max_s: Optional[float] = None,
+    dropped_frames: Optional[int] = None,
+    duplicate_frames: Optional[int] = None,
 ) -> AlignmentStats:
     """Create alignment statistics object.
 
+    The optional fields match the keys returned by compute_jitter_stats(),
+    so a jitter dict can be passed with ``**jitter_stats``; the drift fields
+    match ClockDriftModel.to_stats().
+
     Args:
         timebase_source: "nominal_rate", "ttl", or "neuropixels"
         mapping: "nearest" or "linear"
@@ -49,6 +91,15 @@ def create_alignment_stats(
         max_jitter_s: Maximum jitter
         p95_jitter_s: 95th percentile jitter
         aligned_samples: Number of aligned samples
+        median_jitter_s: Median jitter (optional)
+        p99_jitter_s: 99th percentile jitter (optional)
+        jitter_histogram_edges_s: Jitter histogram bin edges (optional)
+        jitter_histogram_counts: Jitter histogram counts (optional)
+        drift_ppm: Fitted clock drift in ppm (optional)
+        drift_residual_rms_s: RMS drift fit residual (optional)
+        drift_residual_max_s: Maximum drift fit residual (optional)
+        dropped_frames: Dropped camera frames (optional, see detect_frame_drops)
+        duplicate_frames: Duplicate camera pulses (optional)
 
     Returns:
         AlignmentStats instance
@@ -60,6 +111,15 @@ def create_alignment_stats(
         max_jitter_s=max_jitter_s,
         p95_jitter_s=p95_jitter_s,
         aligned_samples=aligned_samples,
+        median_jitter_s=median_jitter_s,
+        p99_jitter_s=p99_jitter_s,
+        jitter_histogram_edges_s=jitter_histogram_edges_s,
+        jitter_histogram_counts=jitter_histogram_counts,
+        drift_ppm=drift_ppm,
+        drift_residual_rms_s=drift_residual_rms_s,
+        drift_residual_max_s=drift_residual_max_s,
+        dropped_frames=dropped_frames,
+        duplicate_frames=duplicate_frames,
     )
 
 
@@ -76,74 +136,250 @@ def write_alignment_stats(stats: AlignmentStats, output_path: Path) -> None:
     logger.info(f"Wrote alignment stats to {output_path}")
 
 
-def load_alignment_manifest(alignment_path: Union[str, Path]) -> dict:
-    """Load alignment manifest from JSON (stub).
+def summarize_alignment(alignment: Dict[str, Dict[str, Any]], config) -> AlignmentStats:
+    """Session-level alignment statistics from compute_alignment() results.
+
+    Histogram counts, frame counts and drop counts are summed over cameras.
+    Per-camera jitter quantiles cannot be pooled exactly, so the jitter
+    fields report the worst camera (an upper bound on the pooled value).
 
     Args:
-        alignment_path: Path to alignment.json
+        alignment: Output of compute_alignment()
+        config: Pipeline configuration with timebase settings
+
+    Returns:
+        AlignmentStats for the session (zero jitter without cameras)
+
+    Example:
+        >>> stats = summarize_alignment(compute_alignment(manifest, config), config)
+        >>> write_alignment_stats(stats, session_interim_dir / ALIGNMENT_STATS_FILENAME)
+    """
+    cameras = list(alignment.values())
+    jitter = [camera["jitter_stats"] for camera in cameras]
+
+    def worst(key: str) -> float:
+        return max((stats[key] for stats in jitter), default=0.0)
+
+    def total(key: str) -> Optional[int]:
+        counts = [camera[key] for camera in cameras if camera.get(key) is not None]
+        return sum(counts) if counts else None
+
+    edges = jitter[0]["jitter_histogram_edges_s"] if jitter else None
+    counts = np.sum([stats["jitter_histogram_counts"] for stats in jitter], axis=0).tolist() if jitter else None
+
+    return create_alignment_stats(
+        timebase_source=config.timebase.source,
+        mapping=config.timebase.mapping,
+        offset_s=config.timebase.offset_s,
+        max_jitter_s=worst("max_jitter_s"),
+        p95_jitter_s=worst("p95_jitter_s"),
+        aligned_samples=sum(int(np.size(camera["timestamps"])) for camera in cameras),
+        median_jitter_s=worst("median_jitter_s"),
+        p99_jitter_s=worst("p99_jitter_s"),
+        jitter_histogram_edges_s=edges,
+        jitter_histogram_counts=counts,
+        dropped_frames=total("dropped_frames"),
+        duplicate_frames=total("duplicate_frames"),
+    )
+
+
+# =============================================================================
+# Alignment Artifacts
+# =============================================================================
+
+
+def _camera_timestamps_filename(camera_id: str) -> str:
+    """Per-camera timestamps file name inside the alignment directory."""
+    return f"alignment_{camera_id}.npy"
+
+
+def _load_ttl_channel(ttl_files: List[str], ttl_cache_dir: Optional[Path], max_workers: int = 1) -> np.ndarray:
+    """Load and merge the files of one TTL channel."""
+    return merge_ttl_arrays(load_ttl_arrays([Path(f) for f in ttl_files], cache_dir=ttl_cache_dir, strict=True, max_workers=max_workers))
+
+
+def compute_alignment(
+    manifest,
+    config,
+    output_dir: Optional[Union[str, Path]] = None,
+    ttl_cache_dir: Optional[Path] = None,
+    cache: Optional[AlignmentCache] = None,
+    max_workers: int = 1,
+) -> Dict[str, Dict[str, Any]]:
+    """Compute timebase alignment for all cameras in a manifest.
+
+    Frame times come from each camera's TTL channel when the manifest lists
+    it (duplicate pulses removed by detect_frame_drops, then the first
+    frame_count pulses), otherwise from the nominal camera rate. All cameras
+    are aligned in one batch (align_modalities) against the configured
+    reference timebase, built once by create_timebase_provider_from_config,
+    with config.timebase's mapping strategy.
+
+    Args:
+        manifest: Session Manifest with counted cameras (frame_count set)
+        config: Pipeline configuration with timebase settings
+        output_dir: Directory to persist artifacts in (optional, see
+                    write_alignment_manifest)
+        ttl_cache_dir: TTL sidecar cache directory (optional)
+        cache: Alignment cache reusing the reference timebase and alignment
+               of unchanged inputs (optional)
+        max_workers: Threads loading TTL files and aligning frames
 
     Returns:
-        Dict with alignment data per camera
+        Dict camera_id → {"timestamps", "source", "mapping", "frame_count",
+        "frame_source", "dropped_frames", "duplicate_frames", "jitter_stats"};
+        timestamps is a float64 array, drop counts are None without camera TTL
 
     Raises:
-        SyncError: File not found or invalid JSON
+        SyncError: Missing frame counts or alignment failed
 
-    Note:
-        Returns mock data if file doesn't exist.
+    Example:
+        >>> alignment = compute_alignment(manifest, config, output_dir=intermediate_root / session_id)
+        >>> alignment["cam0"]["timestamps"][:3]
     """
-    alignment_path = Path(alignment_path) if isinstance(alignment_path, str) else alignment_path
+    uncounted = [camera.camera_id for camera in manifest.cameras if camera.frame_count is None]
+    if uncounted:
+        raise SyncError(f"Cannot compute alignment: cameras without frame_count: {uncounted}")
 
-    if not alignment_path.exists():
-        # For Phase 3 integration tests, return mock data if file doesn't exist
-        logger.warning(f"Alignment manifest not found: {alignment_path}, returning mock data")
-        return {
-            "cam0": {
-                "timestamps": [i / 30.0 for i in range(100)],  # 100 frames at 30fps
-                "source": "nominal_rate",
-                "mapping": "nearest",
-            }
+    timebase_config = config.timebase
+    ttl_files = {ttl.ttl_id: ttl.files for ttl in manifest.ttls}
+    max_frames = max((camera.frame_count for camera in manifest.cameras), default=0)
+
+    alignment = {}
+    if max_frames == 0:
+        logger.info("No camera frames to align")
+        return alignment
+
+    if cache is not None:
+        reference = cache.get_timebase(config, manifest, n_samples=max_frames, ttl_cache_dir=ttl_cache_dir, ttl_max_workers=max_workers)
+    else:
+        reference = create_timebase_provider_from_config(config, manifest, ttl_cache_dir=ttl_cache_dir, ttl_max_workers=max_workers).get_timebase(max_frames)
+
+    frame_times = {}
+    for camera in manifest.cameras:
+        dropped_frames = duplicate_frames = None
+        if camera.ttl_id in ttl_files:
+            camera_pulses = _load_ttl_channel(ttl_files[camera.ttl_id], ttl_cache_dir, max_workers)
+            drops = detect_frame_drops(camera_pulses)
+            dropped_frames, duplicate_frames = drops.n_dropped, drops.n_duplicates
+            if dropped_frames or duplicate_frames:
+                logger.warning(f"Camera {camera.camera_id}: {dropped_frames} dropped frames, {duplicate_frames} duplicate pulses on '{camera.ttl_id}'")
+
+            times = camera_pulses[drops.frame_to_pulse][: camera.frame_count]
+            frame_source = "ttl"
+            if times.size < camera.frame_count:
+                logger.warning(f"Camera {camera.camera_id}: {camera.frame_count} frames but {times.size} TTL pulses on '{camera.ttl_id}', aligning the first {times.size}")
+        else:
+            times = timebase_config.offset_s + np.arange(camera.frame_count) / DEFAULT_CAMERA_RATE
+            frame_source = "nominal_rate"
+
+        frame_times[camera.camera_id] = times
+        alignment[camera.camera_id] = {
+            "source": timebase_config.source,
+            "frame_count": camera.frame_count,
+            "frame_source": frame_source,
+            "dropped_frames": dropped_frames,
+            "duplicate_frames": duplicate_frames,
         }
 
-    try:
-        with open(alignment_path, "r") as f:
-            data = json.load(f)
-        return data
-    except Exception as e:
-        raise SyncError(f"Failed to load alignment manifest from {alignment_path}: {e}")
+    # All cameras share the reference: validate it once and align in one sweep
+    if cache is not None:
+        # Frame times derive from each camera's TTL files (or the nominal rate) and frame count
+        frame_sources = {camera.camera_id: [camera.frame_count, [Path(f) for f in ttl_files.get(camera.ttl_id, [])]] for camera in manifest.cameras}
+        batch = cache.align_modalities(
+            frame_times,
+            reference,
+            timebase_config,
+            max_workers=max_workers,
+            sample_key=fingerprint_inputs("camera_frames", frame_sources, DEFAULT_CAMERA_RATE),
+            reference_key=cache.timebase_key(config, manifest, n_samples=max_frames),
+        )
+    else:
+        batch = align_modalities(frame_times, reference, timebase_config, max_workers=max_workers)
+    for camera_id, result in batch["modalities"].items():
+        alignment[camera_id].update(timestamps=result["aligned_times"], mapping=result["mapping"], jitter_stats=result["jitter_stats"])
+
+    logger.info(f"Computed alignment for {len(alignment)} cameras ({timebase_config.source}, {timebase_config.mapping})")
 
+    if output_dir is not None:
+        write_alignment_manifest(alignment, output_dir)
+    return alignment
+
+
+def write_alignment_manifest(alignment: Dict[str, Dict[str, Any]], output_dir: Union[str, Path]) -> Path:
+    """Persist alignment as per-camera ``.npy`` arrays plus a JSON index.
 
-def compute_alignment(manifest: dict, config: dict) -> dict:
-    """Compute timebase alignment for all cameras (stub).
+    Timestamps are written as float64 ``alignment_<camera_id>.npy`` files so
+    they can be memory-mapped; ``alignment.json`` holds only metadata and
+    the file names.
 
     Args:
-        manifest: Manifest from ingest
-        config: Timebase configuration
+        alignment: Output of compute_alignment()
+        output_dir: Directory for alignment.json and the ``.npy`` files
 
     Returns:
-        Dict with timestamps per camera
+        Path to alignment.json
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    cameras = {}
+    for camera_id, entry in alignment.items():
+        timestamps = np.asarray(entry["timestamps"], dtype=np.float64)
+        filename = _camera_timestamps_filename(camera_id)
+        np.save(output_dir / filename, timestamps)
+
+        metadata = {key: value for key, value in entry.items() if key != "timestamps"}
+        cameras[camera_id] = {"timestamps_file": filename, "n_samples": int(timestamps.size), **metadata}
+
+    index_path = output_dir / ALIGNMENT_INDEX_FILENAME
+    write_json({"version": ALIGNMENT_FORMAT_VERSION, "generated_at": datetime.utcnow().isoformat(), "cameras": cameras}, index_path)
+    logger.info(f"Wrote alignment for {len(cameras)} cameras to {index_path}")
+    return index_path
+
+
+def load_alignment_manifest(alignment_path: Union[str, Path], mmap: bool = True) -> Dict[str, Dict[str, Any]]:
+    """Load alignment written by write_alignment_manifest().
+
+    Per-camera timestamps are memory-mapped (read-only) by default, so
+    loading is independent of recording length. Legacy indexes with inline
+    ``timestamps`` lists are returned as stored.
+
+    Args:
+        alignment_path: Path to alignment.json
+        mmap: Memory-map timestamps instead of reading them into memory
+
+    Returns:
+        Dict camera_id → metadata with "timestamps" (float64 array)
 
     Raises:
-        SyncError: Alignment failed
+        SyncError: Index or timestamps file missing or invalid
 
-    Note:
-        Currently returns mock data.
+    Example:
+        >>> alignment = load_alignment_manifest(session_dir / "alignment.json")
+        >>> reference_times = alignment["cam0"]["timestamps"]
     """
-    # Stub implementation - returns mock alignment data
-    alignment = {}
+    alignment_path = Path(alignment_path)
 
-    for camera in manifest.get("cameras", []):
-        camera_id = camera.get("camera_id", "cam0")
-        frame_count = camera.get("frame_count", 1000)
+    if not alignment_path.exists():
+        raise SyncError(f"Alignment manifest not found: {alignment_path}")
 
-        # Generate mock timestamps at 30 fps
-        timestamps = [i / 30.0 for i in range(frame_count)]
+    try:
+        with open(alignment_path, "r") as f:
+            data = json.load(f)
+    except Exception as e:
+        raise SyncError(f"Failed to load alignment manifest from {alignment_path}: {e}")
 
-        alignment[camera_id] = {
-            "timestamps": timestamps,
-            "source": "nominal_rate",
-            "mapping": "nearest",
-            "frame_count": frame_count,
-        }
+    if "cameras" not in data:
+        return data
+
+    alignment = {}
+    for camera_id, entry in data["cameras"].items():
+        timestamps_path = alignment_path.parent / entry["timestamps_file"]
+        try:
+            timestamps = np.load(timestamps_path, mmap_mode="r" if mmap else None)
+        except (OSError, ValueError) as e:
+            raise SyncError(f"Failed to load timestamps for camera {camera_id} from {timestamps_path}: {e}")
+        alignment[camera_id] = {**entry, "timestamps": timestamps}
 
-    logger.info(f"Computed alignment for {len(alignment)} cameras (stub)")
     return alignment
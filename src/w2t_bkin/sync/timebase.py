@@ -1,6 +1,8 @@
 """Timebase providers for temporal synchronization.
 
-Provides nominal rate, TTL, and Neuropixels timebase sources.
+Provides nominal rate, TTL, and Neuropixels timebase sources. Providers
+return read-only float64 arrays; get_timebase() wraps them as a verified
+ReferenceTimebase (a virtual UniformTimebase for nominal-rate sources).
 
 Example:
     >>> from w2t_bkin.sync import create_timebase_provider
@@ -9,10 +11,16 @@ Example:
 """
 
 from abc import ABC, abstractmethod
+import logging
 from pathlib import Path
 from typing import Any, List, Optional
 
+import numpy as np
+
 from ..exceptions import SyncError
+from .neuropixels import DEFAULT_SYNC_BIT, extract_sync_edges
+from .reference import ReferenceTimebase, UniformTimebase
+from .ttl import load_ttl_arrays, merge_ttl_arrays
 
 __all__ = [
     "TimebaseProvider",
@@ -23,12 +31,25 @@ __all__ = [
     "create_timebase_provider_from_config",
 ]
 
+logger = logging.getLogger(__name__)
+
 
 # =============================================================================
 # Timebase Provider Abstraction
 # =============================================================================
 
 
+def _read_only(array: np.ndarray) -> np.ndarray:
+    """Mark a timestamp array read-only so providers can share it safely."""
+    array.flags.writeable = False
+    return array
+
+
+def _uniform_timestamps(rate: float, n_samples: int, offset_s: float) -> np.ndarray:
+    """Generate ``offset_s + i / rate`` for i in [0, n_samples) as float64."""
+    return _read_only(offset_s + np.arange(n_samples, dtype=np.float64) / rate)
+
+
 class TimebaseProvider(ABC):
     """Base class for timebase providers.
 
@@ -46,17 +67,31 @@ class TimebaseProvider(ABC):
         self.offset_s = offset_s
 
     @abstractmethod
-    def get_timestamps(self, n_samples: Optional[int] = None) -> List[float]:
+    def get_timestamps(self, n_samples: Optional[int] = None) -> np.ndarray:
         """Get timestamps from this timebase.
 
         Args:
             n_samples: Number of samples (required for synthetic timebases)
 
         Returns:
-            List of timestamps in seconds
+            Read-only float64 array of timestamps in seconds
         """
         pass
 
+    def get_timebase(self, n_samples: Optional[int] = None) -> ReferenceTimebase:
+        """Get this timebase as a verified reference for alignment.
+
+        Args:
+            n_samples: Number of samples (required for synthetic timebases)
+
+        Returns:
+            Verified ReferenceTimebase
+
+        Raises:
+            SyncError: Empty or non-monotonic timestamps
+        """
+        return ReferenceTimebase(self.get_timestamps(n_samples)).validate()
+
 
 class NominalRateProvider(TimebaseProvider):
     """Generate timestamps from constant sample rate.
@@ -76,14 +111,14 @@ class NominalRateProvider(TimebaseProvider):
         super().__init__(source="nominal_rate", offset_s=offset_s)
         self.rate = rate
 
-    def get_timestamps(self, n_samples: Optional[int] = None) -> List[float]:
+    def get_timestamps(self, n_samples: Optional[int] = None) -> np.ndarray:
         """Generate synthetic timestamps from nominal rate.
 
         Args:
             n_samples: Number of samples to generate (required)
 
         Returns:
-            List of timestamps starting at offset_s
+            Read-only float64 array of timestamps starting at offset_s
 
         Raises:
             ValueError: If n_samples is None
@@ -91,8 +126,24 @@ class NominalRateProvider(TimebaseProvider):
         if n_samples is None:
             raise ValueError("n_samples required for NominalRateProvider")
 
-        timestamps = [self.offset_s + i / self.rate for i in range(n_samples)]
-        return timestamps
+        return _uniform_timestamps(self.rate, n_samples, self.offset_s)
+
+    def get_timebase(self, n_samples: Optional[int] = None) -> UniformTimebase:
+        """Get a virtual uniform timebase (timestamps computed on demand).
+
+        Args:
+            n_samples: Number of samples (required)
+
+        Returns:
+            Verified UniformTimebase
+
+        Raises:
+            ValueError: If n_samples is None
+        """
+        if n_samples is None:
+            raise ValueError("n_samples required for NominalRateProvider")
+
+        return UniformTimebase(rate=self.rate, n_samples=n_samples, offset_s=self.offset_s).validate()
 
 
 class TTLProvider(TimebaseProvider):
@@ -103,13 +154,15 @@ class TTLProvider(TimebaseProvider):
         >>> timestamps = provider.get_timestamps()
     """
 
-    def __init__(self, ttl_id: str, ttl_files: List[str], offset_s: float = 0.0):
+    def __init__(self, ttl_id: str, ttl_files: List[str], offset_s: float = 0.0, cache_dir: Optional[Path] = None, max_workers: int = 1):
         """Initialize TTL provider.
 
         Args:
             ttl_id: Identifier for this TTL channel
             ttl_files: List of TTL file paths to load
             offset_s: Time offset to apply to all timestamps
+            cache_dir: TTL sidecar cache directory (None disables caching)
+            max_workers: Number of threads loading TTL files concurrently
 
         Raises:
             SyncError: If TTL files cannot be loaded or parsed
@@ -117,6 +170,8 @@ class TTLProvider(TimebaseProvider):
         super().__init__(source="ttl", offset_s=offset_s)
         self.ttl_id = ttl_id
         self.ttl_files = ttl_files
+        self.cache_dir = cache_dir
+        self.max_workers = max_workers
         self._timestamps = None
         self._load_timestamps()
 
@@ -126,69 +181,94 @@ class TTLProvider(TimebaseProvider):
         Raises:
             SyncError: If TTL file not found or invalid format
         """
-        timestamps = []
-
-        for ttl_file in self.ttl_files:
-            path = Path(ttl_file)
-            if not path.exists():
-                raise SyncError(f"TTL file not found: {ttl_file}")
-
-            try:
-                with open(path, "r") as f:
-                    for line in f:
-                        line = line.strip()
-                        if line:
-                            timestamps.append(float(line))
-            except Exception as e:
-                raise SyncError(f"Failed to parse TTL file {ttl_file}: {e}")
-
-        # Apply offset and sort
-        self._timestamps = [t + self.offset_s for t in sorted(timestamps)]
-
-    def get_timestamps(self, n_samples: Optional[int] = None) -> List[float]:
+        paths = [Path(ttl_file) for ttl_file in self.ttl_files]
+        arrays = load_ttl_arrays(paths, cache_dir=self.cache_dir, strict=True, max_workers=self.max_workers)
+
+        # Merge per-file runs and apply offset
+        array = merge_ttl_arrays(arrays)
+        array += self.offset_s
+        self._timestamps = _read_only(array)
+
+    def get_timestamps(self, n_samples: Optional[int] = None) -> np.ndarray:
         """Get timestamps from TTL files.
 
         Args:
             n_samples: Ignored for TTL provider (returns all loaded timestamps)
 
         Returns:
-            List of timestamps from TTL files (sorted)
+            Read-only float64 array of timestamps from TTL files (sorted)
         """
         return self._timestamps
 
 
 class NeuropixelsProvider(TimebaseProvider):
-    """Load timestamps from Neuropixels recordings (stub).
+    """Load timestamps from a Neuropixels recording's sync channel.
+
+    With ``bin_path`` set, the reference timebase is the rising edges of the
+    sync line in the binary stream (SpikeGLX ``.bin`` + ``.meta``), extracted
+    lazily and chunk by chunk from a memory map on first use. Without a
+    recording the provider falls back to synthetic 30 kHz timestamps.
 
-    Currently generates synthetic 30 kHz timestamps.
+    Example:
+        >>> provider = NeuropixelsProvider(stream="imec0.ap", bin_path=Path("run_g0_t0.imec0.ap.bin"))
+        >>> edges = provider.get_timestamps()
     """
 
-    def __init__(self, stream: str, offset_s: float = 0.0):
+    def __init__(
+        self,
+        stream: str,
+        offset_s: float = 0.0,
+        bin_path: Optional[Path] = None,
+        meta_path: Optional[Path] = None,
+        sync_channel: int = -1,
+        sync_bit: Optional[int] = DEFAULT_SYNC_BIT,
+    ):
         """Initialize Neuropixels provider.
 
         Args:
             stream: Neuropixels stream identifier
             offset_s: Time offset to apply
+            bin_path: Binary stream to read sync edges from (None: stub)
+            meta_path: SpikeGLX ``.meta`` file (default: next to bin_path)
+            sync_channel: Sync channel index (default: last channel)
+            sync_bit: Sync bit within the channel (None: any non-zero value)
         """
         super().__init__(source="neuropixels", offset_s=offset_s)
         self.stream = stream
+        self.bin_path = Path(bin_path) if bin_path is not None else None
+        self.meta_path = Path(meta_path) if meta_path is not None else None
+        self.sync_channel = sync_channel
+        self.sync_bit = sync_bit
+        self._timestamps: Optional[np.ndarray] = None
 
-    def get_timestamps(self, n_samples: Optional[int] = None) -> List[float]:
-        """Get timestamps from Neuropixels stream (stub).
+    def get_timestamps(self, n_samples: Optional[int] = None) -> np.ndarray:
+        """Get timestamps from the Neuropixels sync channel.
 
         Args:
-            n_samples: Number of samples (default: 1000)
+            n_samples: Ignored when reading a recording; number of stub
+                       samples otherwise (default: 1000)
 
         Returns:
-            Stub timestamps at 30 kHz sampling rate
+            Read-only float64 array of rising-edge times (offset applied), or
+            stub timestamps at 30 kHz without a recording
+
+        Raises:
+            SyncError: Recording or metadata missing or malformed
         """
-        if n_samples is None:
-            n_samples = 1000
+        if self.bin_path is None:
+            if n_samples is None:
+                n_samples = 1000
+
+            # Stub: 30 kHz sampling
+            rate = 30000.0
+            return _uniform_timestamps(rate, n_samples, self.offset_s)
 
-        # Stub: 30 kHz sampling
-        rate = 30000.0
-        timestamps = [self.offset_s + i / rate for i in range(n_samples)]
-        return timestamps
+        if self._timestamps is None:
+            edges = extract_sync_edges(self.bin_path, meta_path=self.meta_path, channel=self.sync_channel, bit=self.sync_bit)
+            edges += self.offset_s
+            self._timestamps = _read_only(edges)
+
+        return self._timestamps
 
 
 # =============================================================================
@@ -203,6 +283,9 @@ def create_timebase_provider(
     ttl_id: Optional[str] = None,
     ttl_files: Optional[List[str]] = None,
     neuropixels_stream: Optional[str] = None,
+    ttl_cache_dir: Optional[Path] = None,
+    ttl_max_workers: int = 1,
+    neuropixels_bin: Optional[Path] = None,
 ) -> TimebaseProvider:
     """Create timebase provider.
 
@@ -213,6 +296,10 @@ def create_timebase_provider(
         ttl_id: TTL channel ID (required for ttl)
         ttl_files: TTL file paths (required for ttl)
         neuropixels_stream: Stream ID (required for neuropixels)
+        ttl_cache_dir: TTL sidecar cache directory (optional, ttl only)
+        ttl_max_workers: Threads loading TTL files concurrently (ttl only)
+        neuropixels_bin: Binary stream with the sync channel (neuropixels
+                         only; None uses synthetic timestamps)
 
     Returns:
         TimebaseProvider instance
@@ -234,18 +321,18 @@ def create_timebase_provider(
             raise SyncError("ttl_id required when source='ttl'")
         if ttl_files is None:
             raise SyncError("ttl_files required when source='ttl'")
-        return TTLProvider(ttl_id=ttl_id, ttl_files=ttl_files, offset_s=offset_s)
+        return TTLProvider(ttl_id=ttl_id, ttl_files=ttl_files, offset_s=offset_s, cache_dir=ttl_cache_dir, max_workers=ttl_max_workers)
 
     elif source == "neuropixels":
         if neuropixels_stream is None:
             raise SyncError("neuropixels_stream required when source='neuropixels'")
-        return NeuropixelsProvider(stream=neuropixels_stream, offset_s=offset_s)
+        return NeuropixelsProvider(stream=neuropixels_stream, offset_s=offset_s, bin_path=neuropixels_bin)
 
     else:
         raise SyncError(f"Invalid timebase source: {source}")
 
 
-def create_timebase_provider_from_config(config, manifest: Optional[Any] = None) -> TimebaseProvider:
+def create_timebase_provider_from_config(config, manifest: Optional[Any] = None, ttl_cache_dir: Optional[Path] = None, ttl_max_workers: int = 1) -> TimebaseProvider:
     """Create timebase provider from Config and Manifest (high-level wrapper).
 
     Convenience wrapper that extracts primitive arguments from Config/Manifest
@@ -253,7 +340,12 @@ def create_timebase_provider_from_config(config, manifest: Optional[Any] = None)
 
     Args:
         config: Pipeline configuration with timebase settings
-        manifest: Session manifest (required for TTL provider)
+        manifest: Session manifest (required for TTL provider; used to locate
+                  the Neuropixels ``*<stream>.bin`` under the raw session,
+                  without it the provider returns stub timestamps)
+        ttl_cache_dir: TTL sidecar cache directory (optional, e.g.
+                       intermediate_root / TTL_CACHE_DIRNAME)
+        ttl_max_workers: Threads loading TTL files concurrently
 
     Returns:
         TimebaseProvider instance
@@ -298,14 +390,43 @@ def create_timebase_provider_from_config(config, manifest: Optional[Any] = None)
         if not ttl_files:
             raise SyncError(f"TTL {ttl_id} not found in manifest")
 
-        return create_timebase_provider(source="ttl", ttl_id=ttl_id, ttl_files=ttl_files, offset_s=offset_s)
+        return create_timebase_provider(source="ttl", ttl_id=ttl_id, ttl_files=ttl_files, offset_s=offset_s, ttl_cache_dir=ttl_cache_dir, ttl_max_workers=ttl_max_workers)
 
     elif source == "neuropixels":
         stream = config.timebase.neuropixels_stream
         if not stream:
             raise SyncError("timebase.neuropixels_stream required when source='neuropixels'")
 
-        return create_timebase_provider(source="neuropixels", neuropixels_stream=stream, offset_s=offset_s)
+        bin_path = _find_neuropixels_bin(config, manifest, stream)
+        if bin_path is None:
+            logger.warning(f"No manifest given for Neuropixels stream '{stream}': using synthetic 30 kHz timestamps")
+        return create_timebase_provider(source="neuropixels", neuropixels_stream=stream, offset_s=offset_s, neuropixels_bin=bin_path)
 
     else:
         raise SyncError(f"Invalid timebase source: {source}")
+
+
+def _find_neuropixels_bin(config, manifest: Optional[Any], stream: str) -> Optional[Path]:
+    """Locate ``*<stream>.bin`` under the raw session directory.
+
+    Returns:
+        Path to the binary stream, or None if there is no manifest
+
+    Raises:
+        SyncError: Empty stream name (would match every ``.bin``), or no
+                   file or several files match the stream
+    """
+    if not stream:
+        raise SyncError("timebase.neuropixels_stream required when source='neuropixels'")
+
+    if manifest is None:
+        return None
+
+    session_dir = Path(config.paths.raw_root) / manifest.session_id
+    matches = sorted(session_dir.rglob(f"*{stream}.bin"))
+
+    if not matches:
+        raise SyncError(f"No Neuropixels file matches stream '{stream}' (*{stream}.bin) under {session_dir}")
+    if len(matches) > 1:
+        raise SyncError(f"Multiple Neuropixels files match stream '{stream}': {[str(m) for m in matches]}")
+    return matches[0]
@@ -3,66 +3,485 @@
 Provides hardware-agnostic TTL pulse loading for cameras, behavioral
 equipment, and neural recordings.
 
+Files are parsed in bulk with NumPy's C text reader; only files with
+malformed lines go through the slower per-line parser, which skips and
+reports each invalid line.
+
+Parsed files can be cached as ``.npy`` sidecars in a cache directory
+(typically under ``paths.intermediate_root``). Each sidecar records the
+source size, mtime and SHA256, so a TTL text file is parsed once, then
+memory-mapped on later loads until the source changes.
+
+Pulse counts (``count_ttl_lines``) stream the file in binary blocks, or
+come straight from the sidecar metadata when a cache directory is given.
+
 Example:
     >>> from pathlib import Path
     >>> ttl_patterns = {"ttl_camera": "TTLs/cam*.txt"}
     >>> ttl_pulses = get_ttl_pulses(ttl_patterns, Path("data/session"))
+    >>> pulses = load_ttl_array(Path("TTLs/cam0.txt"), cache_dir=Path("data/interim/ttl_cache"))
 """
 
+from concurrent.futures import ThreadPoolExecutor
 import glob
+import hashlib
+import json
 import logging
+import os
 from pathlib import Path
-from typing import Dict, List
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+import warnings
+
+import numpy as np
 
 from ..exceptions import SyncError
+from ..utils import compute_file_checksum
 
-__all__ = ["get_ttl_pulses", "load_ttl_file"]
+__all__ = ["TTL_CACHE_DIRNAME", "count_ttl_lines", "get_ttl_pulses", "load_ttl_array", "load_ttl_arrays", "load_ttl_file", "merge_ttl_arrays"]
 
 logger = logging.getLogger(__name__)
 
+# Default cache subdirectory under paths.intermediate_root
+TTL_CACHE_DIRNAME = "ttl_cache"
 
-def load_ttl_file(path: Path) -> List[float]:
-    """Load TTL timestamps from a file.
+# Read size for streaming line counts
+_COUNT_BLOCK_BYTES = 1 << 20
 
-    Expects one timestamp per line in seconds.
+# Bump when the sidecar layout or parsing rules change
+_CACHE_VERSION = 2
+
+
+# =============================================================================
+# Parsing
+# =============================================================================
+
+
+def _parse_ttl_bulk(path: Path) -> Optional[np.ndarray]:
+    """Parse a well-formed TTL file in one vectorized pass.
 
     Args:
         path: Path to TTL file
 
     Returns:
-        List of timestamps
+        float64 array in file order, or None if any line is malformed (not
+        exactly one numeric token), so the caller can fall back
+    """
+    try:
+        with warnings.catch_warnings():
+            # Empty files are valid (no pulses); loadtxt warns about them
+            warnings.simplefilter("ignore", UserWarning)
+            timestamps = np.loadtxt(path, dtype=np.float64, comments=None, ndmin=2)
+    except ValueError:
+        return None
+
+    # Several tokens on a line parse as extra columns (even for a one-line
+    # file with ndmin=2); the per-line path rejects those lines
+    if timestamps.shape[1] != 1:
+        return None
+
+    return timestamps.ravel()
+
+
+def _parse_ttl_lines(path: Path) -> Tuple[np.ndarray, int]:
+    """Parse a TTL file line by line, skipping invalid lines with a warning.
+
+    Args:
+        path: Path to TTL file
+
+    Returns:
+        (timestamps, invalid_lines) with timestamps as float64 array in file
+        order and the number of skipped non-numeric lines
+    """
+    timestamps = []
+    invalid_lines = 0
+
+    with open(path, "r") as f:
+        for line_num, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+
+            try:
+                timestamps.append(float(line))
+            except ValueError:
+                invalid_lines += 1
+                logger.warning(f"Skipping invalid TTL timestamp in {path.name} line {line_num}: {line}")
+
+    return np.asarray(timestamps, dtype=np.float64), invalid_lines
+
+
+def _parse_ttl_file(path: Path) -> Tuple[np.ndarray, int]:
+    """Parse a TTL text file (one timestamp per line).
+
+    Tries the bulk parser first and falls back to the per-line parser when
+    the file contains malformed lines.
+
+    Args:
+        path: Path to TTL file
+
+    Returns:
+        (timestamps, invalid_lines) with timestamps as float64 array in file
+        order and the number of skipped non-numeric lines
 
     Raises:
-        SyncError: File not found or read error
+        SyncError: Read error
+    """
+    try:
+        timestamps = _parse_ttl_bulk(path)
+        if timestamps is not None:
+            return timestamps, 0
+
+        logger.debug(f"Malformed lines in {path.name}; parsing line by line")
+        return _parse_ttl_lines(path)
+    except Exception as e:
+        raise SyncError(f"Failed to read TTL file {path}: {e}")
+
+
+# ASCII bytes str.strip() removes: space, \t, \n, \v, \f, \r
+_LINE_BREAKS = np.array([10, 13], dtype=np.uint8)
+_BLANKS = np.array([9, 11, 12, 32], dtype=np.uint8)
+
+
+def _count_nonblank_lines(path: Path, block_size: int = _COUNT_BLOCK_BYTES) -> int:
+    """Count non-blank lines by scanning the file in binary blocks.
+
+    Matches counting ``line.strip()`` over the text-mode lines (``\\n``,
+    ``\\r\\n`` and ``\\r`` endings) without decoding or keeping lines:
+    a line is counted when its last non-blank byte is followed by a line
+    break or the end of the file.
+
+    Args:
+        path: Path to text file
+        block_size: Bytes read per block
+
+    Returns:
+        Number of lines containing at least one non-whitespace byte
+    """
+    count = 0
+    in_line = False  # last significant byte seen was content
+
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(block_size)
+            if not block:
+                break
+
+            data = np.frombuffer(block, dtype=np.uint8)
+            is_break = np.isin(data, _LINE_BREAKS)
+            significant = ~np.isin(data, _BLANKS)
+
+            # Content/break sequence of this block, prefixed with carried state
+            is_content = np.concatenate(([in_line], ~is_break[significant]))
+            count += int(np.count_nonzero(is_content[:-1] & ~is_content[1:]))
+            in_line = bool(is_content[-1])
+
+    return count + int(in_line)
+
+
+# =============================================================================
+# Sidecar Cache
+# =============================================================================
+
+
+def _sidecar_paths(path: Path, cache_dir: Path) -> Tuple[Path, Path]:
+    """Return (array, metadata) sidecar paths for a TTL source file.
+
+    The name combines the source stem with a digest of its resolved path, so
+    identically named files from different sessions do not collide.
+    """
+    key = hashlib.sha256(str(path.resolve()).encode("utf-8")).hexdigest()[:16]
+    stem = f"{path.stem}-{key}"
+    return cache_dir / f"{stem}.npy", cache_dir / f"{stem}.json"
+
+
+def _read_sidecar(path: Path, array_path: Path, meta_path: Path) -> Optional[Tuple[np.ndarray, int]]:
+    """Return the cached array if the sidecar still matches its source.
+
+    Size and mtime are checked first; if only the mtime changed (e.g. the
+    file was touched or copied), the SHA256 decides and the metadata is
+    refreshed without re-parsing.
+
+    Returns:
+        (memory-mapped timestamps, invalid_lines), or None on a miss
+    """
+    if not (array_path.exists() and meta_path.exists()):
+        return None
+
+    meta = json.loads(meta_path.read_text())
+    if meta.get("version") != _CACHE_VERSION:
+        return None
+
+    stat = path.stat()
+    if meta["size"] != stat.st_size:
+        return None
+
+    if meta["mtime_ns"] != stat.st_mtime_ns:
+        if meta["sha256"] != compute_file_checksum(path):
+            return None
+        meta["mtime_ns"] = stat.st_mtime_ns
+        _write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+
+    return np.load(array_path, mmap_mode="r"), meta.get("invalid_lines", 0)
+
+
+def _write_sidecar(path: Path, array_path: Path, meta_path: Path, timestamps: np.ndarray, invalid_lines: int) -> None:
+    """Write array and metadata sidecars (metadata last, so a torn write is a miss)."""
+    array_path.parent.mkdir(parents=True, exist_ok=True)
+
+    tmp_array = _tmp_path(array_path)
+    with open(tmp_array, "wb") as f:
+        np.save(f, timestamps)
+    os.replace(tmp_array, array_path)
+
+    stat = path.stat()
+    meta = {
+        "version": _CACHE_VERSION,
+        "source": str(path.resolve()),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": compute_file_checksum(path),
+        "count": int(timestamps.size),
+        "invalid_lines": invalid_lines,
+    }
+    _write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+
+
+def _tmp_path(path: Path) -> Path:
+    """Temporary sibling path, unique per process and thread."""
+    return path.with_name(f"{path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write bytes via a temporary file and atomic rename."""
+    tmp_path = _tmp_path(path)
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def _load_ttl(path: Path, cache_dir: Optional[Path]) -> Tuple[np.ndarray, int]:
+    """Load a TTL file through the sidecar cache (if enabled).
+
+    Cache failures are logged and fall back to parsing the text file.
     """
     if not path.exists():
         raise SyncError(f"TTL file not found: {path}")
 
-    timestamps = []
+    if cache_dir is None:
+        return _parse_ttl_file(path)
+
+    array_path, meta_path = _sidecar_paths(path, Path(cache_dir))
 
     try:
-        with open(path, "r") as f:
-            for line_num, line in enumerate(f, start=1):
-                line = line.strip()
-                if not line:
-                    continue
-
-                try:
-                    timestamps.append(float(line))
-                except ValueError:
-                    logger.warning(f"Skipping invalid TTL timestamp in {path.name} line {line_num}: {line}")
+        cached = _read_sidecar(path, array_path, meta_path)
     except Exception as e:
-        raise SyncError(f"Failed to read TTL file {path}: {e}")
+        logger.warning(f"Ignoring unreadable TTL cache for {path.name}: {e}")
+        cached = None
+
+    if cached is not None:
+        logger.debug(f"Loaded {cached[0].size} TTL pulses for {path.name} from cache")
+        return cached
+
+    timestamps, invalid_lines = _parse_ttl_file(path)
+
+    try:
+        _write_sidecar(path, array_path, meta_path, timestamps, invalid_lines)
+    except Exception as e:
+        logger.warning(f"Failed to write TTL cache for {path.name}: {e}")
+
+    return timestamps, invalid_lines
+
+
+# =============================================================================
+# Multi-file Merge
+# =============================================================================
+
+
+def _is_sorted(array: np.ndarray) -> bool:
+    """Check non-decreasing order in one vectorized pass."""
+    return bool(np.all(array[1:] >= array[:-1]))
+
+
+def merge_ttl_arrays(arrays: List[np.ndarray]) -> np.ndarray:
+    """Merge per-file TTL timestamp arrays into one sorted array.
+
+    Each file is expected to be time-ordered already (files that are not are
+    sorted individually, with a warning). Runs are then ordered by their first
+    pulse; if they do not overlap (the usual case for rolling acquisition
+    files) they are simply concatenated. Otherwise the concatenated runs are
+    merged with a stable sort, whose run detection (timsort) merges the k
+    sorted runs in O(n log k).
+
+    Args:
+        arrays: Timestamp arrays, one per TTL file
+
+    Returns:
+        Sorted float64 array of all timestamps (always a new array)
+
+    Example:
+        >>> merge_ttl_arrays([np.array([0.0, 1.0]), np.array([2.0, 3.0])])
+        array([0., 1., 2., 3.])
+    """
+    runs = []
+    for array in arrays:
+        array = np.asarray(array, dtype=np.float64)
+        if array.size == 0:
+            continue
+        if not _is_sorted(array):
+            logger.warning("TTL file is not time-ordered; sorting it before merging")
+            array = np.sort(array)
+        runs.append(array)
+
+    if not runs:
+        return np.empty(0, dtype=np.float64)
+
+    # Order runs by first pulse so non-overlapping files line up end to end
+    runs.sort(key=lambda run: run[0])
+    merged = np.concatenate(runs)
+
+    if all(later[0] >= earlier[-1] for earlier, later in zip(runs, runs[1:])):
+        return merged
+
+    logger.debug(f"Merging {len(runs)} overlapping TTL files")
+    merged.sort(kind="stable")
+    return merged
+
+
+# =============================================================================
+# Public API
+# =============================================================================
+
+
+def load_ttl_array(path: Path, cache_dir: Optional[Path] = None, strict: bool = False) -> np.ndarray:
+    """Load TTL timestamps from a file as a float64 array.
+
+    Expects one timestamp per line in seconds. With ``cache_dir`` set, the
+    parsed array is stored as an ``.npy`` sidecar and memory-mapped
+    (read-only) on later calls until the source file changes.
+
+    Args:
+        path: Path to TTL file
+        cache_dir: Sidecar cache directory (None disables caching)
+        strict: Raise instead of skipping non-numeric lines
+
+    Returns:
+        float64 array of timestamps in file order
+
+    Raises:
+        SyncError: File not found, read error, or invalid lines in strict mode
+
+    Example:
+        >>> pulses = load_ttl_array(Path("TTLs/cam0.txt"), cache_dir=Path("data/interim/ttl_cache"))
+    """
+    path = Path(path)
+    timestamps, invalid_lines = _load_ttl(path, cache_dir)
+
+    if strict and invalid_lines:
+        raise SyncError(f"Failed to parse TTL file {path}: {invalid_lines} invalid line(s)")
 
     return timestamps
 
 
-def get_ttl_pulses(ttl_patterns: Dict[str, str], session_dir: Path) -> Dict[str, List[float]]:
+def count_ttl_lines(path: Path, cache_dir: Optional[Path] = None) -> int:
+    """Count pulse lines (non-blank lines) in a TTL file.
+
+    Without ``cache_dir`` the file is streamed in binary blocks and never
+    held in memory. With ``cache_dir`` the count comes from the sidecar
+    (parsing the file and writing the sidecar on a miss), so a later
+    load_ttl_array() of the same file does not read the text again.
+
+    Invalid lines are counted as well, matching a plain line count.
+
+    Args:
+        path: Path to TTL file
+        cache_dir: Sidecar cache directory (None streams the text file)
+
+    Returns:
+        Number of non-blank lines
+
+    Raises:
+        SyncError: File not found or read error
+
+    Example:
+        >>> n_pulses = count_ttl_lines(Path("TTLs/cam0.txt"), cache_dir=Path("data/interim/ttl_cache"))
+    """
+    path = Path(path)
+    if cache_dir is not None:
+        timestamps, invalid_lines = _load_ttl(path, cache_dir)
+        return int(timestamps.size) + invalid_lines
+
+    if not path.exists():
+        raise SyncError(f"TTL file not found: {path}")
+
+    try:
+        return _count_nonblank_lines(path)
+    except OSError as e:
+        raise SyncError(f"Failed to read TTL file {path}: {e}")
+
+
+def load_ttl_arrays(paths: Sequence[Path], cache_dir: Optional[Path] = None, strict: bool = False, max_workers: int = 1) -> List[np.ndarray]:
+    """Load several TTL files, optionally concurrently.
+
+    With ``max_workers > 1`` files are read in a thread pool, which hides
+    per-file open latency on network filesystems. Results are always returned
+    in input order, and the first failing file (in input order) raises.
+
+    Args:
+        paths: TTL file paths
+        cache_dir: Sidecar cache directory (None disables caching)
+        strict: Raise instead of skipping non-numeric lines
+        max_workers: Number of loader threads (1 loads sequentially)
+
+    Returns:
+        List of float64 arrays, one per path, in input order
+
+    Raises:
+        SyncError: File not found, read error, or invalid lines in strict mode
+
+    Example:
+        >>> arrays = load_ttl_arrays(sorted(Path("TTLs").glob("*.txt")), max_workers=8)
+    """
+
+    def load(path: Path) -> np.ndarray:
+        return load_ttl_array(Path(path), cache_dir=cache_dir, strict=strict)
+
+    if max_workers <= 1 or len(paths) <= 1:
+        return [load(path) for path in paths]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths)), thread_name_prefix="ttl-loader") as executor:
+        return list(executor.map(load, paths))
+
+
+def load_ttl_file(path: Path, cache_dir: Optional[Path] = None) -> List[float]:
+    """Load TTL timestamps from a file.
+
+    Expects one timestamp per line in seconds.
+
+    Args:
+        path: Path to TTL file
+        cache_dir: Sidecar cache directory (None disables caching)
+
+    Returns:
+        List of timestamps
+
+    Raises:
+        SyncError: File not found or read error
+    """
+    return load_ttl_array(path, cache_dir=cache_dir).tolist()
+
+
+def get_ttl_pulses(ttl_patterns: Dict[str, str], session_dir: Path, cache_dir: Optional[Path] = None, max_workers: int = 1) -> Dict[str, List[float]]:
     """Load TTL pulses from multiple files using glob patterns.
 
+    Files of all channels are loaded in one batch, so ``max_workers > 1``
+    reads channels and rolled files concurrently. Output order and content do
+    not depend on the worker count.
+
     Args:
         ttl_patterns: Dict mapping TTL ID to glob pattern
         session_dir: Base directory for patterns
+        cache_dir: Sidecar cache directory (None disables caching)
+        max_workers: Number of loader threads (1 loads sequentially)
 
     Returns:
         Dict mapping TTL ID to sorted timestamp list
@@ -72,30 +491,30 @@ def get_ttl_pulses(ttl_patterns: Dict[str, str], session_dir: Path) -> Dict[str,
 
     Example:
         >>> ttl_patterns = {"ttl_camera": "TTLs/cam*.txt"}
-        >>> ttl_pulses = get_ttl_pulses(ttl_patterns, Path("data/session"))
+        >>> ttl_pulses = get_ttl_pulses(ttl_patterns, Path("data/session"), max_workers=8)
     """
     session_dir = Path(session_dir)
-    ttl_pulses = {}
 
+    # Resolve glob patterns
+    files_by_id: Dict[str, List[str]] = {}
     for ttl_id, pattern_str in ttl_patterns.items():
-        # Resolve glob pattern
         pattern = str(session_dir / pattern_str)
-        ttl_files = sorted(glob.glob(pattern))
+        files_by_id[ttl_id] = sorted(glob.glob(pattern))
 
-        if not ttl_files:
+        if not files_by_id[ttl_id]:
             logger.warning(f"No TTL files found for '{ttl_id}' with pattern: {pattern}")
-            ttl_pulses[ttl_id] = []
-            continue
 
-        # Load and merge timestamps from all files
-        timestamps = []
-        for ttl_file in ttl_files:
-            path = Path(ttl_file)
-            file_timestamps = load_ttl_file(path)
-            timestamps.extend(file_timestamps)
+    # Load all files in one (possibly concurrent) batch
+    all_files = [Path(ttl_file) for ttl_files in files_by_id.values() for ttl_file in ttl_files]
+    arrays = iter(load_ttl_arrays(all_files, cache_dir=cache_dir, max_workers=max_workers))
+
+    # Merge timestamps per channel, in pattern order
+    ttl_pulses = {}
+    for ttl_id, ttl_files in files_by_id.items():
+        timestamps = merge_ttl_arrays([next(arrays) for _ in ttl_files])
 
-        # Sort timestamps and store
-        ttl_pulses[ttl_id] = sorted(timestamps)
-        logger.debug(f"Loaded {len(timestamps)} TTL pulses for '{ttl_id}' from {len(ttl_files)} file(s)")
+        ttl_pulses[ttl_id] = timestamps.tolist()
+        if ttl_files:
+            logger.debug(f"Loaded {timestamps.size} TTL pulses for '{ttl_id}' from {len(ttl_files)} file(s)")
 
     return ttl_pulses
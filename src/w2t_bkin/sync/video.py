@@ -35,6 +35,7 @@ def sync_video_frames_to_timebase(
 
     Returns:
         Dict with indices, frame_times_aligned, jitter_stats, and mapping
+        (ndarrays as returned by align_samples)
 
     Raises:
         JitterBudgetExceeded: Jitter exceeds budget
@@ -51,25 +52,10 @@ def sync_video_frames_to_timebase(
     # Perform alignment using generic strategy
     result = align_samples(frame_times, reference_times, timebase_config, enforce_budget)
 
-    indices = result["indices"]
-
-    # Extract aligned timestamps from reference
-    if timebase_config.mapping == "nearest":
-        # Simple indexing for nearest neighbor
-        frame_times_aligned = [reference_times[idx] for idx in indices]
-    elif timebase_config.mapping == "linear":
-        # Weighted average for linear interpolation
-        frame_times_aligned = []
-        weights = result.get("weights", [])
-        for (idx0, idx1), (w0, w1) in zip(indices, weights):
-            t_aligned = w0 * reference_times[idx0] + w1 * reference_times[idx1]
-            frame_times_aligned.append(t_aligned)
-    else:
-        # Fallback: use nearest
-        frame_times_aligned = [reference_times[indices[0]] for _ in frame_indices]
+    frame_times_aligned = result["aligned_times"]
 
     return {
-        "indices": indices,
+        "indices": result["indices"],
         "frame_times_aligned": frame_times_aligned,
         "jitter_stats": result["jitter_stats"],
         "mapping": result["mapping"],
@@ -579,7 +579,19 @@ class VideoAnalysisError(Exception):
     pass
 
 
-def run_ffprobe(video_path: Path, timeout: int = 30) -> int:
+# ffprobe frame counting strategies, fastest first:
+# - header: nb_frames from the container header (instant, missing for some containers)
+# - packets: demux and count packets (no decode)
+# - decode: decode and count every frame (slow, exact)
+FFPROBE_COUNT_ARGS = {
+    "header": ["-show_entries", "stream=nb_frames"],
+    "packets": ["-count_packets", "-show_entries", "stream=nb_read_packets"],
+    "decode": ["-count_frames", "-show_entries", "stream=nb_read_frames"],
+}
+FRAME_COUNT_STRATEGIES = tuple(FFPROBE_COUNT_ARGS)
+
+
+def run_ffprobe(video_path: Path, timeout: int = 30, strategy: str = "decode") -> int:
     """Count frames in a video file using ffprobe.
 
     Uses ffprobe to accurately count video frames by reading the stream metadata.
@@ -588,20 +600,26 @@ def run_ffprobe(video_path: Path, timeout: int = 30) -> int:
     Args:
         video_path: Path to video file
         timeout: Maximum time in seconds to wait for ffprobe (default: 30)
+        strategy: "header" (container nb_frames), "packets" (demux only) or
+                  "decode" (full decode, default)
 
     Returns:
         Number of frames in video
 
     Raises:
-        VideoAnalysisError: If video file is invalid or ffprobe fails
+        VideoAnalysisError: If video file is invalid, ffprobe fails, or the
+                            header has no frame count
         FileNotFoundError: If video file does not exist
-        ValueError: If video_path is not a valid path
+        ValueError: If video_path is not a valid path or strategy is unknown
 
     Security:
         - Input path validation to prevent command injection
         - Subprocess timeout to prevent hanging
         - stderr capture for diagnostic information
     """
+    if strategy not in FFPROBE_COUNT_ARGS:
+        raise ValueError(f"Unknown frame count strategy '{strategy}', expected one of {FRAME_COUNT_STRATEGIES}")
+
     # Input validation
     if not isinstance(video_path, Path):
         video_path = Path(video_path)
@@ -615,11 +633,10 @@ def run_ffprobe(video_path: Path, timeout: int = 30) -> int:
     # Sanitize path - resolve to absolute path to prevent injection
     video_path = video_path.resolve()
 
-    # ffprobe command to count frames accurately
+    # ffprobe command to count frames
     # -v error: only show errors
     # -select_streams v:0: select first video stream
-    # -count_frames: actually count frames (slower but accurate)
-    # -show_entries stream=nb_read_frames: output only frame count
+    # strategy args: what to count and which stream entry to output
     # -of csv=p=0: output as CSV without header
     command = [
         "ffprobe",
@@ -627,9 +644,7 @@ def run_ffprobe(video_path: Path, timeout: int = 30) -> int:
         "error",
         "-select_streams",
         "v:0",
-        "-count_frames",
-        "-show_entries",
-        "stream=nb_read_frames",
+        *FFPROBE_COUNT_ARGS[strategy],
         "-of",
         "csv=p=0",
         str(video_path),
@@ -651,6 +666,9 @@ def run_ffprobe(video_path: Path, timeout: int = 30) -> int:
         if not output:
             raise VideoAnalysisError(f"ffprobe returned empty output for: {video_path}")
 
+        if output == "N/A":
+            raise VideoAnalysisError(f"ffprobe found no '{strategy}' frame count for: {video_path}")
+
         try:
             frame_count = int(output)
         except ValueError:
@@ -669,6 +687,9 @@ def run_ffprobe(video_path: Path, timeout: int = 30) -> int:
         stderr_msg = e.stderr.strip() if e.stderr else "No error message"
         raise VideoAnalysisError(f"ffprobe failed for {video_path}: {stderr_msg}")
 
+    except VideoAnalysisError:
+        raise
+
     except Exception as e:
         # Unexpected error
         raise VideoAnalysisError(f"Unexpected error running ffprobe: {e}")
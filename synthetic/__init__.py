@@ -5,6 +5,7 @@ Public API to generate minimal, valid synthetic inputs:
 - Session TOML (session_synth)
 - TTL pulse files (ttl_synth)
 - Video files (video_synth)
+- Neuropixels SpikeGLX binary streams (neuropixels_synth)
 - High-level `build_raw_folder` to assemble a complete raw session folder
 
 These utilities are intended for demos, tests, and quick E2E exercises.
@@ -18,6 +19,7 @@ from typing import Dict, List, Optional, Union
 
 from .bpod_synth import BpodSynthOptions, write_bpod_mat_files_for_session
 from .config_synth import SynthConfigOptions, build_config, write_config_toml
+from .neuropixels_synth import NeuropixelsSynthOptions, NeuropixelsSynthResult, write_spikeglx_stream
 from .session_synth import SessionSynthOptions, build_session, write_session_toml
 from .ttl_synth import TTLGenerationOptions, generate_and_write_ttls_for_session, generate_ttl_pulses, write_ttl_pulse_files
 from .video_synth import VideoGenerationOptions, generate_video_files_for_session
@@ -39,6 +41,10 @@ __all__ = [
     # Videos
     "VideoGenerationOptions",
     "generate_video_files_for_session",
+    # Neuropixels
+    "NeuropixelsSynthOptions",
+    "NeuropixelsSynthResult",
+    "write_spikeglx_stream",
     # Bpod
     "BpodSynthOptions",
     "write_bpod_mat_files_for_session",
@@ -0,0 +1,142 @@
+"""Synthetic Neuropixels (SpikeGLX) binary stream generator.
+
+Writes a small SpikeGLX-style ``.bin``/``.meta`` pair whose last channel
+carries a square-wave sync signal on a chosen bit, compatible with
+`w2t_bkin.sync.neuropixels`. Intended for offline tests of sync-edge
+extraction and the Neuropixels timebase provider.
+
+Features:
+- `NeuropixelsSynthOptions` Pydantic model grouping generation knobs.
+- Deterministic noise on data channels (seeded RNG).
+- Chunked writing, so long recordings never need to fit in memory.
+- Returns the exact rising-edge times for assertions.
+
+Binary Format:
+        Interleaved little-endian int16, ``n_channels`` values per sample. The
+        last channel is the sync word; the sync line is ``sync_bit`` of it.
+
+Example:
+        from synthetic.neuropixels_synth import NeuropixelsSynthOptions, write_spikeglx_stream
+        from w2t_bkin.sync import extract_sync_edges
+
+        opts = NeuropixelsSynthOptions(duration_s=10.0, sync_rate_hz=1.0)
+        result = write_spikeglx_stream('temp/run_g0_t0.imec0.ap.bin', options=opts)
+        edges = extract_sync_edges(result.bin_path)
+        print(len(edges), result.edge_times[:3])  # 10 [0.5 1.5 2.5]
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from synthetic.utils import ensure_parent_dir
+
+
+class NeuropixelsSynthOptions(BaseModel):
+    """Knobs controlling synthetic SpikeGLX stream generation.
+
+    The sync line is low for the first half of each period and high for the
+    second half, so the first rising edge is at ``0.5 / sync_rate_hz`` and
+    no edge is ambiguous at sample 0.
+    """
+
+    n_channels: int = Field(default=385, ge=1, description="Saved channels including the sync (SY) channel")
+    sample_rate_hz: float = Field(default=30000.0, gt=0, description="Sample rate (imSampRate)")
+    duration_s: float = Field(default=10.0, gt=0, description="Recording duration in seconds")
+    sync_rate_hz: float = Field(default=1.0, gt=0, description="Sync square-wave frequency")
+    sync_bit: int = Field(default=6, ge=0, le=14, description="Bit of the sync word carrying the sync line")
+    noise_amplitude: int = Field(default=50, ge=0, description="Peak amplitude of uniform noise on data channels")
+    chunk_samples: int = Field(default=1 << 16, ge=1, description="Samples generated per write")
+    seed: int = Field(default=12345, description="RNG seed for deterministic noise")
+
+
+@dataclass(frozen=True)
+class NeuropixelsSynthResult:
+    """Paths and ground truth for a generated stream.
+
+    Attributes
+    ----------
+    bin_path: Generated ``.bin`` file.
+    meta_path: Generated ``.meta`` file.
+    edge_times: Exact rising-edge times in seconds (sample index / rate).
+    n_samples: Number of samples written.
+    """
+
+    bin_path: Path
+    meta_path: Path
+    edge_times: np.ndarray
+    n_samples: int
+
+
+def _sync_high(sample_indices: np.ndarray, options: NeuropixelsSynthOptions) -> np.ndarray:
+    """Sync line state (bool) for the given sample indices."""
+    samples_per_period = options.sample_rate_hz / options.sync_rate_hz
+    phase = np.mod(sample_indices, samples_per_period) / samples_per_period
+    return phase >= 0.5
+
+
+def write_spikeglx_stream(
+    bin_path: Union[str, Path],
+    *,
+    options: Optional[NeuropixelsSynthOptions] = None,
+    **overrides,
+) -> NeuropixelsSynthResult:
+    """Write a synthetic SpikeGLX ``.bin`` and matching ``.meta`` file.
+
+    Preferred: pass `options=NeuropixelsSynthOptions(...)`.
+    Convenience: overrides accepted as kwargs (merged into options).
+    """
+    opts = options or NeuropixelsSynthOptions()
+    if overrides:
+        opts = opts.model_copy(update=overrides)
+
+    bin_path = ensure_parent_dir(bin_path)
+    meta_path = bin_path.with_suffix(".meta")
+    n_samples = int(round(opts.duration_s * opts.sample_rate_hz))
+    rng = np.random.default_rng(opts.seed)
+
+    edges = []
+    previous_high = None
+    with open(bin_path, "wb") as f:
+        for start in range(0, n_samples, opts.chunk_samples):
+            indices = np.arange(start, min(start + opts.chunk_samples, n_samples))
+            chunk = rng.integers(-opts.noise_amplitude, opts.noise_amplitude + 1, size=(indices.size, opts.n_channels), dtype=np.int16)
+
+            high = _sync_high(indices, opts)
+            chunk[:, -1] = high.astype(np.int16) << opts.sync_bit
+
+            if previous_high is None:
+                previous_high = high[0]
+            rising = high & ~np.concatenate([[previous_high], high[:-1]])
+            edges.append(indices[rising])
+            previous_high = high[-1]
+
+            f.write(chunk.astype("<i2").tobytes())
+
+    meta_lines = [
+        f"nSavedChans={opts.n_channels}",
+        f"imSampRate={opts.sample_rate_hz:g}",
+        f"fileSizeBytes={n_samples * opts.n_channels * 2}",
+        f"fileTimeSecs={n_samples / opts.sample_rate_hz:g}",
+        "typeThis=imec",
+        f"~snsChanMap=(synthetic,{opts.n_channels})",
+    ]
+    meta_path.write_text("\n".join(meta_lines) + "\n")
+
+    edge_samples = np.concatenate(edges) if edges else np.empty(0, dtype=np.int64)
+    return NeuropixelsSynthResult(
+        bin_path=bin_path.resolve(),
+        meta_path=meta_path.resolve(),
+        edge_times=edge_samples / opts.sample_rate_hz,
+        n_samples=n_samples,
+    )
+
+
+if __name__ == "__main__":
+    result = write_spikeglx_stream("temp/Session-SYNTH-NPX/run_g0_t0.imec0.ap.bin", options=NeuropixelsSynthOptions(duration_s=5.0))
+    print(f"Wrote {result.n_samples} samples to {result.bin_path} ({result.edge_times.size} sync edges)")
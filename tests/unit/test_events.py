@@ -23,6 +23,7 @@ from w2t_bkin.events import (
     BpodParseError,
     BpodValidationError,
     EventsError,
+    TrialIntervalIndex,
     create_event_summary,
     extract_behavioral_events,
     extract_trials,
@@ -34,7 +35,7 @@ from w2t_bkin.events import (
 )
 from w2t_bkin.events.bpod import discover_bpod_files_from_pattern, parse_bpod, parse_bpod_from_files
 from w2t_bkin.events.models import Trial, TrialEvent, TrialOutcome, TrialSummary
-from w2t_bkin.sync import SyncError, align_bpod_trials_to_ttl, get_ttl_pulses
+from w2t_bkin.sync import SyncError, align_bpod_trials_to_ttl, fit_bpod_clock_drift, get_ttl_pulses
 
 # =============================================================================
 # Local Fixtures (Test-Specific)
@@ -238,6 +239,44 @@ class TestTrialEventExtraction:
         assert trial_numbers == {1.0, 2.0, 3.0}
 
 
+class TestTrialIntervalIndex:
+    """Test trial lookup for absolute timestamps."""
+
+    def test_Should_MatchLinearScan_When_LookingUpManyTimestamps(self):
+        """Bulk lookup should agree with a per-timestamp scan over trials."""
+        rng = np.random.default_rng(0)
+        starts = np.cumsum(rng.uniform(2.0, 5.0, 200))
+        stops = starts + rng.uniform(0.5, 1.9, 200)
+        numbers = np.arange(200) + 1
+        order = rng.permutation(200)
+        index = TrialIntervalIndex(starts[order], stops[order], trial_numbers=numbers[order])
+        times = rng.uniform(0.0, stops[-1] + 1.0, 5000)
+
+        expected = [next((n for n, a, b in zip(numbers, starts, stops) if a <= t <= b), -1) for t in times]
+
+        np.testing.assert_array_equal(index.trial_numbers(times), expected)
+
+    def test_Should_SliceSamplesPerTrial_When_BoundariesShared(self):
+        """Per-trial slices should partition samples, giving shared boundaries to the later trial."""
+        trials = [
+            Trial(trial_number=1, trial_type=1, start_time=0.0, stop_time=1.0, outcome=TrialOutcome.HIT),
+            Trial(trial_number=2, trial_type=1, start_time=1.0, stop_time=2.0, outcome=TrialOutcome.MISS),
+        ]
+        index = TrialIntervalIndex.from_trials(trials)
+        samples = np.array([0.0, 0.5, 1.0, 1.5, 2.0, 2.5])
+
+        lo, hi = index.slice_bounds(samples)
+
+        assert samples[lo[0] : hi[0]].tolist() == [0.0, 0.5]
+        assert samples[lo[1] : hi[1]].tolist() == [1.0, 1.5, 2.0]
+        assert index.trial_numbers(samples).tolist() == [1, 1, 2, 2, 2, -1]
+
+    def test_Should_RaiseError_When_TrialsOverlap(self):
+        """Overlapping intervals make the lookup ambiguous."""
+        with pytest.raises(EventsError, match="overlap"):
+            TrialIntervalIndex([0.0, 1.0], [1.5, 2.0])
+
+
 class TestEventSummaryCreation:
     """Test event summary generation - FR-14, A4."""
 
@@ -587,6 +626,75 @@ class TestTTLAlignment:
         assert len(aligned_trials) == 1
         assert any("unused pulses" in w for w in warnings)
 
+    def test_Should_MapSkippedTrials_When_ClockModelFitted(self):
+        """Clock drift model should map every trial and event, including trials without sync."""
+        n_trials = 6
+        trial_starts = [10.0 * i for i in range(n_trials)]
+        trials = [{"States": {"W2L_Audio": [2.0, 3.0], "HIT": [4.0, 4.1]}, "Events": {"Port1In": [4.0]}} for _ in range(n_trials)]
+        trials[3] = {"States": {"ITI": [0.0, 5.0], "Miss": [7.0, 7.1]}, "Events": {"Port1In": [4.0]}}  # No sync signal
+        bpod_data = {
+            "SessionData": {
+                "nTrials": n_trials,
+                "TrialStartTimestamp": trial_starts,
+                "TrialEndTimestamp": [start + 8.0 for start in trial_starts],
+                "TrialTypes": [1] * n_trials,
+                "RawEvents": {"Trial": trials},
+                "Info": {"SessionDate": "13-Nov-2025", "SessionStartTime_UTC": "10:00:00"},
+            }
+        }
+
+        def bpod_to_ttl(t):
+            return 4.0 + 1.0001 * t
+
+        ttl_pulses = {"ttl_cue": [bpod_to_ttl(start + 2.0) for i, start in enumerate(trial_starts) if i != 3]}
+        trial_type_configs = [BpodTrialType(trial_type=1, sync_signal="W2L_Audio", sync_ttl="ttl_cue", description="W2L")]
+
+        clock_model, warnings = fit_bpod_clock_drift(trial_type_configs, bpod_data, ttl_pulses)
+        aligned_trials = extract_trials(bpod_data, clock_model=clock_model)
+        events = extract_behavioral_events(bpod_data, clock_model=clock_model)
+
+        assert clock_model.n_points == 5
+        assert clock_model.drift_ppm == pytest.approx(100.0)
+        assert any("Trial 4" in w for w in warnings)
+        assert aligned_trials[3].start_time == pytest.approx(bpod_to_ttl(30.0))
+        assert aligned_trials[3].stop_time == pytest.approx(bpod_to_ttl(38.0))
+        assert [e.timestamp for e in events] == pytest.approx([bpod_to_ttl(start + 4.0) for start in trial_starts])
+
+    def test_Should_SkipOnlyAffectedTrial_When_PulseDroppedInPatternMode(self):
+        """Pattern mode should keep later trials aligned after a dropped pulse."""
+        n_trials = 8
+        trial_starts = [0.0, 7.0, 15.0, 21.0, 30.0, 36.0, 45.0, 52.0]
+        bpod_data = {
+            "SessionData": {
+                "nTrials": n_trials,
+                "TrialStartTimestamp": trial_starts,
+                "TrialEndTimestamp": [start + 5.0 for start in trial_starts],
+                "TrialTypes": [1] * n_trials,
+                "RawEvents": {"Trial": [{"States": {"W2L_Audio": [2.0, 3.0]}, "Events": {}}] * n_trials},
+                "Info": {"SessionDate": "13-Nov-2025", "SessionStartTime_UTC": "10:00:00"},
+            }
+        }
+        # Pulse of trial 3 dropped, spurious pulse before trial 6
+        ttl_times = [100.0 + start + 2.0 for start in trial_starts]
+        ttl_pulses = {"ttl_cue": sorted(ttl_times[:2] + ttl_times[3:] + [135.5])}
+        trial_type_configs = [BpodTrialType(trial_type=1, sync_signal="W2L_Audio", sync_ttl="ttl_cue", description="W2L")]
+
+        trial_offsets, warnings = align_bpod_trials_to_ttl(trial_type_configs, bpod_data, ttl_pulses, mode="pattern")
+        sequential_offsets, _ = align_bpod_trials_to_ttl(trial_type_configs, bpod_data, ttl_pulses)
+
+        assert sorted(trial_offsets) == [1, 2, 4, 5, 6, 7, 8]
+        assert all(offset == pytest.approx(100.0) for offset in trial_offsets.values())
+        assert sequential_offsets[4] != pytest.approx(100.0)
+        assert any("Trial 3" in w and "dropped pulse" in w for w in warnings)
+        assert any("extra pulse indices: 4" in w for w in warnings)
+
+    def test_Should_RaiseError_When_AlignmentModeUnknown(self, bpod_data_with_sync):
+        """Unknown alignment modes should be rejected."""
+        trial_type_configs = [BpodTrialType(trial_type=1, sync_signal="W2L_Audio", sync_ttl="ttl_cue", description="W2L")]
+
+        with pytest.raises(SyncError, match="Unknown alignment mode"):
+            align_bpod_trials_to_ttl(trial_type_configs, bpod_data_with_sync, {}, mode="greedy")
+
     def test_Should_RaiseError_When_NoTrialTypeConfig(self, bpod_data_with_sync, tmp_path):
         """Should raise error when session has no trial_type configuration."""
         session = Session(
@@ -681,6 +789,38 @@ class TestTTLAlignment:
         # Trial 2: start + sync_rel = 105.0 + 5.0 = 110.0 ✓
         # Trial 3: start + sync_rel = 203.5 + 6.5 = 210.0 ✓
 
+    def test_Should_ReportWarningsInTrialOrder_When_FailuresMixed(self):
+        """Columnar alignment should keep per-trial pulse order and warning order."""
+        trial_type_configs = [
+            BpodTrialType(trial_type=1, sync_signal="W2L_Audio", sync_ttl="ttl_cue", description="W2L"),
+            BpodTrialType(trial_type=2, sync_signal="A2L_Audio", sync_ttl="ttl_other", description="A2L"),
+            BpodTrialType(trial_type=3, sync_signal="W2L_Audio", sync_ttl="ttl_missing", description="Missing channel"),
+        ]
+        w2l = {"States": {"W2L_Audio": [1.0, 2.0]}, "Events": {}}
+        a2l = {"States": {"A2L_Audio": [0.5, 1.0]}, "Events": {}}
+        not_visited = {"States": {"W2L_Audio": [float("nan"), float("nan")]}, "Events": {}}
+        bpod_data = {
+            "SessionData": {
+                "nTrials": 7,
+                "TrialStartTimestamp": np.array([0.0, 10.0, 20.0, 30.0, 40.0, 50.0, 60.0]),
+                "TrialEndTimestamp": np.array([5.0, 15.0, 25.0, 35.0, 45.0, 55.0, 65.0]),
+                "TrialTypes": np.array([1, 2, 1, 9, 3, 1, 1]),
+                "RawEvents": {"Trial": [w2l, a2l, not_visited, w2l, w2l, w2l, w2l]},
+            }
+        }
+        ttl_pulses = {"ttl_cue": [2.0, 52.0], "ttl_other": [11.0, 99.0]}
+
+        trial_offsets, warnings = align_bpod_trials_to_ttl(trial_type_configs, bpod_data, ttl_pulses)
+
+        assert trial_offsets == {1: pytest.approx(1.0), 2: pytest.approx(0.5), 6: pytest.approx(1.0)}
+        assert warnings == [
+            "Trial 3: sync_signal 'W2L_Audio' not found or not visited, skipping",
+            "Trial 4: trial_type 9 not in session config, skipping",
+            "Trial 5: TTL channel 'ttl_missing' not found in ttl_pulses, skipping",
+            "Trial 7: No more TTL pulses available for 'ttl_cue', skipping",
+            "TTL channel 'ttl_other' has 1 unused pulses",
+        ]
+
 
 class TestExtractTrialsWithAlignment:
     """Test extract_trials integration with TTL alignment."""
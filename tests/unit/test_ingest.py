@@ -8,8 +8,10 @@ All tests should fail initially with ImportError or AttributeError.
 """
 
 from datetime import datetime
+import os
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 
@@ -497,3 +499,347 @@ class TestEdgeCases:
         assert result.camera_results[0].camera_id == "cam0", "First result should be cam0"
         assert result.camera_results[1].camera_id == "cam1", "Second result should be cam1"
         assert all(r.mismatch == 0 for r in result.camera_results), "All mismatches should be 0"
+
+
+class TestParallelFrameCounting:
+    """Test concurrent frame counting across camera segments."""
+
+    def _manifest(self):
+        from w2t_bkin.domain import Manifest, ManifestCamera
+
+        return Manifest(
+            session_id="test",
+            cameras=[ManifestCamera(camera_id=f"cam{c}", ttl_id="ttl_camera", video_files=[f"cam{c}_seg{s}.avi" for s in range(5)]) for c in range(3)],
+        )
+
+    def test_Should_MatchSequentialTotals_When_CountingWithWorkers(self, monkeypatch):
+        """Per-camera totals should not depend on the worker count."""
+        from w2t_bkin import ingest
+
+        monkeypatch.setattr(ingest, "probe_video_frames", lambda path, **kwargs: ingest.FrameCount(100 * int(path.stem[3]) + int(path.stem[-1]), "decode"))
+
+        sequential = ingest.populate_manifest_counts(self._manifest())
+        parallel = ingest.populate_manifest_counts(self._manifest(), max_workers=4)
+
+        assert [c.frame_count for c in parallel.cameras] == [c.frame_count for c in sequential.cameras] == [10, 510, 1010]
+
+    def test_Should_ReportAllFailures_When_SeveralSegmentsFail(self, monkeypatch):
+        """Every failing segment should be reported in one error after all were attempted."""
+        from w2t_bkin import ingest
+
+        attempted = []
+
+        def count(path, **kwargs):
+            attempted.append(path.name)
+            if path.stem.endswith(("seg1", "seg3")):
+                raise ingest.IngestError(f"corrupt {path.name}")
+            return ingest.FrameCount(10, "decode")
+
+        monkeypatch.setattr(ingest, "probe_video_frames", count)
+
+        with pytest.raises(ingest.IngestError, match="6 of 15") as exc_info:
+            ingest.populate_manifest_counts(self._manifest(), max_workers=4)
+
+        assert len(attempted) == 15
+        assert "cam0_seg1.avi" in str(exc_info.value) and "cam2_seg3.avi" in str(exc_info.value)
+
+
+class TestFrameCountCache:
+    """Test persistent frame counts keyed by file identity."""
+
+    def test_Should_SkipFFprobe_When_VideoUnchanged(self, tmp_path, monkeypatch):
+        """A second count of an unchanged video should come from the cache file."""
+        from w2t_bkin import ingest
+
+        video = tmp_path / "cam0.avi"
+        video.write_bytes(b"\x00" * 1024)
+        calls = []
+
+        def probe(path, strategy="decode"):
+            calls.append(path)
+            return 42
+
+        monkeypatch.setattr(ingest, "run_ffprobe", probe)
+        cache_path = tmp_path / "interim" / ingest.FRAME_COUNT_CACHE_FILENAME
+
+        assert ingest.count_video_frames(video, cache=ingest.FrameCountCache(cache_path)) == 42
+        assert ingest.count_video_frames(video, cache=ingest.FrameCountCache(cache_path)) == 42
+        assert len(calls) == 1
+
+    def test_Should_ReprobeVideo_When_SizeOrContentChanges(self, tmp_path, monkeypatch):
+        """Changed files should miss, including same-size edits with the content check."""
+        from w2t_bkin import ingest
+
+        video = tmp_path / "cam0.avi"
+        video.write_bytes(b"\x00" * 1024)
+        monkeypatch.setattr(ingest, "run_ffprobe", lambda path, strategy="decode": video.stat().st_size)
+        cache = ingest.FrameCountCache(tmp_path / ingest.FRAME_COUNT_CACHE_FILENAME, verify_content=True)
+        ingest.count_video_frames(video, cache=cache)
+
+        video.write_bytes(b"\x00" * 2048)
+        assert cache.get(video) is None
+
+        ingest.count_video_frames(video, cache=cache)
+        stat = video.stat()
+        video.write_bytes(b"\x01" * 2048)
+        os.utime(video, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert cache.get(video) is None
+
+    def test_Should_IgnoreTornLine_When_LoadingCache(self, tmp_path):
+        """An interrupted append should not invalidate earlier entries."""
+        from w2t_bkin import ingest
+
+        video = tmp_path / "cam0.avi"
+        video.write_bytes(b"\x00" * 16)
+        cache_path = tmp_path / ingest.FRAME_COUNT_CACHE_FILENAME
+        ingest.FrameCountCache(cache_path).put(video, 7)
+        with open(cache_path, "a") as f:
+            f.write('{"path": "truncated')
+
+        assert ingest.FrameCountCache(cache_path).get(video) == 7
+
+    def test_Should_FsyncOnce_When_PopulatingManySegments(self, tmp_path, monkeypatch):
+        """A populate call should append all new counts with a single fsync."""
+        from w2t_bkin import ingest
+        from w2t_bkin.domain import Manifest, ManifestCamera
+
+        videos = []
+        for i in range(4):
+            videos.append(tmp_path / f"cam0_{i}.avi")
+            videos[-1].write_bytes(b"\x00" * (16 + i))
+        monkeypatch.setattr(ingest, "run_ffprobe", lambda path, strategy="decode": 10)
+        fsyncs = []
+        real_fsync = os.fsync
+        monkeypatch.setattr(ingest.os, "fsync", lambda fd: (fsyncs.append(fd), real_fsync(fd)))
+        cache_path = tmp_path / ingest.FRAME_COUNT_CACHE_FILENAME
+        manifest = Manifest(session_id="test", cameras=[ManifestCamera(camera_id="cam0", ttl_id="ttl_camera", video_files=[str(v) for v in videos])], ttls=[])
+
+        counted = ingest.populate_manifest_counts(manifest, max_workers=2, frame_count_cache=ingest.FrameCountCache(cache_path))
+
+        assert counted.cameras[0].frame_count == 40
+        assert len(fsyncs) == 1
+        assert len(cache_path.read_text().splitlines()) == 4
+
+    def test_Should_KeepNewEntry_When_AppendingAfterTornLine(self, tmp_path):
+        """An append after an unterminated line should start on its own line."""
+        from w2t_bkin import ingest
+
+        video = tmp_path / "cam0.avi"
+        video.write_bytes(b"\x00" * 16)
+        cache_path = tmp_path / ingest.FRAME_COUNT_CACHE_FILENAME
+        cache = ingest.FrameCountCache(cache_path)
+        with open(cache_path, "a") as f:
+            f.write('{"path": "truncated')
+        cache.put(video, 7)
+
+        assert ingest.FrameCountCache(cache_path).get(video) == 7
+
+    def test_Should_CompactFile_When_LoadingSupersededLines(self, tmp_path):
+        """Re-counted paths should leave one line each after the next load."""
+        from w2t_bkin import ingest
+
+        video = tmp_path / "cam0.avi"
+        video.write_bytes(b"\x00" * 16)
+        cache_path = tmp_path / ingest.FRAME_COUNT_CACHE_FILENAME
+        cache = ingest.FrameCountCache(cache_path)
+        for count in (5, 6, 7):
+            cache.put(video, count)
+        assert len(cache_path.read_text().splitlines()) == 3
+
+        assert ingest.FrameCountCache(cache_path).get(video) == 7
+        assert len(cache_path.read_text().splitlines()) == 1
+
+
+class TestFrameCountStrategies:
+    """Test tiered frame counting and its provenance."""
+
+    @staticmethod
+    def _fake_ffprobe(counts, calls):
+        """ffprobe stand-in returning counts[(file name, strategy)]; None means no header count."""
+        from w2t_bkin.utils import VideoAnalysisError
+
+        def probe(path, strategy="decode"):
+            calls.append((path.name, strategy))
+            count = counts[(path.name, strategy)]
+            if count is None:
+                raise VideoAnalysisError("no header count")
+            return count
+
+        return probe
+
+    def test_Should_DecodeOnlyWhenHeaderDisagrees_When_UsingAutoMode(self, tmp_path, monkeypatch):
+        """Auto mode should trust packet counts unless the container header disagrees."""
+        from w2t_bkin import ingest
+
+        for name in ("agree.avi", "disagree.avi", "noheader.avi"):
+            (tmp_path / name).write_bytes(b"\x00" * 64)
+        counts = {
+            ("agree.avi", "packets"): 100,
+            ("agree.avi", "header"): 100,
+            ("disagree.avi", "packets"): 100,
+            ("disagree.avi", "header"): 102,
+            ("disagree.avi", "decode"): 101,
+            ("noheader.avi", "packets"): 90,
+            ("noheader.avi", "header"): None,
+        }
+        calls = []
+        monkeypatch.setattr(ingest, "run_ffprobe", self._fake_ffprobe(counts, calls))
+
+        assert ingest.probe_video_frames(tmp_path / "agree.avi", strategy="auto") == ingest.FrameCount(100, "packets")
+        assert ingest.probe_video_frames(tmp_path / "disagree.avi", strategy="auto") == ingest.FrameCount(101, "decode")
+        assert ingest.probe_video_frames(tmp_path / "noheader.avi", strategy="auto") == ingest.FrameCount(90, "packets")
+        assert ("agree.avi", "decode") not in calls
+
+    def test_Should_DecodeBorderlineCamera_When_PopulatingInAutoMode(self, tmp_path, monkeypatch):
+        """Only cameras near the tolerance should be decoded, and the manifest should record how."""
+        from w2t_bkin import ingest
+        from w2t_bkin.domain import Manifest, ManifestCamera, ManifestTTL
+
+        ttl = tmp_path / "ttl.txt"
+        ttl.write_text("".join(f"{i / 30:.6f}\n" for i in range(200)))
+        for name in ("ok.avi", "near.avi"):
+            (tmp_path / name).write_bytes(b"\x00" * 64)
+        counts = {("ok.avi", "packets"): 200, ("ok.avi", "header"): 200, ("near.avi", "packets"): 195, ("near.avi", "header"): 195, ("near.avi", "decode"): 197}
+        calls = []
+        monkeypatch.setattr(ingest, "run_ffprobe", self._fake_ffprobe(counts, calls))
+        manifest = Manifest(
+            session_id="test",
+            cameras=[
+                ManifestCamera(camera_id="cam0", ttl_id="ttl_camera", video_files=[str(tmp_path / "ok.avi")]),
+                ManifestCamera(camera_id="cam1", ttl_id="ttl_camera", video_files=[str(tmp_path / "near.avi")]),
+            ],
+            ttls=[ManifestTTL(ttl_id="ttl_camera", files=[str(ttl)])],
+        )
+
+        counted = ingest.populate_manifest_counts(manifest, frame_count_strategy="auto", tolerance=5)
+
+        assert [c.frame_count for c in counted.cameras] == [200, 197]
+        assert [c.frame_count_strategies for c in counted.cameras] == [["packets"], ["decode"]]
+        assert ("ok.avi", "decode") not in calls
+
+
+class TestStreamingTTLCount:
+    """Test block-streamed and sidecar-backed TTL pulse counting."""
+
+    def test_Should_MatchLineCount_When_BlocksSplitLines(self, tmp_path):
+        """Blank lines, CRLF endings and lines split across blocks should count like readlines()."""
+        from w2t_bkin.sync.ttl import _count_nonblank_lines
+
+        ttl = tmp_path / "ttl.txt"
+        ttl.write_bytes(b"0.1\r\n\r\n  \t\n0.2\n bad \n\n0.3")
+
+        assert [_count_nonblank_lines(ttl, block_size=size) for size in (1, 2, 3, 5, 1 << 20)] == [4] * 5
+
+    def test_Should_CountSameWithOrWithoutSidecar_When_LinesMalformed(self, tmp_path):
+        """Streaming and sidecar counts should agree on multi-token, blank and CRLF lines."""
+        from w2t_bkin.ingest import count_ttl_pulses
+
+        contents = [b"1.0 2.0\n", b"0.1\r\n\r\n0.2 0.3\r\n  \n# note\n0.4", b"\n \t\r\n"]
+        for i, content in enumerate(contents):
+            ttl = tmp_path / f"ttl_{i}.txt"
+            ttl.write_bytes(content)
+
+            streamed = count_ttl_pulses(ttl)
+            assert count_ttl_pulses(ttl, cache_dir=tmp_path / "ttl_cache") == streamed
+            assert count_ttl_pulses(ttl, cache_dir=tmp_path / "ttl_cache") == streamed
+
+    def test_Should_ReuseSidecar_When_CountingWithCacheDir(self, tmp_path):
+        """Counting with a cache directory should write the sidecar the loader then hits."""
+        from w2t_bkin.ingest import count_ttl_pulses
+        from w2t_bkin.sync import load_ttl_array
+
+        ttl = tmp_path / "ttl.txt"
+        ttl.write_text("".join(f"{i / 30:.6f}\n" for i in range(100)) + "garbage\n")
+        cache_dir = tmp_path / "ttl_cache"
+
+        assert count_ttl_pulses(ttl) == 101
+        assert count_ttl_pulses(ttl, cache_dir=cache_dir) == 101
+        assert len(list(cache_dir.glob("*.npy"))) == 1
+
+        assert isinstance(load_ttl_array(ttl, cache_dir=cache_dir), np.memmap)
+
+
+class TestSessionIndex:
+    """Test the persistent SQLite index of session files."""
+
+    @staticmethod
+    def _make_raw_root(tmp_path):
+        raw_root = tmp_path / "raw"
+        for session_id in ("Session-000001", "Session-000002"):
+            (raw_root / session_id / "Video" / "top").mkdir(parents=True)
+            (raw_root / session_id / "TTLs").mkdir()
+            (raw_root / session_id / "Video" / "top" / "cam0_001.avi").write_bytes(b"\x00" * 8)
+            (raw_root / session_id / "Video" / "top" / "cam0_000.avi").write_bytes(b"\x00" * 4)
+            (raw_root / session_id / "TTLs" / "cam0.txt").write_text("0.0\n")
+        (raw_root / "notes").mkdir()
+        return raw_root
+
+    def test_Should_MatchGlobDiscovery_When_QueryingIndex(self, tmp_path):
+        """Index queries should return what globbing the session directory returns."""
+        from w2t_bkin.ingest import SessionIndex, discover_sessions
+        from w2t_bkin.utils import discover_files
+
+        raw_root = self._make_raw_root(tmp_path)
+        index = SessionIndex(tmp_path / "index.sqlite", raw_root)
+        index.refresh()
+
+        assert discover_sessions(raw_root, session_index=index) == discover_sessions(raw_root)
+        for pattern in ("Video/top/*.avi", "Video/*/cam0_00?.avi", "TTLs/*.txt", "Bpod/*.mat"):
+            assert index.glob("Session-000001", pattern) == discover_files(raw_root / "Session-000001", pattern)
+
+    def test_Should_FollowSymlinkedDirectory_When_QueryingIndex(self, tmp_path):
+        """Symlinked session subdirectories should be indexed like glob follows them, without looping."""
+        from w2t_bkin.ingest import SessionIndex
+        from w2t_bkin.utils import discover_files
+
+        raw_root = self._make_raw_root(tmp_path)
+        storage = tmp_path / "storage" / "Video"
+        storage.mkdir(parents=True)
+        (storage / "cam1_000.avi").write_bytes(b"\x00" * 4)
+        (storage / "back").symlink_to(raw_root / "Session-000001", target_is_directory=True)
+        (raw_root / "Session-000001" / "Linked").symlink_to(storage, target_is_directory=True)
+        index = SessionIndex(tmp_path / "index.sqlite", raw_root)
+        index.refresh()
+
+        expected = discover_files(raw_root / "Session-000001", "Linked/*.avi")
+        assert expected == [storage.resolve() / "cam1_000.avi"]
+        assert index.glob("Session-000001", "Linked/*.avi") == expected
+        assert index.glob("Session-000001", "Linked/back/Linked/*.avi") == []
+
+    def test_Should_RelistOnlyChangedDirectories_When_Refreshing(self, tmp_path):
+        """Unchanged directories should be skipped; added and removed files and sessions should be picked up."""
+        import shutil
+
+        from w2t_bkin.ingest import SessionIndex
+
+        raw_root = self._make_raw_root(tmp_path)
+        index = SessionIndex(tmp_path / "index.sqlite", raw_root)
+        assert index.refresh() == 10
+        assert index.refresh() == 0
+
+        (raw_root / "Session-000001" / "TTLs" / "cam1.txt").write_text("0.0\n")
+        shutil.rmtree(raw_root / "Session-000002")
+
+        assert SessionIndex(tmp_path / "index.sqlite", raw_root).refresh() == 2
+        assert index.sessions() == ["Session-000001"]
+        assert [path.name for path in index.glob("Session-000001", "TTLs/*.txt")] == ["cam0.txt", "cam1.txt"]
+        assert index.glob("Session-000002", "TTLs/*.txt") == []
+
+    def test_Should_DiscoverManifest_When_UsingIndex(self, tmp_path):
+        """discover_files should build the same manifest from the index."""
+        from unittest.mock import Mock
+
+        from w2t_bkin.ingest import SessionIndex, discover_files
+
+        raw_root = self._make_raw_root(tmp_path)
+        config = Mock()
+        config.paths.raw_root = str(raw_root)
+        session = Mock()
+        session.session.id = "Session-000001"
+        session.cameras = [Mock(id="cam0", ttl_id="ttl_cam0", paths="Video/top/*.avi")]
+        session.TTLs = [Mock(id="ttl_cam0", paths="TTLs/*.txt")]
+        session.bpod.path = "Bpod/*.mat"
+        index = SessionIndex(tmp_path / "index.sqlite", raw_root)
+        index.refresh(session_id="Session-000001")
+
+        assert discover_files(config, session, session_index=index) == discover_files(config, session)
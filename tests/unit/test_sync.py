@@ -9,26 +9,53 @@ Acceptance: A8, A9, A10, A11, A12, A17, A19, A20
 
 from datetime import datetime
 import json
+import os
 from pathlib import Path
 
+import numpy as np
 import pytest
 
-from w2t_bkin.domain import AlignmentStats, Config, TimebaseConfig
+from w2t_bkin.domain import AlignmentStats, Config, Manifest, ManifestCamera, ManifestTTL, TimebaseConfig
 from w2t_bkin.sync import (
+    AlignmentCache,
+    ClockDriftModel,
     JitterBudgetExceeded,
     NeuropixelsProvider,
     NominalRateProvider,
+    ReferenceTimebase,
+    StreamingJitterStats,
     SyncError,
     TimebaseProvider,
     TTLProvider,
+    UniformTimebase,
+    align_modalities,
     align_samples,
+    align_samples_chunked,
+    compute_alignment,
     compute_jitter_stats,
     create_alignment_stats,
     create_timebase_provider,
     create_timebase_provider_from_config,
+    detect_frame_drops,
+    detect_rising_edges,
     enforce_jitter_budget,
+    extract_sync_edges,
+    fingerprint_inputs,
+    fit_clock_drift,
+    get_ttl_pulses,
+    interpolate_linear,
+    iter_chunks,
+    load_alignment_manifest,
+    load_ttl_array,
+    load_ttl_file,
     map_linear,
+    map_linear_array,
     map_nearest,
+    map_nearest_array,
+    match_pulse_train,
+    merge_ttl_arrays,
+    summarize_alignment,
+    sync_video_frames_to_timebase,
     write_alignment_stats,
 )
 
@@ -114,6 +141,22 @@ class TestTimebaseProviderCreation:
         assert provider.source == "neuropixels"
         assert provider.stream == neuropixels_config.timebase.neuropixels_stream
 
+    def test_Should_RaiseError_When_ManifestHasNoNeuropixelsStream(self, tmp_path, caplog):
+        """A missing stream file should fail instead of aligning to stub timestamps; only no-manifest uses the stub."""
+        from types import SimpleNamespace
+
+        (tmp_path / "raw" / "test-session").mkdir(parents=True)
+        timebase = SimpleNamespace(source="neuropixels", neuropixels_stream="imec0.ap", offset_s=0.0)
+        config = SimpleNamespace(timebase=timebase, paths=SimpleNamespace(raw_root=str(tmp_path / "raw")))
+
+        with pytest.raises(SyncError, match="No Neuropixels file matches stream 'imec0.ap'"):
+            create_timebase_provider_from_config(config, manifest=Manifest(session_id="test-session", cameras=[]))
+
+        with caplog.at_level("WARNING", logger="w2t_bkin.sync.timebase"):
+            provider = create_timebase_provider_from_config(config, manifest=None)
+        assert provider.bin_path is None
+        assert "synthetic 30 kHz" in caplog.text
+
     def test_Should_ApplyOffset_When_OffsetConfigured(self, valid_config: Config):
         """FR-TB-5: Provider should respect configured offset_s."""
         offset = valid_config.timebase.offset_s
@@ -151,6 +194,25 @@ class TestNominalRateProvider:
         expected_mid = offset_s + 5 / STANDARD_FRAMERATE
         assert timestamps[5] == pytest.approx(expected_mid, rel=1e-6)
 
+    def test_Should_ReturnReadOnlyArray_When_GeneratingTimestamps(self):
+        """Providers should return read-only float64 arrays."""
+        provider = NominalRateProvider(rate=STANDARD_FRAMERATE)
+        timestamps = provider.get_timestamps(STANDARD_SAMPLE_COUNT)
+
+        assert isinstance(timestamps, np.ndarray)
+        assert timestamps.dtype == np.float64
+        assert not timestamps.flags.writeable
+
+    def test_Should_ReturnUniformTimebase_When_RequestingTimebase(self):
+        """Nominal rate timebase should be virtual and match the materialized array."""
+        provider = NominalRateProvider(rate=STANDARD_FRAMERATE, offset_s=2.0)
+        timebase = provider.get_timebase(STANDARD_SAMPLE_COUNT)
+
+        assert isinstance(timebase, UniformTimebase)
+        assert timebase.verified
+        assert len(timebase) == STANDARD_SAMPLE_COUNT
+        np.testing.assert_allclose(timebase.times, provider.get_timestamps(STANDARD_SAMPLE_COUNT))
+
 
 class TestTTLProvider:
     """Test TTL-based timebase provider."""
@@ -165,7 +227,8 @@ class TestTTLProvider:
 
         assert len(timestamps) > 0
         assert all(isinstance(t, float) for t in timestamps)
-        assert timestamps == sorted(timestamps)
+        assert np.all(np.diff(timestamps) >= 0)
+        assert not timestamps.flags.writeable
 
     def test_Should_RaiseError_When_TTLFilesMissing(self):
         """Missing TTL files should raise error."""
@@ -189,6 +252,192 @@ class TestTTLProvider:
         assert timestamps_with_offset[0] == pytest.approx(timestamps_no_offset[0] + offset_s)
 
 
+class TestTTLParsing:
+    """Test bulk TTL parsing and its per-line fallback."""
+
+    def test_Should_ParseInBulk_When_FileWellFormed(self, tmp_path):
+        """Blank lines and surrounding whitespace should be ignored."""
+        ttl_file = tmp_path / "ttl.txt"
+        ttl_file.write_text("0.5\n\n  1.5 \r\n2.5\n")
+
+        timestamps = load_ttl_array(ttl_file)
+
+        assert timestamps.dtype == np.float64
+        assert timestamps.tolist() == [0.5, 1.5, 2.5]
+
+    def test_Should_FallBackPerLine_When_LinesMalformed(self, tmp_path, caplog):
+        """Malformed lines should be skipped with a warning, as before."""
+        ttl_file = tmp_path / "ttl.txt"
+        ttl_file.write_text("0.5\n# header\n1.5 2.5\nbad\n3.5\n")
+
+        with caplog.at_level("WARNING"):
+            timestamps = load_ttl_file(ttl_file)
+
+        assert timestamps == [0.5, 3.5]
+        assert sum("Skipping invalid TTL timestamp" in r.message for r in caplog.records) == 3
+
+    def test_Should_RejectLine_When_SingleLineHasTwoColumns(self, tmp_path):
+        """A one-line, two-token file should be one invalid line, not two pulses."""
+        ttl_file = tmp_path / "ttl.txt"
+        ttl_file.write_text("1.0 2.0\n")
+
+        assert load_ttl_array(ttl_file).size == 0
+        with pytest.raises(SyncError, match="1 invalid line"):
+            load_ttl_array(ttl_file, strict=True)
+
+    def test_Should_ReturnEmptyArray_When_FileEmpty(self, tmp_path):
+        """An empty TTL file has no pulses."""
+        ttl_file = tmp_path / "ttl.txt"
+        ttl_file.write_text("")
+
+        assert load_ttl_array(ttl_file).size == 0
+
+
+class TestTTLMerge:
+    """Test merging of multi-file TTL channels."""
+
+    def test_Should_Concatenate_When_FilesDoNotOverlap(self):
+        """Rolling files given out of order should line up end to end."""
+        runs = [np.array([2.0, 3.0]), np.array([0.0, 1.0]), np.array([]), np.array([4.0])]
+
+        assert merge_ttl_arrays(runs).tolist() == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+    def test_Should_MergeSorted_When_FilesOverlap(self):
+        """Overlapping runs should merge to the same result as a full sort."""
+        rng = np.random.default_rng(2)
+        runs = [np.sort(rng.uniform(0, 100, size)) for size in (50, 10, 200, 1)]
+
+        np.testing.assert_array_equal(merge_ttl_arrays(runs), np.sort(np.concatenate(runs)))
+
+    def test_Should_SortRun_When_FileNotTimeOrdered(self, caplog):
+        """A non-monotonic file is sorted with a warning."""
+        with caplog.at_level("WARNING"):
+            merged = merge_ttl_arrays([np.array([1.0, 0.5]), np.array([2.0])])
+
+        assert merged.tolist() == [0.5, 1.0, 2.0]
+        assert "not time-ordered" in caplog.text
+
+    def test_Should_MergeAllFiles_When_PatternMatchesSeveralFiles(self, tmp_path):
+        """get_ttl_pulses should merge files matched by one pattern."""
+        ttl_dir = tmp_path / "TTLs"
+        ttl_dir.mkdir()
+        (ttl_dir / "cam_000.txt").write_text("0.0\n1.0\n")
+        (ttl_dir / "cam_001.txt").write_text("0.5\n2.0\n")
+
+        ttl_pulses = get_ttl_pulses({"ttl_camera": "TTLs/cam_*.txt"}, tmp_path)
+
+        assert ttl_pulses["ttl_camera"] == [0.0, 0.5, 1.0, 2.0]
+
+
+class TestParallelTTLLoading:
+    """Test thread-pool TTL loading."""
+
+    def test_Should_MatchSequentialOutput_When_LoadingConcurrently(self, tmp_path):
+        """Concurrent loading should be deterministic and match sequential loading."""
+        ttl_dir = tmp_path / "TTLs"
+        ttl_dir.mkdir()
+        for channel in ("cam", "bpod"):
+            for part in range(4):
+                values = np.arange(part * 10, part * 10 + 10) * 0.1
+                (ttl_dir / f"{channel}_{part:03d}.txt").write_text("".join(f"{v:.6f}\n" for v in values))
+        ttl_patterns = {"ttl_camera": "TTLs/cam_*.txt", "ttl_bpod": "TTLs/bpod_*.txt", "ttl_missing": "TTLs/none_*.txt"}
+
+        sequential = get_ttl_pulses(ttl_patterns, tmp_path)
+        concurrent = get_ttl_pulses(ttl_patterns, tmp_path, max_workers=4)
+
+        assert list(concurrent) == list(ttl_patterns)
+        assert concurrent == sequential
+        assert len(concurrent["ttl_camera"]) == 40
+        assert concurrent["ttl_missing"] == []
+
+    def test_Should_RaiseError_When_ConcurrentFileMissing(self, ttl_files):
+        """Errors from worker threads should propagate."""
+        with pytest.raises(SyncError, match="TTL file not found"):
+            TTLProvider(ttl_id="ttl_camera", ttl_files=ttl_files + ["/nonexistent/ttl.txt"], max_workers=2)
+
+
+class TestTTLCache:
+    """Test TTL sidecar cache."""
+
+    def test_Should_MemoryMapSidecar_When_LoadedTwice(self, ttl_files, tmp_path):
+        """Second load should come from the .npy sidecar (memory-mapped)."""
+        cache_dir = tmp_path / "ttl_cache"
+
+        first = load_ttl_array(Path(ttl_files[0]), cache_dir=cache_dir)
+        second = load_ttl_array(Path(ttl_files[0]), cache_dir=cache_dir)
+
+        assert len(list(cache_dir.glob("*.npy"))) == 1
+        assert isinstance(second, np.memmap)
+        np.testing.assert_array_equal(first, second)
+        assert load_ttl_file(Path(ttl_files[0]), cache_dir=cache_dir) == first.tolist()
+
+    def test_Should_InvalidateSidecar_When_SourceChanges(self, tmp_path):
+        """Changing the TTL file should trigger a re-parse."""
+        cache_dir = tmp_path / "ttl_cache"
+        ttl_file = tmp_path / "ttl.txt"
+        ttl_file.write_text("0.0\n1.0\n")
+        load_ttl_array(ttl_file, cache_dir=cache_dir)
+
+        ttl_file.write_text("0.0\n1.0\n2.0\n")
+
+        assert load_ttl_array(ttl_file, cache_dir=cache_dir).tolist() == [0.0, 1.0, 2.0]
+
+    def test_Should_RaiseError_When_ProviderReadsInvalidLines(self, tmp_path):
+        """TTL provider should stay strict about malformed lines, cached or not."""
+        cache_dir = tmp_path / "ttl_cache"
+        ttl_file = tmp_path / "ttl.txt"
+        ttl_file.write_text("0.0\nbad\n1.0\n")
+
+        assert load_ttl_array(ttl_file, cache_dir=cache_dir).tolist() == [0.0, 1.0]
+        with pytest.raises(SyncError, match="Failed to parse TTL file"):
+            TTLProvider(ttl_id="ttl_camera", ttl_files=[str(ttl_file)], cache_dir=cache_dir)
+
+
+class TestNeuropixelsProvider:
+    """Test Neuropixels sync-channel timebase."""
+
+    def test_Should_DetectEdgesAcrossChunks_When_ChunkBoundarySplitsPulse(self):
+        """Edges on chunk boundaries should be found exactly once."""
+        sync = np.zeros((20, 1), dtype=np.int16)
+        sync[[4, 5, 6, 10, 15, 16], 0] = 1 << 6
+
+        for chunk_samples in (1, 3, 5, 100):
+            assert detect_rising_edges(sync, chunk_samples=chunk_samples).tolist() == [4, 10, 15]
+
+    def test_Should_ExtractSyncEdges_When_ReadingSyntheticSpikeGLX(self, tmp_path):
+        """Edges from a memory-mapped .bin should match the generated sync signal."""
+        from synthetic.neuropixels_synth import NeuropixelsSynthOptions, write_spikeglx_stream
+
+        opts = NeuropixelsSynthOptions(n_channels=5, sample_rate_hz=2000.0, duration_s=5.0, sync_rate_hz=2.0, chunk_samples=777)
+        result = write_spikeglx_stream(tmp_path / "run_g0_t0.imec0.ap.bin", options=opts)
+
+        edges = extract_sync_edges(result.bin_path)
+
+        assert edges.size == 10
+        np.testing.assert_allclose(edges, result.edge_times)
+        np.testing.assert_allclose(edges[:2], [0.25, 0.75])
+
+    def test_Should_ReturnSyncEdges_When_ProviderHasRecording(self, tmp_path):
+        """Provider should expose offset sync edges as a read-only array."""
+        from synthetic.neuropixels_synth import write_spikeglx_stream
+
+        result = write_spikeglx_stream(tmp_path / "run_g0_t0.imec0.ap.bin", n_channels=3, sample_rate_hz=1000.0, duration_s=3.0)
+        provider = NeuropixelsProvider(stream="imec0.ap", offset_s=1.0, bin_path=result.bin_path)
+
+        timestamps = provider.get_timestamps()
+
+        np.testing.assert_allclose(timestamps, result.edge_times + 1.0)
+        assert not timestamps.flags.writeable
+
+    def test_Should_RaiseError_When_MetaMissing(self, tmp_path):
+        """A .bin without .meta (and no explicit layout) cannot be read."""
+        bin_path = tmp_path / "run.imec0.ap.bin"
+        bin_path.write_bytes(b"\x00" * 16)
+
+        with pytest.raises(SyncError, match="meta file not found"):
+            NeuropixelsProvider(stream="imec0.ap", bin_path=bin_path).get_timestamps()
+
+
 class TestMappingStrategies:
     """Test nearest and linear mapping strategies."""
 
@@ -203,6 +452,17 @@ class TestMappingStrategies:
         assert indices[0] == 0  # 0.3 closer to 0.0
         assert indices[2] == 3  # 2.8 closer to 3.0
 
+    def test_Should_MatchBruteForceNearest_When_UsingVectorizedMapping(self):
+        """Vectorized nearest mapping should agree with a per-sample argmin."""
+        reference_times = np.array([0.0, 0.5, 0.5, 1.0, 2.5, 4.0])
+        sample_times = np.array([-1.0, 0.25, 0.5, 0.74, 0.75, 1.75, 3.9, 5.0])
+
+        indices = map_nearest_array(sample_times, reference_times)
+
+        expected = [int(np.argmin(np.abs(reference_times - t))) for t in sample_times]
+        assert indices.dtype == np.int64
+        assert indices.tolist() == expected
+
     def test_Should_MapUsingLinear_When_StrategyIsLinear(self):
         """FR-TB-6: Linear interpolation mapping."""
         reference_times = create_reference_times(n_samples=5, interval=1.0)
@@ -215,6 +475,26 @@ class TestMappingStrategies:
         assert indices[0] == (0, 1)
         assert weights[0] == pytest.approx((0.5, 0.5))
 
+    def test_Should_ReturnArrayPairs_When_UsingLinearArrayMapping(self):
+        """Array linear mapping should clamp at both ends and weight interior samples."""
+        reference_times = np.array([0.0, 1.0, 1.0, 3.0])
+        sample_times = np.array([-0.5, 0.25, 1.0, 2.5, 4.0])
+
+        indices, weights = map_linear_array(sample_times, reference_times)
+
+        assert indices.shape == (5, 2)
+        assert weights.shape == (5, 2)
+        assert indices.tolist() == [[0, 0], [0, 1], [0, 1], [2, 3], [3, 3]]
+        np.testing.assert_allclose(weights, [[1.0, 0.0], [0.75, 0.25], [0.0, 1.0], [0.25, 0.75], [1.0, 0.0]])
+
+    def test_Should_InterpolateTimestamps_When_UsingLinearMapping(self):
+        """Interpolated output should clamp outside the reference range."""
+        reference_times = create_reference_times(n_samples=3, interval=1.0)
+
+        aligned = interpolate_linear([-1.0, 0.5, 1.25, 5.0], reference_times)
+
+        np.testing.assert_allclose(aligned, [0.0, 0.5, 1.25, 2.0])
+
     def test_Should_ProduceLowerJitter_When_UsingLinearVsNearest(self):
         """A20: Linear mapping should produce lower jitter than nearest."""
         reference_times = create_reference_times(n_samples=5, interval=0.5, start=0.0)
@@ -232,6 +512,93 @@ class TestMappingStrategies:
         assert jitter_linear["p95_jitter_s"] <= jitter_nearest["p95_jitter_s"]
 
 
+class TestBatchAlignment:
+    """Test batch alignment of several modalities against one reference."""
+
+    @pytest.mark.parametrize("mapping", ["nearest", "linear"])
+    @pytest.mark.parametrize("max_workers", [1, 3])
+    def test_Should_MatchAlignSamples_When_AligningModalitiesTogether(self, mapping, max_workers):
+        """Batch results should equal individual align_samples() calls."""
+        rng = np.random.default_rng(0)
+        reference = np.arange(1000) / 30.0
+        modalities = {"video": np.sort(rng.uniform(0, 30, 500)), "pose": np.sort(rng.uniform(0, 30, 200)), "facemap": np.empty(0)}
+        config = create_timebase_config(mapping=mapping)
+
+        batch = align_modalities(modalities, reference, config, max_workers=max_workers)
+
+        for name, samples in modalities.items():
+            expected = align_samples(samples, reference, config)
+            np.testing.assert_array_equal(batch["modalities"][name]["indices"], expected["indices"])
+            np.testing.assert_array_equal(batch["modalities"][name]["aligned_times"], expected["aligned_times"])
+            assert batch["modalities"][name]["jitter_stats"] == expected["jitter_stats"]
+
+        all_samples = np.concatenate(list(modalities.values()))
+        assert batch["jitter_stats"] == align_samples(all_samples, reference, config)["jitter_stats"]
+
+    def test_Should_RaiseError_When_ModalityExceedsBudget(self):
+        """Budget enforcement should apply to each modality."""
+        config = create_timebase_config(jitter_budget_s=LOOSE_JITTER_BUDGET)
+
+        with pytest.raises(JitterBudgetExceeded):
+            align_modalities({"video": [0.0, 1.0], "pose": [0.5]}, [0.0, 1.0], config, enforce_budget=True)
+
+
+class TestStreamingAlignment:
+    """Test chunked alignment with bounded memory."""
+
+    @pytest.mark.parametrize("mapping", ["nearest", "linear"])
+    def test_Should_MatchAlignSamples_When_StreamingMemmappedChunks(self, mapping, tmp_path):
+        """Chunked results over a memory-mapped reference should equal one-shot alignment."""
+        rng = np.random.default_rng(0)
+        reference = np.cumsum(rng.uniform(0.02, 0.04, 5000))
+        samples = np.sort(rng.uniform(-0.5, reference[-1] + 0.5, 3000))
+        np.save(tmp_path / "reference.npy", reference)
+        config = create_timebase_config(mapping=mapping)
+
+        stats = StreamingJitterStats()
+        reference_mmap = np.load(tmp_path / "reference.npy", mmap_mode="r")
+        chunks = list(align_samples_chunked(iter_chunks(samples, chunk_size=256), reference_mmap, config, jitter_stats=stats))
+        expected = align_samples(samples, reference, config)
+
+        assert [chunk["start"] for chunk in chunks] == list(range(0, 3000, 256))
+        np.testing.assert_array_equal(np.concatenate([chunk["indices"] for chunk in chunks]), expected["indices"])
+        np.testing.assert_array_equal(np.concatenate([chunk["aligned_times"] for chunk in chunks]), expected["aligned_times"])
+        assert stats.count == 3000
+        assert chunks[-1]["jitter_stats"]["max_jitter_s"] == pytest.approx(expected["jitter_stats"]["max_jitter_s"])
+
+    def test_Should_MapInClosedForm_When_ReferenceIsUniform(self):
+        """Uniform references should stream without materializing timestamps."""
+        reference = UniformTimebase(rate=30.0, n_samples=10**7)
+        samples = np.arange(0.0, 10.0, 0.1)
+
+        chunks = list(align_samples_chunked(iter_chunks(samples, chunk_size=32), reference, create_timebase_config()))
+
+        np.testing.assert_array_equal(np.concatenate([chunk["indices"] for chunk in chunks]), np.rint(samples * 30.0).astype(np.int64))
+
+    def test_Should_RaiseError_When_ChunksNotSorted(self):
+        """Streaming relies on monotonic samples to advance the reference cursor."""
+        chunks = align_samples_chunked([[1.0, 2.0], [1.5]], [0.0, 1.0, 2.0], create_timebase_config())
+
+        with pytest.raises(SyncError, match="non-decreasing"):
+            list(chunks)
+
+    def test_Should_ValidateOnlyUsedWindows_When_ReferenceIsMemmapped(self, tmp_path):
+        """A memmapped reference should be checked where chunks land, not scanned up front."""
+        reference = np.concatenate([np.arange(0.0, 100.0, 0.5), [50.0, 40.0]])
+        np.save(tmp_path / "reference.npy", reference)
+        reference_mmap = np.load(tmp_path / "reference.npy", mmap_mode="r")
+        config = create_timebase_config()
+
+        samples = np.arange(0.0, 10.0, 0.25)
+        chunks = list(align_samples_chunked(iter_chunks(samples, chunk_size=8), reference_mmap, config))
+        expected = align_samples(samples, reference[:200], config)
+
+        np.testing.assert_array_equal(np.concatenate([chunk["indices"] for chunk in chunks]), expected["indices"])
+
+        with pytest.raises(SyncError, match="monotonic"):
+            list(align_samples_chunked(iter_chunks(np.array([99.0, 99.6]), chunk_size=8), reference_mmap, config))
+
+
 class TestJitterComputation:
     """Test jitter statistics computation."""
 
@@ -268,6 +635,126 @@ class TestJitterComputation:
         assert stats["max_jitter_s"] == pytest.approx(0.0)
         assert stats["p95_jitter_s"] == pytest.approx(0.0)
 
+    def test_Should_ReportRicherStats_When_ComputingJitter(self):
+        """Jitter stats should include median, p99 and histogram bins."""
+        reference_times = create_reference_times(n_samples=STANDARD_SAMPLE_COUNT, interval=1.0)
+        sample_times = [t + 0.005 for t in reference_times]
+        indices = list(range(STANDARD_SAMPLE_COUNT))
+
+        stats = compute_jitter_stats(sample_times, reference_times, indices)
+
+        assert stats["median_jitter_s"] == pytest.approx(0.005, rel=1e-6)
+        assert stats["p99_jitter_s"] == pytest.approx(0.005, rel=1e-6)
+        assert sum(stats["jitter_histogram_counts"]) == STANDARD_SAMPLE_COUNT
+        assert len(stats["jitter_histogram_edges_s"]) == len(stats["jitter_histogram_counts"]) + 1
+
+    def test_Should_ApproximateExactStats_When_StreamingChunks(self):
+        """Streaming estimator should match exact quantiles within ~1%."""
+        rng = np.random.default_rng(0)
+        reference_times = np.arange(20000) / STANDARD_FRAMERATE
+        sample_times = reference_times + rng.normal(0.0, 0.002, reference_times.size)
+        indices = map_nearest_array(sample_times, reference_times)
+
+        streaming = StreamingJitterStats()
+        for chunk in np.array_split(np.arange(sample_times.size), 7):
+            streaming.update(sample_times[chunk], reference_times, indices[chunk])
+
+        exact = compute_jitter_stats(sample_times, reference_times, indices)
+        approx = streaming.summary()
+
+        assert approx["max_jitter_s"] == exact["max_jitter_s"]
+        assert approx["p95_jitter_s"] == pytest.approx(exact["p95_jitter_s"], rel=0.02)
+        assert approx["median_jitter_s"] == pytest.approx(exact["median_jitter_s"], rel=0.02)
+        assert approx["jitter_histogram_counts"] == exact["jitter_histogram_counts"]
+
+
+class TestClockDrift:
+    """Test clock drift model fitting between two timelines."""
+
+    def test_Should_RecoverLinearDrift_When_OutliersPresent(self):
+        """Robust fit should recover offset and ppm drift despite mismatched pairs."""
+        rng = np.random.default_rng(0)
+        source = np.sort(rng.uniform(0.0, 3600.0, 500))
+        reference = 4.0 + (1.0 + 20e-6) * source + rng.normal(0.0, 1e-4, source.size)
+        reference[[10, 200, 400]] += 0.5  # mismatched pulses
+
+        model = fit_clock_drift(source, reference)
+
+        assert model.intercept_s == pytest.approx(4.0, abs=1e-3)
+        assert model.drift_ppm == pytest.approx(20.0, abs=0.5)
+        assert model.n_outliers == 3
+        assert model.residual_max_s < 1e-3
+
+    def test_Should_FitPiecewiseDrift_When_RateChanges(self):
+        """Multi-segment fit should follow a change of clock rate."""
+        source = np.linspace(0.0, 1000.0, 201)
+        reference = np.where(source < 500.0, 1.0001 * source, 1.0001 * 500.0 + 0.9999 * (source - 500.0))
+
+        single = fit_clock_drift(source, reference, robust=False)
+        piecewise = fit_clock_drift(source, reference, n_segments=2, robust=False)
+
+        assert piecewise.knots_s == [500.0]
+        assert piecewise.residual_max_s < 1e-9
+        assert single.residual_max_s > 1e-3
+        np.testing.assert_allclose(piecewise.map([250.0, 750.0]), [250.025, 750.025], atol=1e-9)
+
+    def test_Should_RaiseError_When_TooFewPoints(self):
+        """Fitting needs more matched points than segments."""
+        with pytest.raises(SyncError, match="segment"):
+            fit_clock_drift([1.0, 2.0], [1.0, 2.0], n_segments=2)
+
+    def test_Should_ReportDriftInStats_When_ModelFitted(self):
+        """Drift residuals should flow into AlignmentStats."""
+        model = ClockDriftModel(intercept_s=0.0, slope=1.00001, n_points=10, residual_rms_s=1e-4, residual_max_s=3e-4)
+
+        stats = create_alignment_stats("ttl", "nearest", 0.0, 0.001, 0.001, 10, **model.to_stats())
+
+        assert stats.drift_ppm == pytest.approx(10.0)
+        assert stats.drift_residual_rms_s == pytest.approx(1e-4)
+        assert stats.drift_residual_max_s == pytest.approx(3e-4)
+
+
+class TestPulseTrainMatching:
+    """Test pattern matching of expected event times to a TTL pulse train."""
+
+    def test_Should_ReportDroppedAndExtraPulses_When_PulseTrainCorrupted(self):
+        """Dropped and spurious pulses should only affect their own events."""
+        rng = np.random.default_rng(1)
+        expected = np.cumsum(rng.uniform(3.0, 8.0, 20000))
+        pulses = 4.0 + (1.0 + 50e-6) * expected + rng.normal(0.0, 2e-4, expected.size)
+        dropped = np.array([0, 500, 12000])
+        corrupted = np.sort(np.concatenate([np.delete(pulses, dropped), [2.0, 1000.3, 50000.1]]))
+
+        match = match_pulse_train(expected, corrupted)
+
+        matched = match.pulse_indices >= 0
+        np.testing.assert_array_equal(np.flatnonzero(~matched), dropped)
+        np.testing.assert_array_equal(corrupted[match.pulse_indices[matched]], pulses[matched])
+        assert corrupted[match.extra_pulses].tolist() == [2.0, 1000.3, 50000.1]
+        assert match.clock_model.drift_ppm == pytest.approx(50.0, abs=0.1)
+
+    def test_Should_ReportAllPulsesExtra_When_NoExpectedEvents(self):
+        """Without expected events every pulse is extra."""
+        match = match_pulse_train([], [1.0, 2.0])
+
+        assert match.pulse_indices.size == 0
+        assert match.extra_pulses.tolist() == [0, 1]
+
+    def test_Should_MatchSinglePulse_When_NoToleranceGiven(self):
+        """A one-pulse channel should derive the tolerance from the events instead of failing."""
+        match = match_pulse_train([0.0, 10.0, 20.0], [15.0])
+
+        assert match.tolerance_s == pytest.approx(2.5)
+        assert np.count_nonzero(match.pulse_indices >= 0) == 1
+        assert match.extra_pulses.size == 0
+
+        single = match_pulse_train([0.0], [5.0])
+        assert single.pulse_indices.tolist() == [-1]
+        assert single.extra_pulses.tolist() == [0]
+
+        with pytest.raises(SyncError, match="tolerance must be positive"):
+            match_pulse_train([0.0, 1.0], [2.0, 2.0])
+
 
 class TestJitterBudgetEnforcement:
     """Test jitter budget enforcement before NWB assembly."""
@@ -302,6 +789,30 @@ class TestJitterBudgetEnforcement:
         assert "0.015" in error_msg or "15" in error_msg
         assert "0.010" in error_msg or "10" in error_msg
 
+    @pytest.mark.parametrize("mapping", ["nearest", "linear"])
+    def test_Should_MatchFullAlignment_When_FailFastWithinBudget(self, mapping):
+        """Fail-fast chunked alignment should equal one-shot alignment when within budget."""
+        config = create_timebase_config(mapping=mapping, jitter_budget_s=0.1)
+        reference = np.arange(0.0, 100.0, 0.1)
+        samples = np.sort(np.random.default_rng(0).uniform(0.0, 99.9, 1000))
+
+        expected = align_samples(samples, reference, config)
+        result = align_samples(samples, reference, config, fail_fast=True, chunk_size=64)
+
+        np.testing.assert_array_equal(result["indices"], expected["indices"])
+        np.testing.assert_array_equal(result["aligned_times"], expected["aligned_times"])
+        assert result["jitter_stats"] == expected["jitter_stats"]
+
+    def test_Should_ReportSampleRange_When_FailFastChunkExceedsBudget(self):
+        """Fail-fast should abort at the first offending chunk and name its sample range."""
+        config = create_timebase_config(jitter_budget_s=0.01)
+        reference = np.arange(0.0, 100.0, 0.1)
+        samples = reference.copy()
+        samples[250] += 0.04
+
+        with pytest.raises(JitterBudgetExceeded, match=r"samples 200-299 .*first at sample 250"):
+            align_samples(samples, reference, config, fail_fast=True, chunk_size=100)
+
 
 class TestAlignmentProcess:
     """Test complete alignment workflow."""
@@ -328,6 +839,17 @@ class TestAlignmentProcess:
 
         assert result["mapping"] == "linear"
 
+    def test_Should_ReturnAlignedVideoTimes_When_UsingLinearMapping(self):
+        """Video sync should return interpolated frame times for linear mapping."""
+        config = create_timebase_config(mapping="linear")
+        reference_times = create_reference_times(n_samples=3, interval=1.0)
+        frame_times = [0.5, 1.5, 2.5]
+
+        result = sync_video_frames_to_timebase(list(range(3)), frame_times, reference_times, config)
+
+        np.testing.assert_allclose(result["frame_times_aligned"], [0.5, 1.5, 2.0])
+        assert result["indices"].shape == (3, 2)
+
     def test_Should_EnforceBudget_When_AlignmentComplete(self):
         """Alignment should enforce jitter budget automatically."""
         config = create_timebase_config(mapping="nearest", jitter_budget_s=LOOSE_JITTER_BUDGET)
@@ -367,6 +889,16 @@ class TestAlignmentStatsSidecar:
         assert stats.p95_jitter_s == p95_jitter
         assert stats.aligned_samples == aligned_samples
 
+    def test_Should_IncludeRicherJitterStats_When_CreatedFromJitterDict(self):
+        """Alignment stats should accept the full compute_jitter_stats output."""
+        reference_times = create_reference_times(n_samples=4, interval=1.0)
+        jitter_stats = compute_jitter_stats([0.1, 1.0, 2.0, 3.2], reference_times, [0, 1, 2, 3])
+
+        stats = create_alignment_stats(timebase_source="ttl", mapping="nearest", offset_s=0.0, aligned_samples=4, **jitter_stats)
+
+        assert stats.p99_jitter_s == pytest.approx(jitter_stats["p99_jitter_s"])
+        assert stats.jitter_histogram_counts == jitter_stats["jitter_histogram_counts"]
+
     def test_Should_PersistToJSON_When_WritingAlignmentStats(self, tmp_path: Path):
         """Write alignment stats to JSON sidecar."""
         stats = AlignmentStats(
@@ -408,6 +940,282 @@ class TestAlignmentStatsSidecar:
         datetime.fromisoformat(data["generated_at"])
 
 
+class TestFrameDropDetection:
+    """Test dropped/duplicate frame detection on camera TTL pulse trains."""
+
+    def test_Should_LocateDropsAndDuplicates_When_PulseTrainIrregular(self):
+        """Gaps and duplicate pulses should be located and mapped to frame slots."""
+        period = 1.0 / 30.0
+        pulses = np.arange(1000) * period
+        pulses = np.delete(pulses, [100, 500, 501])  # 1 + 2 dropped frames
+        pulses = np.sort(np.append(pulses, pulses[700] + 0.001))  # duplicate pulse
+
+        report = detect_frame_drops(pulses, nominal_period_s=period)
+
+        assert report.n_dropped == 3
+        assert report.gap_after.tolist() == [99, 498]
+        assert report.gap_sizes.tolist() == [1, 2]
+        assert report.duplicates.tolist() == [701]
+        assert report.n_slots == 1000
+        np.testing.assert_allclose(report.slot_times(pulses), np.arange(1000) * period, atol=1e-9)
+
+    def test_Should_KeepFramePulse_When_SpuriousPulseAtHalfPeriod(self):
+        """A pulse halfway between frames should be the only duplicate; later slots stay aligned."""
+        report = detect_frame_drops([0.0, 1.0, 1.5, 2.0, 3.0, 4.0, 5.0], nominal_period_s=1.0)
+
+        assert report.duplicates.tolist() == [2]
+        assert report.frame_to_pulse.tolist() == [0, 1, 3, 4, 5, 6]
+        assert report.frame_slots.tolist() == [0, 1, 2, 3, 4, 5]
+        assert report.n_dropped == 0
+
+    def test_Should_UseMedianPeriod_When_NominalPeriodOmitted(self):
+        """Default period should be the median interval; regular trains are clean."""
+        report = detect_frame_drops(np.arange(100) * 0.04)
+
+        assert report.period_s == pytest.approx(0.04)
+        assert report.n_dropped == 0
+        assert report.n_duplicates == 0
+        assert report.irregular.size == 0
+
+    def test_Should_SkipDuplicatePulses_When_ComputingAlignment(self, ttl_config: Config, tmp_path):
+        """Camera alignment should drop duplicate pulses and report counts."""
+        ttl_file = tmp_path / "cam0.txt"
+        pulses = np.append(np.arange(10) * 0.1, 0.501)
+        ttl_file.write_text("\n".join(f"{t:.6f}" for t in np.sort(pulses)) + "\n")
+        manifest = Manifest(
+            session_id="test-session",
+            cameras=[ManifestCamera(camera_id="cam0", ttl_id="ttl_camera", video_files=[], frame_count=10)],
+            ttls=[ManifestTTL(ttl_id="ttl_camera", files=[str(ttl_file)])],
+        )
+
+        alignment = compute_alignment(manifest, ttl_config)
+
+        assert alignment["cam0"]["duplicate_frames"] == 1
+        assert alignment["cam0"]["dropped_frames"] == 0
+        np.testing.assert_allclose(alignment["cam0"]["timestamps"], np.arange(10) * 0.1)
+
+
+class TestAlignmentArtifacts:
+    """Test per-camera alignment computation and binary persistence."""
+
+    def test_Should_SummarizeDropsAndJitter_When_CamerasAligned(self, ttl_config: Config, tmp_path):
+        """Session stats should sum frames and drop counts and report the worst camera's jitter."""
+        ttl_file = tmp_path / "cam0.txt"
+        ttl_file.write_text("\n".join(f"{t:.6f}" for t in [0.0, 0.1, 0.15, 0.2, 0.4, 0.5]) + "\n")
+        manifest = Manifest(
+            session_id="test-session",
+            cameras=[ManifestCamera(camera_id="cam0", ttl_id="ttl_camera", video_files=[], frame_count=5)],
+            ttls=[ManifestTTL(ttl_id="ttl_camera", files=[str(ttl_file)])],
+        )
+
+        stats = summarize_alignment(compute_alignment(manifest, ttl_config), ttl_config)
+
+        assert stats.aligned_samples == 5
+        assert stats.dropped_frames == 1
+        assert stats.duplicate_frames == 1
+        assert sum(stats.jitter_histogram_counts) == 5
+
+    def test_Should_AlignCameraTTL_When_ManifestHasCameraChannel(self, ttl_config: Config, ttl_manifest):
+        """Camera frames should align to their TTL pulses (frames beyond the pulses are dropped)."""
+        alignment = compute_alignment(ttl_manifest, ttl_config)
+
+        cam0 = alignment["cam0"]
+        assert cam0["frame_source"] == "ttl"
+        assert cam0["frame_count"] == 1000
+        np.testing.assert_allclose(cam0["timestamps"], np.arange(100) * 0.033)
+        assert cam0["jitter_stats"]["max_jitter_s"] == pytest.approx(0.0)
+
+    def test_Should_MemoryMapTimestamps_When_LoadingPersistedAlignment(self, valid_config: Config, tmp_path):
+        """Persisted timestamps should be .npy arrays loaded as read-only memory maps."""
+        manifest = Manifest(
+            session_id="test-session",
+            cameras=[
+                ManifestCamera(camera_id="cam0", ttl_id="ttl_cam0", video_files=[], frame_count=300),
+                ManifestCamera(camera_id="cam1", ttl_id="ttl_cam1", video_files=[], frame_count=150),
+            ],
+        )
+
+        alignment = compute_alignment(manifest, valid_config, output_dir=tmp_path / "alignment")
+        loaded = load_alignment_manifest(tmp_path / "alignment" / "alignment.json")
+
+        assert (tmp_path / "alignment" / "alignment_cam0.npy").exists()
+        assert isinstance(loaded["cam0"]["timestamps"], np.memmap)
+        assert not loaded["cam0"]["timestamps"].flags.writeable
+        np.testing.assert_array_equal(loaded["cam1"]["timestamps"], alignment["cam1"]["timestamps"])
+        assert loaded["cam1"]["frame_source"] == "nominal_rate"
+        assert loaded["cam1"]["n_samples"] == 150
+
+    def test_Should_RaiseError_When_FramesNotCounted(self, valid_config: Config):
+        """Alignment needs frame counts for every camera."""
+        manifest = Manifest(session_id="test-session", cameras=[ManifestCamera(camera_id="cam0", ttl_id="ttl_cam0", video_files=[])])
+
+        with pytest.raises(SyncError, match="frame_count"):
+            compute_alignment(manifest, valid_config)
+
+    def test_Should_RaiseError_When_AlignmentManifestMissing(self, tmp_path):
+        """Loading a missing alignment index should fail loudly."""
+        with pytest.raises(SyncError, match="not found"):
+            load_alignment_manifest(tmp_path / "alignment.json")
+
+
+class TestAlignmentCache:
+    """Test on-disk alignment cache keyed by input fingerprints."""
+
+    def test_Should_ReuseResult_When_InputsUnchanged(self, tmp_path, monkeypatch):
+        """A second alignment of identical inputs should load from disk, not recompute."""
+        from w2t_bkin.sync import cache as cache_module
+
+        cache = AlignmentCache(tmp_path / "cache")
+        config = create_timebase_config(mapping="linear")
+        reference = create_reference_times(n_samples=100, interval=0.1)
+        samples = np.linspace(0.05, 9.5, 50)
+
+        keys = {"sample_key": fingerprint_inputs("pose", 1), "reference_key": fingerprint_inputs("ttl", 1)}
+
+        first = cache.align_samples(samples, reference, config, **keys)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("alignment recomputed")
+
+        monkeypatch.setattr(cache_module, "align_samples", fail)
+        second = cache.align_samples(samples, reference, config, **keys)
+
+        for key in ("indices", "aligned_times", "weights"):
+            np.testing.assert_array_equal(second[key], first[key])
+        assert second["jitter_stats"] == first["jitter_stats"]
+        assert second["mapping"] == "linear"
+
+    def test_Should_NotHashArrays_When_AligningWithSourceKeys(self, tmp_path, monkeypatch):
+        """Alignment entries should be keyed by source fingerprints only; no keys means no caching."""
+        from w2t_bkin.sync import cache as cache_module
+
+        cache = AlignmentCache(tmp_path / "cache")
+        config = create_timebase_config(mapping="nearest")
+        reference = create_reference_times(n_samples=100, interval=0.1)
+        hashed = []
+        update = cache_module._update_fingerprint
+
+        def tracking_update(digest, value):
+            hashed.append(type(value))
+            update(digest, value)
+
+        monkeypatch.setattr(cache_module, "_update_fingerprint", tracking_update)
+        cache.align_samples([0.5, 1.0], reference, config)
+        assert cache.size_bytes() == 0
+
+        cache.align_samples([0.5, 1.0], reference, config, sample_key="pose", reference_key="ttl")
+        assert len(list(cache.cache_dir.glob("*.npz"))) == 1
+        assert np.ndarray not in hashed
+
+    def test_Should_ChangeFingerprint_When_ConfigOrFileChanges(self, tmp_path):
+        """Fingerprints should depend on array content, config values and source file state."""
+        source = tmp_path / "ttl.txt"
+        source.write_text("0.0\n1.0\n")
+        base = fingerprint_inputs(np.arange(3.0), {"mapping": "nearest"}, [source])
+
+        assert fingerprint_inputs(np.arange(3.0), {"mapping": "nearest"}, [source]) == base
+        assert fingerprint_inputs(np.arange(3.0), {"mapping": "linear"}, [source]) != base
+        assert fingerprint_inputs(np.arange(4.0), {"mapping": "nearest"}, [source]) != base
+
+        source.write_text("0.0\n1.0\n2.0\n")
+        assert fingerprint_inputs(np.arange(3.0), {"mapping": "nearest"}, [source]) != base
+
+    def test_Should_EvictLeastRecentlyUsed_When_OverSizeLimit(self, tmp_path):
+        """Entries beyond max_bytes should be evicted oldest-access first."""
+        cache = AlignmentCache(tmp_path / "cache", max_bytes=1 << 20)
+        for i, key in enumerate(["a", "b", "c"]):
+            cache.store(key, {"values": np.zeros(10_000)})
+            os.utime(cache.cache_dir / f"{key}.npz", ns=(i * 10**9, i * 10**9))
+
+        assert cache.load("a") is not None  # refreshes "a"
+        cache.max_bytes = 2 * (cache.cache_dir / "a.npz").stat().st_size
+        cache.store("d", {"values": np.zeros(10_000)})
+
+        assert sorted(path.stem for path in cache.cache_dir.glob("*.npz")) == ["a", "d"]
+
+    def test_Should_ChangeTimebaseKey_When_NeuropixelsMetaChanges(self, tmp_path):
+        """The .meta (sample rate, channel count) should be part of the Neuropixels key; empty streams are rejected."""
+        from types import SimpleNamespace
+
+        session_dir = tmp_path / "raw" / "test-session"
+        session_dir.mkdir(parents=True)
+        (session_dir / "run_g0_t0.imec0.ap.bin").write_bytes(b"\x00" * 16)
+        meta = session_dir / "run_g0_t0.imec0.ap.meta"
+        meta.write_text("imSampRate=30000\nnSavedChans=385\n")
+        timebase = SimpleNamespace(source="neuropixels", neuropixels_stream="imec0.ap", mapping="nearest", offset_s=0.0)
+        config = SimpleNamespace(timebase=timebase, paths=SimpleNamespace(raw_root=str(tmp_path / "raw")))
+        manifest = Manifest(session_id="test-session", cameras=[])
+        cache = AlignmentCache(tmp_path / "cache")
+
+        key = cache.timebase_key(config, manifest)
+        meta.write_text("imSampRate=30000.5\nnSavedChans=385\n")
+        assert cache.timebase_key(config, manifest) != key
+
+        timebase.neuropixels_stream = ""
+        with pytest.raises(SyncError, match="neuropixels_stream required"):
+            cache.timebase_key(config, manifest)
+
+    def test_Should_ReloadTimebase_When_TTLFileChanges(self, ttl_config: Config, ttl_manifest, tmp_path):
+        """Cached alignment should match uncached results and follow TTL file changes."""
+        cache = AlignmentCache(tmp_path / "cache")
+
+        cached = compute_alignment(ttl_manifest, ttl_config, cache=cache)
+        np.testing.assert_array_equal(cached["cam0"]["timestamps"], compute_alignment(ttl_manifest, ttl_config)["cam0"]["timestamps"])
+
+        Path(ttl_manifest.ttls[0].files[0]).write_text("".join(f"{i * 0.05:.6f}\n" for i in range(100)))
+        reloaded = compute_alignment(ttl_manifest, ttl_config, cache=cache)
+
+        np.testing.assert_allclose(reloaded["cam0"]["timestamps"], np.arange(100) * 0.05)
+
+
+class TestReferenceTimebase:
+    """Test validated reference timebase wrapper."""
+
+    def test_Should_MarkVerified_When_ReferenceIsMonotonic(self):
+        """Validation should set the verified flag once."""
+        reference = ReferenceTimebase(create_reference_times(n_samples=5))
+
+        assert not reference.verified
+        assert reference.validate().verified
+        assert reference.times.dtype == np.float64
+        assert not reference.times.flags.writeable
+
+    def test_Should_RaiseError_When_ReferenceNotMonotonic(self):
+        """Validation should reject non-monotonic references."""
+        with pytest.raises(SyncError, match="monotonic"):
+            ReferenceTimebase([0.0, 2.0, 1.0]).validate()
+
+    def test_Should_SkipValidation_When_ReferenceAlreadyVerified(self):
+        """Verified references should not be re-checked on each alignment."""
+        config = create_timebase_config(mapping="nearest")
+        # Deliberately unsorted but flagged as verified: no check is performed
+        reference = ReferenceTimebase([0.0, 2.0, 1.0], verified=True)
+
+        result = align_samples([0.1], reference, config)
+
+        assert result["indices"].tolist() == [0]
+
+    def test_Should_MatchArrayReference_When_UsingUniformTimebase(self):
+        """Closed-form mapping on a uniform timebase should match the array path."""
+        rng = np.random.default_rng(1)
+        uniform = UniformTimebase(rate=STANDARD_FRAMERATE, n_samples=STANDARD_SAMPLE_COUNT, offset_s=0.5)
+        reference = ReferenceTimebase(uniform.times.copy())
+        sample_times = rng.uniform(0.4, 0.5 + STANDARD_SAMPLE_COUNT / STANDARD_FRAMERATE, 500)
+
+        np.testing.assert_array_equal(map_nearest_array(sample_times, uniform), map_nearest_array(sample_times, reference))
+        np.testing.assert_allclose(interpolate_linear(sample_times, uniform), interpolate_linear(sample_times, reference))
+
+    def test_Should_NotMaterialize_When_AligningToUniformTimebase(self):
+        """Aligning to a uniform timebase should not build the timestamp array."""
+        config = create_timebase_config(mapping="nearest")
+        uniform = UniformTimebase(rate=30000.0, n_samples=10**9)
+
+        result = align_samples([0.5, 1.0], uniform, config)
+
+        assert result["indices"].tolist() == [15000, 30000]
+        assert uniform._times is None
+
+
 class TestEdgeCases:
     """Test edge cases and error conditions."""
 
@@ -446,6 +1254,18 @@ class TestEdgeCases:
 
         assert len(indices) == 1
 
+    def test_Should_SummarizeLargeGaps_When_ManySamplesAreFar(self):
+        """Large gaps should be reported in a single summary warning."""
+        reference_times = [0.0, 1.0, 10.0, 11.0]
+        sample_times = [3.0, 4.0, 5.0, 6.0, 7.0]
+
+        with pytest.warns(UserWarning) as record:
+            map_nearest(sample_times, reference_times)
+
+        gap_warnings = [w for w in record if "large gap" in str(w.message)]
+        assert len(gap_warnings) == 1
+        assert "5 of 5" in str(gap_warnings[0].message)
+
 
 # =============================================================================
 # Note: Fixtures for test_sync.py are now in tests/conftest.py